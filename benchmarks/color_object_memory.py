@@ -0,0 +1,45 @@
+"""
+Measures the memory used by color objects. Builds --count LabColor, XYZColor
+and RGBColor objects and reports the bytes allocated per object::
+
+    python color_object_memory.py --count 1000000
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+# Does some sys.path manipulation so we can run benchmarks in-place.
+# noinspection PyUnresolvedReferences
+import benchmark_config
+
+from colormath.color_objects import LabColor, XYZColor, RGBColor
+
+
+def measure(color_cs, count):
+    """
+    Returns the bytes allocated per object while building `count` objects.
+    The list holding them is not counted.
+    """
+
+    holder = [None] * count
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for i in range(count):
+        holder[i] = color_cs(i * 1e-6, 0.5, 0.25)
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return used / float(count)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=1000000)
+    args = parser.parse_args()
+
+    print('Python %s' % sys.version.split()[0])
+    for color_cs in (LabColor, XYZColor, RGBColor):
+        per_object = measure(color_cs, args.count)
+        print(' %-9s: %6.1f bytes/object, %7.1f MB for %d' % (
+            color_cs.__name__, per_object, per_object * args.count / 1e6,
+            args.count))
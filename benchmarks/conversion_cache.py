@@ -0,0 +1,55 @@
+"""
+Measures convert_color() latency with and without the conversion cache.
+Converts --colors distinct RGB colors to Lab, --repeat times each, and
+reports the mean time per call on the uncached path and on cache hits::
+
+    python conversion_cache.py --colors 1000 --repeat 20
+"""
+
+import argparse
+import random
+import time
+
+# Does some sys.path manipulation so we can run benchmarks in-place.
+# noinspection PyUnresolvedReferences
+import benchmark_config
+
+from colormath.color_conversions import convert_color
+from colormath.color_objects import RGBColor, LabColor
+from colormath.conversion_cache import cached_conversions
+
+
+def time_calls(colors, target_cs, repeat):
+    """
+    Returns the mean seconds per convert_color() call.
+    """
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for color in colors:
+            convert_color(color, target_cs)
+    return (time.perf_counter() - start) / (len(colors) * repeat)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--colors', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rand = random.Random(0)
+    colors = [RGBColor(rand.random(), rand.random(), rand.random())
+              for _ in range(args.colors)]
+
+    uncached = time_calls(colors, LabColor, args.repeat)
+    with cached_conversions(max_entries=args.colors) as cache:
+        # The first pass fills the cache, so only hits are timed after it.
+        time_calls(colors, LabColor, 1)
+        cached = time_calls(colors, LabColor, args.repeat)
+        stats = cache.get_stats()
+
+    print('RGB -> Lab, %d colors x %d' % (args.colors, args.repeat))
+    print(' uncached  : %7.2f us/call' % (uncached * 1e6))
+    print(' cache hit : %7.2f us/call' % (cached * 1e6))
+    print(' hit rate  : %.3f, %d entries, ~%d bytes' % (
+        stats['hit_rate'], stats['entries'], stats['bytes']))
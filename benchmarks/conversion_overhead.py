@@ -0,0 +1,38 @@
+"""
+Measures the fixed per-call cost of single color conversions: one
+conversion function called directly, and the same conversion through
+convert_color(), which adds the path lookup and dispatch::
+
+    python conversion_overhead.py --number 200000
+"""
+
+import argparse
+import timeit
+
+# Does some sys.path manipulation so we can run benchmarks in-place.
+# noinspection PyUnresolvedReferences
+import benchmark_config
+
+from colormath import color_conversions
+from colormath.color_conversions import convert_color
+from colormath.color_objects import XYZColor, LabColor, RGBColor
+
+XYZ = XYZColor(0.1, 0.2, 0.3)
+RGB = RGBColor(0.2, 0.4, 0.6)
+
+CASES = (
+    ('XYZ_to_Lab()', lambda: color_conversions.XYZ_to_Lab(XYZ)),
+    ('convert_color(XYZ, Lab)', lambda: convert_color(XYZ, LabColor)),
+    ('convert_color(RGB, Lab)', lambda: convert_color(RGB, LabColor)),
+)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, func in CASES:
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        print(' %-24s: %6.2f us/call' % (name, best / args.number * 1e6))
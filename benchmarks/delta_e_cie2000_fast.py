@@ -0,0 +1,82 @@
+"""
+Compares the speed of delta_e_cie2000(..., fast=True) against the exact
+kernel, then checks the published error bound on a dense Lab grid.
+
+Every color on the grid is compared against every other color, so a smaller
+--step gives a denser grid and a much longer run::
+
+    python delta_e_cie2000_fast.py --step 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+# Does some sys.path manipulation so we can run benchmarks in-place.
+# noinspection PyUnresolvedReferences
+import benchmark_config
+
+from colormath.color_diff_matrix import delta_e_cie2000, CIE2000_FAST_MAX_ERROR
+
+
+def lab_grid(step):
+    """
+    Builds an (n, 3) matrix of Lab colors covering L in [0, 100] and a, b in
+    [-128, 128].
+    """
+
+    lightness = np.arange(0.0, 100.0 + step / 2.0, step)
+    chroma = np.arange(-128.0, 128.0 + step / 2.0, step)
+    grid = np.meshgrid(lightness, chroma, chroma, indexing='ij')
+    return np.stack(grid, axis=-1).reshape(-1, 3)
+
+
+def time_kernels(size, repeat=5):
+    rng = np.random.RandomState(0)
+    lab_matrix = np.column_stack((
+        rng.uniform(0, 100, size),
+        rng.uniform(-128, 128, size),
+        rng.uniform(-128, 128, size)))
+    lab_color_vector = lab_matrix[0]
+
+    for fast in (False, True):
+        timings = []
+        for _ in range(repeat):
+            start = time.time()
+            delta_e_cie2000(lab_color_vector, lab_matrix, fast=fast)
+            timings.append(time.time() - start)
+        print(' fast=%-5s: %.3fs for %d colors' % (fast, min(timings), size))
+
+
+def check_error_bound(step):
+    grid = lab_grid(step)
+    worst = 0.0
+    worst_pair = None
+    for lab_color_vector in grid:
+        exact = delta_e_cie2000(lab_color_vector, grid)
+        approx = delta_e_cie2000(lab_color_vector, grid, fast=True)
+        errors = np.fabs(exact - approx)
+        i = np.argmax(errors)
+        if errors[i] > worst:
+            worst = errors[i]
+            worst_pair = (lab_color_vector, grid[i])
+
+    print(' %d grid colors, %d pairs' % (len(grid), len(grid) ** 2))
+    print(' max |error|: %.6f (bound: %s)' % (worst, CIE2000_FAST_MAX_ERROR))
+    if worst_pair is not None:
+        print(' worst pair: %s vs %s' % worst_pair)
+    return worst <= CIE2000_FAST_MAX_ERROR
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=200000)
+    parser.add_argument('--step', type=float, default=8.0)
+    args = parser.parse_args()
+
+    print("== Timing ==")
+    time_kernels(args.size)
+    print("== Error bound ==")
+    if not check_error_bound(args.step):
+        raise SystemExit("Error bound exceeded.")
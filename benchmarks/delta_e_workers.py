@@ -0,0 +1,64 @@
+"""
+Measures how delta_e_cie2000(..., workers=N) scales with the number of
+threads. It compares one standard against --size random Lab colors for each
+worker count and reports the speedup over a single thread::
+
+    python delta_e_workers.py --size 10000000 --max-workers 16
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+# Does some sys.path manipulation so we can run benchmarks in-place.
+# noinspection PyUnresolvedReferences
+import benchmark_config
+
+from colormath.color_diff_matrix import delta_e_cie2000
+
+
+def worker_counts(max_workers):
+    """
+    Powers of two up to max_workers, plus max_workers itself.
+    """
+
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def time_workers(size, max_workers, fast, repeat=3):
+    rng = np.random.RandomState(0)
+    lab_matrix = np.column_stack((
+        rng.uniform(0, 100, size),
+        rng.uniform(-128, 128, size),
+        rng.uniform(-128, 128, size)))
+    lab_color_vector = lab_matrix[0]
+
+    baseline = None
+    for workers in worker_counts(max_workers):
+        timings = []
+        for _ in range(repeat):
+            start = time.time()
+            delta_e_cie2000(lab_color_vector, lab_matrix, fast=fast,
+                            workers=workers)
+            timings.append(time.time() - start)
+        best = min(timings)
+        if baseline is None:
+            baseline = best
+        print(' workers=%-3d: %.3fs  (%.2fx)' % (
+            workers, best, baseline / best))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=2000000)
+    parser.add_argument('--max-workers', type=int, default=8)
+    parser.add_argument('--fast', action='store_true')
+    args = parser.parse_args()
+
+    time_workers(args.size, args.max_workers, args.fast)
@@ -0,0 +1,81 @@
+"""
+Measures how long importing colormath takes in a fresh interpreter, and how
+much of that is NumPy and how much colormath's own modules. Each run imports
+--module in a new process with ``python -X importtime`` and the median of
+--runs is reported::
+
+    python import_time.py --module colormath.color_conversions --runs 20
+
+Pass --load-tables to also touch the spectral and density tables, which are
+otherwise only loaded when first used.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Does some sys.path manipulation so we can run benchmarks in-place.
+# noinspection PyUnresolvedReferences
+import benchmark_config
+
+LOAD_TABLES = (
+    "from colormath import spectral_constants, density_standards\n"
+    "spectral_constants.REF_ILLUM_TABLE, density_standards.ISO_VISUAL\n")
+
+
+def import_times(module, load_tables):
+    """
+    Returns the total import microseconds of one run, the microseconds
+    spent in colormath's own modules, and the cumulative microseconds of
+    each imported module keyed by name.
+    """
+
+    code = 'import %s\n' % module
+    if load_tables:
+        code += LOAD_TABLES
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stderr=subprocess.STDOUT, env=env, universal_newlines=True)
+    total = 0
+    own = 0
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+        if name.strip().startswith('colormath'):
+            own += int(self_time)
+        # Nested imports are indented, and already counted by their parent.
+        if not name.startswith('  '):
+            total += int(cumulative)
+    return total, own, times
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--module', default='colormath.color_conversions')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--load-tables', action='store_true')
+    args = parser.parse_args()
+
+    totals = []
+    own_times = []
+    numpy_times = []
+    for _ in range(args.runs):
+        total, own, times = import_times(args.module, args.load_tables)
+        totals.append(total)
+        own_times.append(own)
+        numpy_times.append(times.get('numpy', 0))
+
+    total = statistics.median(totals) / 1000.0
+    own = statistics.median(own_times) / 1000.0
+    numpy_ms = statistics.median(numpy_times) / 1000.0
+    print('import %s%s, median of %d runs' % (
+        args.module, ' + tables' if args.load_tables else '', args.runs))
+    print(' total     : %7.2f ms' % total)
+    print(' numpy     : %7.2f ms' % numpy_ms)
+    print(' colormath : %7.2f ms' % own)
@@ -0,0 +1,84 @@
+"""
+Measures SpectralCache.convert() latency against converting without the
+cache. The database is first filled with --entries placeholder entries and
+capped at that size, so every miss also has to make room. Reports the mean
+time per call for a plain Spectral -> Lab conversion, a cache hit and a
+cache miss::
+
+    python spectral_cache.py --entries 20000 --colors 500
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+# Does some sys.path manipulation so we can run benchmarks in-place.
+# noinspection PyUnresolvedReferences
+import benchmark_config
+
+import numpy
+
+from colormath.color_conversions import convert_color
+from colormath.color_objects import SpectralColor, LabColor
+from colormath.spectral_cache import SpectralCache
+
+
+def time_calls(func, colors):
+    """
+    Returns the mean seconds per call of `func` on each color.
+    """
+
+    start = time.perf_counter()
+    for color in colors:
+        func(color, LabColor)
+    return (time.perf_counter() - start) / len(colors)
+
+
+def random_colors(rand, count):
+    return [SpectralColor.from_array(numpy.array(
+        [rand.random() for _ in range(50)]), illuminant='d65')
+        for _ in range(count)]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entries', type=int, default=20000)
+    parser.add_argument('--colors', type=int, default=500)
+    parser.add_argument('--max-bytes', action='store_true',
+                        help="Also cap the database size in bytes.")
+    args = parser.parse_args()
+
+    rand = random.Random(0)
+    colors = random_colors(rand, args.colors)
+    new_colors = random_colors(rand, args.colors)
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmpdir, 'spectral.db')
+        with SpectralCache(filename) as cache:
+            with cache._connection:
+                cache._connection.executemany(
+                    'INSERT INTO conversions VALUES (?, ?, ?, ?, ?)',
+                    (('%040x' % i, 'LabColor', '[0, 0, 0, "2", "d65"]', 80, 0)
+                     for i in range(args.entries)))
+        cache = SpectralCache(filename, max_entries=args.entries)
+        if args.max_bytes:
+            cache.max_bytes = cache.get_stats()['bytes']
+        with cache:
+            recompute = time_calls(convert_color, colors)
+            # The first pass fills the cache, so only hits are timed after it.
+            time_calls(cache.convert, colors)
+            hit = time_calls(cache.convert, colors)
+            miss = time_calls(cache.convert, new_colors)
+            stats = cache.get_stats()
+    finally:
+        shutil.rmtree(tmpdir)
+
+    print('Spectral -> Lab, %d entries, %d colors' % (
+        args.entries, args.colors))
+    print(' no cache   : %8.2f us/call' % (recompute * 1e6))
+    print(' cache hit  : %8.2f us/call' % (hit * 1e6))
+    print(' cache miss : %8.2f us/call' % (miss * 1e6))
+    print(' %d entries, %d evictions' % (stats['entries'], stats['evictions']))
@@ -0,0 +1,22 @@
+"""
+The density filter spectral weighting functions, memory mapped from
+colormath/data/density_filters.npy. Loaded on demand by
+:py:mod:`colormath.density_standards`; import that module instead.
+"""
+
+from colormath._lazy_tables import load_data_table
+
+# The filters, one per row of a (15, 50) array.
+DENSITY_FILTER_NAMES = (
+    'ANSI_STATUS_A_RED', 'ANSI_STATUS_A_GREEN', 'ANSI_STATUS_A_BLUE',
+    'ANSI_STATUS_E_RED', 'ANSI_STATUS_E_GREEN', 'ANSI_STATUS_E_BLUE',
+    'ANSI_STATUS_M_RED', 'ANSI_STATUS_M_GREEN', 'ANSI_STATUS_M_BLUE',
+    'ANSI_STATUS_T_RED', 'ANSI_STATUS_T_GREEN', 'ANSI_STATUS_T_BLUE',
+    'TYPE1', 'TYPE2', 'ISO_VISUAL')
+DENSITY_FILTERS = load_data_table('density_filters.npy')
+
+ANSI_STATUS_A_RED, ANSI_STATUS_A_GREEN, ANSI_STATUS_A_BLUE, \
+    ANSI_STATUS_E_RED, ANSI_STATUS_E_GREEN, ANSI_STATUS_E_BLUE, \
+    ANSI_STATUS_M_RED, ANSI_STATUS_M_GREEN, ANSI_STATUS_M_BLUE, \
+    ANSI_STATUS_T_RED, ANSI_STATUS_T_GREEN, ANSI_STATUS_T_BLUE, \
+    TYPE1, TYPE2, ISO_VISUAL = DENSITY_FILTERS
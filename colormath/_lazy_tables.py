@@ -0,0 +1,64 @@
+"""
+Lazy loading for the large constant tables. The spectral and density tables
+are stored as .npy files in colormath/data, and most programs never touch
+them, so their public modules only load them the first time one is
+accessed.
+"""
+
+import importlib
+import os
+import sys
+
+import numpy
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def load_data_table(filename):
+    """
+    :param str filename: The name of a .npy file in colormath/data.
+    :rtype: numpy.ndarray
+    :returns: The table, memory mapped read-only. Pages are only read from
+        disk when used, and are shared between processes.
+    """
+
+    return numpy.asarray(
+        numpy.load(os.path.join(DATA_DIR, filename), mmap_mode='r'))
+
+
+def install_lazy_tables(module_name, tables_module_name, table_names):
+    """
+    Makes the tables named in `table_names` load from `tables_module_name`
+    the first time they are read from the module `module_name`.
+
+    Uses a module level ``__getattr__``, which needs Python 3.7. Older
+    versions load the tables right away.
+
+    :param str module_name: The public module, usually ``__name__``.
+    :param str tables_module_name: The module that builds the tables.
+    :param table_names: The names of the tables to load lazily.
+    """
+
+    module = sys.modules[module_name]
+    table_names = frozenset(table_names)
+
+    def load_tables():
+        tables_module = importlib.import_module(tables_module_name)
+        for name in table_names:
+            setattr(module, name, getattr(tables_module, name))
+
+    def __getattr__(name):
+        if name in table_names:
+            load_tables()
+            return getattr(module, name)
+        raise AttributeError(
+            "module %r has no attribute %r" % (module_name, name))
+
+    def __dir__():
+        return sorted(set(vars(module)) | table_names)
+
+    if sys.version_info < (3, 7):
+        load_tables()
+    else:
+        module.__getattr__ = __getattr__
+        module.__dir__ = __dir__
@@ -0,0 +1,27 @@
+"""
+The observer functions and reference illuminant spectral distributions,
+memory mapped from the .npy files in colormath/data. Loaded on demand by
+:py:mod:`colormath.spectral_constants`; import that module instead.
+"""
+
+from colormath._lazy_tables import load_data_table
+
+# The standard observers, stacked in one (observer, X/Y/Z, wavelength)
+# array of shape (2, 3, 50).
+STDOBSERV = load_data_table('observers.npy')
+STDOBSERV_TABLE = {'2': STDOBSERV[0], '10': STDOBSERV[1]}
+STDOBSERV_X2, STDOBSERV_Y2, STDOBSERV_Z2 = STDOBSERV[0]
+STDOBSERV_X10, STDOBSERV_Y10, STDOBSERV_Z10 = STDOBSERV[1]
+
+# The reference illuminants, one per row of a (10, 50) array.
+REF_ILLUM_NAMES = (
+    'a', 'b', 'c', 'd50', 'd65', 'e', 'f2', 'f7', 'f11', 'blackbody')
+REF_ILLUM = load_data_table('illuminants.npy')
+REFERENCE_ILLUM_A, REFERENCE_ILLUM_B, REFERENCE_ILLUM_C, REFERENCE_ILLUM_D50, \
+    REFERENCE_ILLUM_D65, REFERENCE_ILLUM_E, REFERENCE_ILLUM_F2, \
+    REFERENCE_ILLUM_F7, REFERENCE_ILLUM_F11, REFERENCE_ILLUM_BLACKBODY = \
+    REF_ILLUM
+
+# This table is used to match up illuminants to spectral distributions above.
+# It should correspond to a ColorObject.illuminant attribute.
+REF_ILLUM_TABLE = dict(zip(REF_ILLUM_NAMES, REF_ILLUM))
@@ -1,11 +1,7 @@
-import logging
-
 import numpy
 from numpy.linalg import pinv
 
-from colormath import color_constants
-
-logger = logging.getLogger(__name__)
+from colormath import color_constants, conversion_trace
 
 
 # noinspection PyPep8Naming
@@ -70,7 +66,6 @@ def apply_chromatic_adaptation(val_x, val_y, val_z, orig_illum, targ_illum,
     targ_illum = targ_illum.lower()
     adaptation = adaptation.lower()
 
-    logger.debug("  \* Applying adaptation matrix: %s", adaptation)
     # Retrieve the appropriate transformation matrix from the constants.
     transform_matrix = _get_adaptation_matrix(orig_illum, targ_illum,
                                               observer, adaptation)
@@ -80,6 +75,12 @@ def apply_chromatic_adaptation(val_x, val_y, val_z, orig_illum, targ_illum,
     # Perform the adaptation via matrix multiplication.
     result_matrix = numpy.dot(XYZ_matrix, transform_matrix)
 
+    if conversion_trace._tracer is not None:
+        conversion_trace._emit(
+            apply_chromatic_adaptation, (val_x, val_y, val_z), result_matrix,
+            {'orig_illum': orig_illum, 'targ_illum': targ_illum,
+             'observer': observer, 'adaptation': adaptation})
+
     # Return individual X, Y, and Z coordinates.
     return result_matrix[0], result_matrix[1], result_matrix[2]
 
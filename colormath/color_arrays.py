@@ -0,0 +1,465 @@
+"""
+Array-backed collections of colors. A color array keeps a whole batch of
+colors in one contiguous ``(n, k)`` NumPy array, one column per entry in
+the color class's ``VALUES``. The observer, illuminant and RGB type are
+stored once for the whole array.
+
+Color arrays work with :py:func:`colormath.color_conversions.convert_color`
+and the ``*_batch`` Delta E functions in :py:mod:`colormath.color_diff`.
+Color objects are only built when a single element is indexed, or when the
+array is iterated over. Both give independent copies.
+
+:py:meth:`ColorArray.view` and :py:meth:`ColorArray.views` return flyweight
+views instead. A view is an instance of the color class, so it works
+anywhere a color object does, but it only holds a reference to the array
+and its row number. Reading a value reads the array, and setting one writes
+to the array.
+"""
+
+import numpy
+
+from colormath import color_conversions, color_diff_matrix
+from colormath.color_conversions_matrix import _convert_color_matrix, \
+    _get_meta, _META_ATTRIBUTES
+from colormath.color_objects import SpectralColor, LabColor, LCHabColor, \
+    LCHuvColor, LuvColor, XYZColor, xyYColor, RGBColor, HSLColor, HSVColor, \
+    CMYColor, CMYKColor
+
+
+class ColorArray(object):
+    """
+    Base class for the color arrays. Sub-classes set :py:attr:`COLOR_CLASS`.
+
+    :param values: An ``(n, k)`` array-like. Each row holds one color's
+        values in the order of ``COLOR_CLASS.VALUES``.
+    :param kwargs: The metadata shared by every color, such as
+        ``observer``, ``illuminant`` or ``rgb_type``. These are validated the
+        same way the color class's constructor validates them.
+    """
+
+    # The color class of this array's elements.
+    COLOR_CLASS = None
+
+    def __init__(self, values, **kwargs):
+        values = numpy.array(values, dtype=float, ndmin=2)
+        if values.ndim != 2 or values.shape[1] != len(self.COLOR_CLASS.VALUES):
+            raise ValueError(
+                "%s needs an (n, %d) array, got shape %s." % (
+                    self.__class__.__name__, len(self.COLOR_CLASS.VALUES),
+                    values.shape))
+        # Let the color class validate and normalize the metadata.
+        prototype = self.COLOR_CLASS(
+            *numpy.zeros(values.shape[1]), **kwargs)
+        self.values = values
+        self.meta = _get_meta(prototype)
+
+    @classmethod
+    def _from_values(cls, values, meta):
+        """
+        Wraps `values` without copying or validating anything.
+        """
+
+        color_array = cls.__new__(cls)
+        color_array.values = values
+        color_array.meta = meta
+        return color_array
+
+    @classmethod
+    def from_colors(cls, colors):
+        """
+        Builds an array from a sequence of color objects, which must all
+        share the same metadata.
+
+        :raises: ValueError if the colors have different metadata or aren't
+            instances of :py:attr:`COLOR_CLASS`.
+        """
+
+        colors = list(colors)
+        metas = set()
+        for color in colors:
+            if not isinstance(color, cls.COLOR_CLASS):
+                raise ValueError("%s can only hold %s objects." % (
+                    cls.__name__, cls.COLOR_CLASS.__name__))
+            metas.add(tuple(sorted(_get_meta(color).items())))
+        if len(metas) > 1:
+            raise ValueError(
+                "All colors in a %s must share the same metadata. Got: %s" % (
+                    cls.__name__, ', '.join(sorted(map(str, metas)))))
+
+        values = numpy.array(
+            [color.get_value_tuple() for color in colors], dtype=float)
+        meta = dict(metas.pop()) if metas else {}
+        return cls(values.reshape(-1, len(cls.COLOR_CLASS.VALUES)), **meta)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        """
+        An integer index returns a color object. Anything else returns a
+        color array. Slices return views that share this array's values.
+        """
+
+        if isinstance(index, (int, numpy.integer)):
+            return self.COLOR_CLASS(*self.values[index], **self.meta)
+        return self._from_values(
+            numpy.atleast_2d(self.values[index]), self.meta)
+
+    def __iter__(self):
+        """
+        Yields each color as an independent color object, like indexing.
+        Use :py:meth:`views` to iterate without copying.
+        """
+
+        for i in range(len(self)):
+            yield self[i]
+
+    def views(self):
+        """
+        Yields a view of each color. See :py:meth:`view`.
+        """
+
+        view_cs = get_color_view_class(self.COLOR_CLASS)
+        for i in range(len(self)):
+            yield view_cs._from_row(self, i)
+
+    def view(self, index):
+        """
+        Returns a view of one color. Unlike indexing, this doesn't copy the
+        color's values: the view reads and writes this array's row directly.
+        The metadata is shared by the whole array and can't be changed
+        through a view.
+
+        :param int index: The row of the color.
+        :rtype: ColorView
+        :raises: IndexError if `index` is out of range.
+        """
+
+        if not -len(self) <= index < len(self):
+            raise IndexError("Color index %d out of range." % index)
+        view_cs = get_color_view_class(self.COLOR_CLASS)
+        return view_cs._from_row(self, index % len(self))
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or numpy.dtype(dtype) == self.values.dtype:
+            return self.values.copy() if copy else self.values
+        return self.values.astype(dtype)
+
+    def __repr__(self):
+        meta = ', '.join(
+            '%s=%r' % item for item in sorted(self.meta.items()))
+        return '%s(<%d colors>%s)' % (
+            self.__class__.__name__, len(self), meta and ', ' + meta)
+
+    def convert(self, target_cs, *args, **kwargs):
+        """
+        Converts every color in the array. Takes the same arguments as
+        :py:func:`colormath.color_conversions.convert_color`. `target_cs`
+        may be a color class or a color array class.
+
+        :rtype: ColorArray
+        """
+
+        if issubclass(target_cs, ColorArray):
+            target_cs = target_cs.COLOR_CLASS
+        values, meta = _convert_color_matrix(
+            self.values, self.COLOR_CLASS, target_cs, self.meta,
+            *args, **kwargs)
+        target_array_cs = get_color_array_class(target_cs)
+        if meta is None:
+            # Nothing was converted, so the target metadata is unknown.
+            return target_array_cs(values)
+        return target_array_cs._from_values(values, meta)
+
+
+color_conversions._register_self_converting(ColorArray)
+
+
+class ColorView(object):
+    """
+    Mixin for the flyweight views returned by :py:meth:`ColorArray.view`.
+    Each color class has a view sub-class, such as ``LabColorView``, made
+    by :py:func:`get_color_view_class`.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def _from_row(cls, color_array, index):
+        view = cls.__new__(cls)
+        view._array = color_array
+        view._index = index
+        return view
+
+    def detach(self):
+        """
+        :returns: A regular color object with a copy of this view's values.
+        """
+
+        return self.COLOR_CLASS(*self.get_value_tuple(), **self._array.meta)
+
+    def get_value_tuple(self):
+        return tuple(self._array.values[self._index].tolist())
+
+    def __copy__(self):
+        return self.detach()
+
+    def __reduce__(self):
+        # Copies and pickles are regular colors, detached from the array.
+        return _make_color, (
+            self.COLOR_CLASS, self.get_value_tuple(), self._array.meta)
+
+
+def _make_color(color_cs, values, meta):
+    """
+    Rebuilds a pickled or copied view as a regular color object.
+    """
+
+    return color_cs(*values, **meta)
+
+
+def _make_value_property(column):
+    """
+    :returns: A property that reads and writes one column of a view's row.
+    """
+
+    def fget(self):
+        return float(self._array.values[self._index, column])
+
+    def fset(self, value):
+        self._array.values[self._index, column] = value
+
+    return property(fget, fset)
+
+
+def _make_meta_property(name):
+    """
+    :returns: A read-only property for one of the array's metadata entries.
+    """
+
+    def fget(self):
+        return self._array.meta[name]
+
+    def fset(self, value):
+        raise AttributeError(
+            "%s is shared by the whole color array and can't be set through "
+            "a view." % name)
+
+    return property(fget, fset)
+
+
+def _get_row_view(self):
+    """
+    A view's ``get_numpy_view()``: its row of the array, as a ``(1, k)``
+    view.
+    """
+
+    return self._array.values[self._index:self._index + 1]
+
+
+def _get_row_array(self):
+    """
+    A view's ``get_numpy_array()``: a copy of its row of the array, as a
+    ``(1, k)`` array.
+    """
+
+    return self._array.values[self._index:self._index + 1].copy()
+
+
+def _make_view_class(color_cs):
+    """
+    Builds the view sub-class of `color_cs`. Its properties replace the
+    color class's value and metadata slots.
+
+    :rtype: type
+    """
+
+    namespace = {
+        '__slots__': ('_array', '_index'),
+        '__doc__': 'A view of one %s in a color array.' % color_cs.__name__,
+        'COLOR_CLASS': color_cs,
+    }
+    for column, name in enumerate(color_cs.VALUES):
+        namespace[name] = _make_value_property(column)
+    for name in _META_ATTRIBUTES:
+        if hasattr(color_cs, name):
+            namespace[name] = _make_meta_property(name)
+    if hasattr(color_cs, 'get_numpy_view'):
+        namespace['get_numpy_array'] = _get_row_array
+        namespace['get_numpy_view'] = _get_row_view
+    return type(color_cs.__name__ + 'View', (ColorView, color_cs), namespace)
+
+
+class SpectralArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.SpectralColor` values.
+    """
+
+    COLOR_CLASS = SpectralColor
+
+
+class LabArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.LabColor` values.
+    """
+
+    COLOR_CLASS = LabColor
+
+    def delta_e(self, other, method='cie2000', **kwargs):
+        """
+        Calculates the Delta E between these colors and `other`, with these
+        colors as the standards (``color1`` in :py:mod:`colormath.color_diff`).
+
+        :param other: A LabArray of the same length to compare row by row,
+            or a single LabColor to compare every color against. It must
+            have the same observer and illuminant as these colors.
+        :param str method: One of the keys of
+            :py:data:`colormath.color_diff_matrix.DELTA_E_METHODS`.
+        :param kwargs: Passed on to the Delta E kernel.
+        :rtype: numpy.ndarray
+        """
+
+        try:
+            kernel = color_diff_matrix.DELTA_E_METHODS[method]
+        except KeyError:
+            raise ValueError("Invalid Delta E method: %s" % method)
+        if isinstance(other, LabColor):
+            other_space = (other.observer, other.illuminant)
+            other_values = numpy.array(other.get_value_tuple())
+        elif isinstance(other, LabArray):
+            if len(other) != len(self):
+                raise ValueError(
+                    "Delta E batches must be the same length (%d != %d)." % (
+                        len(self), len(other)))
+            other_space = (other.meta['observer'], other.meta['illuminant'])
+            other_values = other.values
+        else:
+            raise ValueError(
+                "Delta E functions can only be used with LabColor objects.")
+        # The same check as the *_batch functions in colormath.color_diff.
+        space = (self.meta['observer'], self.meta['illuminant'])
+        if other_space != space:
+            raise ValueError(
+                "All colors in a Delta E batch must share the same observer "
+                "and illuminant. Got: %s" % ', '.join(
+                    sorted(map(str, (space, other_space)))))
+        return kernel(self.values, other_values, **kwargs)
+
+
+class LCHabArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.LCHabColor` values.
+    """
+
+    COLOR_CLASS = LCHabColor
+
+
+class LCHuvArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.LCHuvColor` values.
+    """
+
+    COLOR_CLASS = LCHuvColor
+
+
+class LuvArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.LuvColor` values.
+    """
+
+    COLOR_CLASS = LuvColor
+
+
+class XYZArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.XYZColor` values.
+    """
+
+    COLOR_CLASS = XYZColor
+
+
+class xyYArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.xyYColor` values.
+    """
+
+    COLOR_CLASS = xyYColor
+
+
+class RGBArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.RGBColor` values.
+
+    :param bool is_upscaled: If ``True``, `values` are 0-255 and are scaled
+        down to 0.0-1.0.
+    """
+
+    COLOR_CLASS = RGBColor
+
+    def __init__(self, values, rgb_type='srgb', is_upscaled=False):
+        super(RGBArray, self).__init__(values, rgb_type=rgb_type)
+        if is_upscaled:
+            self.values /= 255.0
+
+
+class HSLArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.HSLColor` values.
+    """
+
+    COLOR_CLASS = HSLColor
+
+
+class HSVArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.HSVColor` values.
+    """
+
+    COLOR_CLASS = HSVColor
+
+
+class CMYArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.CMYColor` values.
+    """
+
+    COLOR_CLASS = CMYColor
+
+
+class CMYKArray(ColorArray):
+    """
+    An array of :py:class:`colormath.color_objects.CMYKColor` values.
+    """
+
+    COLOR_CLASS = CMYKColor
+
+
+COLOR_ARRAY_CLASSES = dict(
+    (color_array_cs.COLOR_CLASS, color_array_cs)
+    for color_array_cs in (
+        SpectralArray, LabArray, LCHabArray, LCHuvArray, LuvArray, XYZArray,
+        xyYArray, RGBArray, HSLArray, HSVArray, CMYArray, CMYKArray))
+
+
+def get_color_array_class(color_cs):
+    """
+    :param color_cs: A color class, such as LabColor.
+    :rtype: type
+    :returns: The matching color array class, such as LabArray.
+    """
+
+    return COLOR_ARRAY_CLASSES[color_cs]
+
+
+COLOR_VIEW_CLASSES = dict(
+    (color_cs, _make_view_class(color_cs)) for color_cs in COLOR_ARRAY_CLASSES)
+
+
+def get_color_view_class(color_cs):
+    """
+    :param color_cs: A color class, such as LabColor.
+    :rtype: type
+    :returns: The matching color view class, such as LabColorView.
+    """
+
+    return COLOR_VIEW_CLASSES[color_cs]
@@ -0,0 +1,166 @@
+"""
+asyncio wrappers that coalesce many small conversion and Delta E requests
+into vectorized batches.
+
+Each call to :py:meth:`AsyncColorBatcher.convert_color` or
+:py:meth:`AsyncColorBatcher.delta_e` joins a queue of compatible requests.
+The queue is flushed once it holds ``max_batch_size`` items or
+``max_delay`` seconds after its first item arrives, whichever comes first.
+The batch runs on an executor thread so the event loop keeps serving other
+requests, and each awaiting caller receives its own slice of the result.
+
+This module needs Python 3.7 or later. The rest of colormath doesn't import
+it, so it is only loaded where it can run.
+"""
+
+import asyncio
+import logging
+
+import numpy
+
+from colormath import color_diff_matrix
+from colormath.color_conversions_batch import convert_colors
+from colormath.color_diff import _get_lab_color_tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _get_kwargs_key(kwargs):
+    """
+    :rtype: tuple
+    :returns: A hashable form of a kwargs dict.
+    """
+
+    return tuple(sorted(kwargs.items()))
+
+
+class AsyncColorBatcher(object):
+    """
+    Coalesces concurrent requests from coroutines into vectorized batches.
+    Requests are only batched with others that share the same target and
+    kwargs.
+
+    :param float max_delay: Seconds to wait for more requests after the
+        first request of a batch arrives.
+    :param int max_batch_size: Flush a batch as soon as it reaches this size.
+    :param executor: A :py:class:`concurrent.futures.Executor` to run batches
+        on. The event loop's default executor is used if ``None``.
+    """
+
+    def __init__(self, max_delay=0.001, max_batch_size=1024, executor=None):
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        # Queue key -> (batch function, [(item, future), ...]).
+        self._pending = {}
+        # Queue key -> timer handle for the delayed flush.
+        self._timers = {}
+
+    async def convert_color(self, color, target_cs, *args, **kwargs):
+        """
+        Converts `color` to `target_cs`. This takes the same arguments and
+        returns the same result as
+        :py:func:`colormath.color_conversions.convert_color`.
+        """
+
+        key = ('convert', target_cs, args, _get_kwargs_key(kwargs))
+
+        def run_batch(colors):
+            return convert_colors(colors, target_cs, *args, **kwargs)
+
+        return await self._submit(key, run_batch, color)
+
+    async def delta_e(self, color1, color2, method='cie2000', **kwargs):
+        """
+        Calculates the Delta E between two LabColors.
+
+        :param str method: One of the keys of
+            :py:data:`colormath.color_diff_matrix.DELTA_E_METHODS`.
+        :param kwargs: Passed on to the Delta E kernel.
+        :rtype: float
+        """
+
+        try:
+            kernel = color_diff_matrix.DELTA_E_METHODS[method]
+        except KeyError:
+            raise ValueError("Invalid Delta E method: %s" % method)
+        pair = (_get_lab_color_tuple(color1), _get_lab_color_tuple(color2))
+        key = ('delta_e', method, _get_kwargs_key(kwargs))
+
+        def run_batch(pairs):
+            lab_matrices = numpy.array(pairs, dtype=float)
+            return kernel(
+                lab_matrices[:, 0], lab_matrices[:, 1], **kwargs).tolist()
+
+        return await self._submit(key, run_batch, pair)
+
+    async def _submit(self, key, run_batch, item):
+        """
+        Queues `item` and waits for the result of its batch.
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        try:
+            queue = self._pending.setdefault(key, (run_batch, []))[1]
+            alone = False
+        except TypeError:
+            # Unhashable arguments, such as an illuminant_override array,
+            # can't be matched with other requests, so this one is a batch
+            # of its own.
+            key = (key[0], id(future))
+            queue = []
+            self._pending[key] = (run_batch, queue)
+            alone = True
+        queue.append((item, future))
+
+        if alone or len(queue) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(
+                self.max_delay, self._flush, key)
+        return await future
+
+    def _flush(self, key):
+        """
+        Runs the queued batch for `key` on the executor.
+        """
+
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        run_batch, queue = self._pending.pop(key)
+        items = [item for item, _ in queue]
+        futures = [future for _, future in queue]
+        logger.debug("Running %s batch of %d", key[0], len(items))
+
+        loop = asyncio.get_running_loop()
+        batch = loop.run_in_executor(self.executor, run_batch, items)
+
+        def resolve(batch):
+            if batch.cancelled():
+                for future in futures:
+                    future.cancel()
+                return
+            exception = batch.exception()
+            if exception is None:
+                results = batch.result()
+            for i, future in enumerate(futures):
+                if future.done():
+                    # The caller was cancelled while waiting.
+                    continue
+                if exception is None:
+                    future.set_result(results[i])
+                else:
+                    future.set_exception(exception)
+
+        batch.add_done_callback(resolve)
+
+    async def flush(self):
+        """
+        Starts every queued batch right away, without waiting for
+        ``max_delay``.
+        """
+
+        for key in list(self._pending):
+            self._flush(key)
@@ -116,6 +116,45 @@ ILLUMINANTS = {
 
 OBSERVERS = ILLUMINANTS.keys()
 
+
+def _read_only_array(values):
+    """
+    :rtype: numpy.ndarray
+    :returns: A float array of `values` that can't be written to, so it can
+        be shared safely.
+    """
+
+    array = numpy.array(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+# White point tables, precomputed for every (observer, illuminant) pair so
+# the conversions don't rebuild them on every call. The read-only arrays are
+# used by the batch kernels.
+# (X, Y, Z) of the white point.
+ILLUMINANT_XYZ = dict(
+    ((observer, illuminant), _read_only_array(xyz))
+    for observer, illuminants in ILLUMINANTS.items()
+    for illuminant, xyz in illuminants.items())
+# (1 / X, 1 / Y, 1 / Z), for scaling XYZ colors to the white point.
+ILLUMINANT_XYZ_RECIPROCAL = dict(
+    (key, _read_only_array(1.0 / xyz))
+    for key, xyz in ILLUMINANT_XYZ.items())
+# The white point's (u', v') chromaticity, the reference in Luv conversions.
+ILLUMINANT_UV = dict(
+    (key, _read_only_array(
+        (4.0 * xyz[0], 9.0 * xyz[1]) / (xyz[0] + 15.0 * xyz[1] + 3.0 * xyz[2])))
+    for key, xyz in ILLUMINANT_XYZ.items())
+# The same numbers as plain floats for the scalar conversions, which are
+# faster with Python floats than NumPy scalars:
+# (X, Y, Z, 1 / X, 1 / Y, 1 / Z, u', v').
+WHITE_POINTS = dict(
+    (key, tuple(ILLUMINANT_XYZ[key].tolist() +
+                ILLUMINANT_XYZ_RECIPROCAL[key].tolist() +
+                ILLUMINANT_UV[key].tolist()))
+    for key in ILLUMINANT_XYZ)
+
 # Chromatic Adaptation Matrices
 # http://brucelindbloom.com/Eqn_ChromAdapt.html
 ADAPTATION_MATRICES = {
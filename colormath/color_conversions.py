@@ -1,25 +1,21 @@
 """
 Conversion between color spaces.
-
-.. note:: This module makes extensive use of imports within functions.
-    That stinks.
 """
 
 import math
-import logging
 
 import numpy
 
 from colormath import color_constants
+from colormath import conversion_trace
 from colormath import spectral_constants
-from colormath.color_objects import ColorBase
+from colormath.color_objects import ColorBase, XYZColor, xyYColor, \
+    LabColor, LCHabColor, LCHuvColor, LuvColor, RGBColor, HSLColor, HSVColor, \
+    CMYColor, CMYKColor
 from colormath.chromatic_adaptation import apply_chromatic_adaptation
 from colormath.color_exceptions import InvalidIlluminantError, UndefinedConversionError
 
 
-logger = logging.getLogger(__name__)
-
-
 # noinspection PyPep8Naming
 def apply_RGB_matrix(var1, var2, var3, rgb_type, convtype="xyz_to_rgb"):
     """
@@ -34,26 +30,40 @@ def apply_RGB_matrix(var1, var2, var3, rgb_type, convtype="xyz_to_rgb"):
     # Retrieve the appropriate transformation matrix from the constants.
     rgb_matrix = color_constants.RGB_SPECS[rgb_type]["conversions"][convtype]
    
-    logger.debug("  \* Applying RGB conversion matrix: %s->%s", rgb_type, convtype)
     # Stuff the RGB/XYZ values into a NumPy matrix for conversion.
     var_matrix = numpy.array((
         var1, var2, var3
     ))
     # Perform the adaptation via matrix multiplication.
     result_matrix = numpy.dot(var_matrix, rgb_matrix)
+    if conversion_trace._tracer is not None:
+        conversion_trace._emit(
+            apply_RGB_matrix, (var1, var2, var3), result_matrix,
+            {'rgb_type': rgb_type, 'convtype': convtype})
     return result_matrix[0], result_matrix[1], result_matrix[2]
 
 
+def _get_white_point(cobj):
+    """
+    :rtype: tuple
+    :returns: The color's precomputed white point from
+        :py:data:`colormath.color_constants.WHITE_POINTS`.
+    """
+
+    try:
+        return color_constants.WHITE_POINTS[(cobj.observer, cobj.illuminant)]
+    except KeyError:
+        raise InvalidIlluminantError(cobj.illuminant)
+
+
 # noinspection PyPep8Naming,PyUnusedLocal
 def Spectral_to_XYZ(cobj, illuminant_override=None, *args, **kwargs):
     """
     Converts spectral readings to XYZ.
     """
 
-    from colormath.color_objects import XYZColor
-    
     # If the user provides an illuminant_override numpy array, use it.
-    if illuminant_override:
+    if illuminant_override is not None:
         reference_illum = illuminant_override
     else:
         # Otherwise, look up the illuminant from known standards based
@@ -65,17 +75,13 @@ def Spectral_to_XYZ(cobj, illuminant_override=None, *args, **kwargs):
         
     # Get the spectral distribution of the selected standard observer.
     if cobj.observer == '10':
-        std_obs_x = spectral_constants.STDOBSERV_X10
-        std_obs_y = spectral_constants.STDOBSERV_Y10
-        std_obs_z = spectral_constants.STDOBSERV_Z10
+        std_obs_x, std_obs_y, std_obs_z = spectral_constants.STDOBSERV[1]
     else:
         # Assume 2 degree, since it is theoretically the only other possibility.
-        std_obs_x = spectral_constants.STDOBSERV_X2
-        std_obs_y = spectral_constants.STDOBSERV_Y2
-        std_obs_z = spectral_constants.STDOBSERV_Z2
+        std_obs_x, std_obs_y, std_obs_z = spectral_constants.STDOBSERV[0]
      
     # This is a NumPy array containing the spectral distribution of the color.
-    sample = cobj.get_numpy_array()
+    sample = cobj.get_numpy_view()
     
     # The denominator is constant throughout the entire calculation for X,
     # Y, and Z coordinates. Calculate it once and re-use.
@@ -91,12 +97,12 @@ def Spectral_to_XYZ(cobj, illuminant_override=None, *args, **kwargs):
     y_numerator = sample_by_ref_illum * std_obs_y
     z_numerator = sample_by_ref_illum * std_obs_z
     
-    xyz_x = x_numerator.sum() / denom.sum()
-    xyz_y = y_numerator.sum() / denom.sum()
-    xyz_z = z_numerator.sum() / denom.sum()
+    xyz_x = float(x_numerator.sum() / denom.sum())
+    xyz_y = float(y_numerator.sum() / denom.sum())
+    xyz_z = float(z_numerator.sum() / denom.sum())
     
-    return XYZColor(
-        xyz_x, xyz_y, xyz_z, observer=cobj.observer, illuminant=cobj.illuminant)
+    return XYZColor._from_trusted(
+        xyz_x, xyz_y, xyz_z, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -105,8 +111,6 @@ def Lab_to_LCHab(cobj, *args, **kwargs):
     Convert from CIE Lab to LCH(ab).
     """
 
-    from colormath.color_objects import LCHabColor
-   
     lch_l = cobj.lab_l
     lch_c = math.sqrt(math.pow(float(cobj.lab_a), 2) + math.pow(float(cobj.lab_b), 2))
     lch_h = math.atan2(float(cobj.lab_b), float(cobj.lab_a))
@@ -116,8 +120,8 @@ def Lab_to_LCHab(cobj, *args, **kwargs):
     else:
         lch_h = 360 - (math.fabs(lch_h) / math.pi) * 180
       
-    return LCHabColor(
-        lch_l, lch_c, lch_h, observer=cobj.observer, illuminant=cobj.illuminant)
+    return LCHabColor._from_trusted(
+        lch_l, lch_c, lch_h, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -126,9 +130,7 @@ def Lab_to_XYZ(cobj, *args, **kwargs):
     Convert from Lab to XYZ
     """
 
-    from colormath.color_objects import XYZColor
-
-    illum = cobj.get_illuminant_xyz()
+    illum_x, illum_y, illum_z = _get_white_point(cobj)[:3]
     xyz_y = (cobj.lab_l + 16.0) / 116.0
     xyz_x = cobj.lab_a / 500.0 + xyz_y
     xyz_z = xyz_y - cobj.lab_b / 200.0
@@ -148,12 +150,12 @@ def Lab_to_XYZ(cobj, *args, **kwargs):
     else:
         xyz_z = (xyz_z - 16.0 / 116.0) / 7.787
       
-    xyz_x = (illum["X"] * xyz_x)
-    xyz_y = (illum["Y"] * xyz_y)
-    xyz_z = (illum["Z"] * xyz_z)
+    xyz_x = (illum_x * xyz_x)
+    xyz_y = (illum_y * xyz_y)
+    xyz_z = (illum_z * xyz_z)
     
-    return XYZColor(
-        xyz_x, xyz_y, xyz_z, observer=cobj.observer, illuminant=cobj.illuminant)
+    return XYZColor._from_trusted(
+        xyz_x, xyz_y, xyz_z, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -162,8 +164,6 @@ def Luv_to_LCHuv(cobj, *args, **kwargs):
     Convert from CIE Luv to LCH(uv).
     """
 
-    from colormath.color_objects import LCHuvColor
-   
     lch_l = cobj.luv_l
     lch_c = math.sqrt(math.pow(cobj.luv_u, 2.0) + math.pow(cobj.luv_v, 2.0))
     lch_h = math.atan2(float(cobj.luv_v), float(cobj.luv_u))
@@ -172,8 +172,8 @@ def Luv_to_LCHuv(cobj, *args, **kwargs):
         lch_h = (lch_h / math.pi) * 180
     else:
         lch_h = 360 - (math.fabs(lch_h) / math.pi) * 180
-    return LCHuvColor(
-        lch_l, lch_c, lch_h, observer=cobj.observer, illuminant=cobj.illuminant)
+    return LCHuvColor._from_trusted(
+        lch_l, lch_c, lch_h, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -182,22 +182,18 @@ def Luv_to_XYZ(cobj, *args, **kwargs):
     Convert from Luv to XYZ.
     """
 
-    from colormath.color_objects import XYZColor
-
-    illum = cobj.get_illuminant_xyz()
     # Without Light, there is no color. Short-circuit this and avoid some
     # zero division errors in the var_a_frac calculation.
     if cobj.luv_l <= 0.0:
         xyz_x = 0.0
         xyz_y = 0.0
         xyz_z = 0.0
-        return XYZColor(
-            xyz_x, xyz_y, xyz_z, observer=cobj.observer, illuminant=cobj.illuminant)
+        return XYZColor._from_trusted(
+            xyz_x, xyz_y, xyz_z, cobj.observer, cobj.illuminant)
 
     # Various variables used throughout the conversion.
     cie_k_times_e = color_constants.CIE_K * color_constants.CIE_E
-    u_sub_0 = (4.0 * illum["X"]) / (illum["X"] + 15.0 * illum["Y"] + 3.0 * illum["Z"])
-    v_sub_0 = (9.0 * illum["Y"]) / (illum["X"] + 15.0 * illum["Y"] + 3.0 * illum["Z"])
+    u_sub_0, v_sub_0 = _get_white_point(cobj)[6:]
     var_u = cobj.luv_u / (13.0 * cobj.luv_l) + u_sub_0
     var_v = cobj.luv_v / (13.0 * cobj.luv_l) + v_sub_0
 
@@ -212,8 +208,8 @@ def Luv_to_XYZ(cobj, *args, **kwargs):
     # Z-coordinate calculation.
     xyz_z = xyz_y * (12.0 - 3.0 * var_u - 20.0 * var_v) / (4.0 * var_v)
 
-    return XYZColor(
-        xyz_x, xyz_y, xyz_z, illuminant=cobj.illuminant, observer=cobj.observer)
+    return XYZColor._from_trusted(
+        xyz_x, xyz_y, xyz_z, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -222,13 +218,11 @@ def LCHab_to_Lab(cobj, *args, **kwargs):
     Convert from LCH(ab) to Lab.
     """
 
-    from colormath.color_objects import LabColor
-   
     lab_l = cobj.lch_l
     lab_a = math.cos(math.radians(cobj.lch_h)) * cobj.lch_c
     lab_b = math.sin(math.radians(cobj.lch_h)) * cobj.lch_c
-    return LabColor(
-        lab_l, lab_a, lab_b, illuminant=cobj.illuminant, observer=cobj.observer)
+    return LabColor._from_trusted(
+        lab_l, lab_a, lab_b, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -237,13 +231,11 @@ def LCHuv_to_Luv(cobj, *args, **kwargs):
     Convert from LCH(uv) to Luv.
     """
 
-    from colormath.color_objects import LuvColor
-   
     luv_l = cobj.lch_l
     luv_u = math.cos(math.radians(cobj.lch_h)) * cobj.lch_c
     luv_v = math.sin(math.radians(cobj.lch_h)) * cobj.lch_c
-    return LuvColor(
-        luv_l, luv_u, luv_v, illuminant=cobj.illuminant, observer=cobj.observer)
+    return LuvColor._from_trusted(
+        luv_l, luv_u, luv_v, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -252,14 +244,12 @@ def xyY_to_XYZ(cobj, *args, **kwargs):
     Convert from xyY to XYZ.
     """
 
-    from colormath.color_objects import XYZColor
-   
     xyz_x = (cobj.xyy_x * cobj.xyy_Y) / cobj.xyy_y
     xyz_y = cobj.xyy_Y
     xyz_z = ((1.0 - cobj.xyy_x - cobj.xyy_y) * xyz_y) / cobj.xyy_y
     
-    return XYZColor(
-        xyz_x, xyz_y, xyz_z, illuminant=cobj.illuminant, observer=cobj.observer)
+    return XYZColor._from_trusted(
+        xyz_x, xyz_y, xyz_z, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -268,14 +258,12 @@ def XYZ_to_xyY(cobj, *args, **kwargs):
     Convert from XYZ to xyY.
     """
 
-    from colormath.color_objects import xyYColor
-   
     xyy_x = cobj.xyz_x / (cobj.xyz_x + cobj.xyz_y + cobj.xyz_z)
     xyy_y = cobj.xyz_y / (cobj.xyz_x + cobj.xyz_y + cobj.xyz_z)
     xyy_Y = cobj.xyz_y
 
-    return xyYColor(
-        xyy_x, xyy_y, xyy_Y, observer=cobj.observer, illuminant=cobj.illuminant)
+    return xyYColor._from_trusted(
+        xyy_x, xyy_y, xyy_Y, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -284,8 +272,6 @@ def XYZ_to_Luv(cobj, *args, **kwargs):
     Convert from XYZ to Luv
     """
 
-    from colormath.color_objects import LuvColor
-   
     temp_x = cobj.xyz_x
     temp_y = cobj.xyz_y
     temp_z = cobj.xyz_z
@@ -293,22 +279,21 @@ def XYZ_to_Luv(cobj, *args, **kwargs):
     luv_u = (4.0 * temp_x) / (temp_x + (15.0 * temp_y) + (3.0 * temp_z))
     luv_v = (9.0 * temp_y) / (temp_x + (15.0 * temp_y) + (3.0 * temp_z))
 
-    illum = cobj.get_illuminant_xyz()
-    temp_y = temp_y / illum["Y"]
+    white_point = _get_white_point(cobj)
+    temp_y = temp_y * white_point[4]
     if temp_y > color_constants.CIE_E:
         temp_y = math.pow(temp_y, (1.0 / 3.0))
     else:
         temp_y = (7.787 * temp_y) + (16.0 / 116.0)
    
-    ref_U = (4.0 * illum["X"]) / (illum["X"] + (15.0 * illum["Y"]) + (3.0 * illum["Z"]))
-    ref_V = (9.0 * illum["Y"]) / (illum["X"] + (15.0 * illum["Y"]) + (3.0 * illum["Z"]))
+    ref_U, ref_V = white_point[6:]
    
     luv_l = (116.0 * temp_y) - 16.0
     luv_u = 13.0 * luv_l * (luv_u - ref_U)
     luv_v = 13.0 * luv_l * (luv_v - ref_V)
    
-    return LuvColor(
-        luv_l, luv_u, luv_v, observer=cobj.observer, illuminant=cobj.illuminant)
+    return LuvColor._from_trusted(
+        luv_l, luv_u, luv_v, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -317,12 +302,10 @@ def XYZ_to_Lab(cobj, *args, **kwargs):
     Converts XYZ to Lab.
     """
 
-    from colormath.color_objects import LabColor
-
-    illum = cobj.get_illuminant_xyz()
-    temp_x = cobj.xyz_x / illum["X"]
-    temp_y = cobj.xyz_y / illum["Y"]
-    temp_z = cobj.xyz_z / illum["Z"]
+    reciprocal_x, reciprocal_y, reciprocal_z = _get_white_point(cobj)[3:6]
+    temp_x = cobj.xyz_x * reciprocal_x
+    temp_y = cobj.xyz_y * reciprocal_y
+    temp_z = cobj.xyz_z * reciprocal_z
    
     if temp_x > color_constants.CIE_E:
         temp_x = math.pow(temp_x, (1.0 / 3.0))
@@ -342,8 +325,8 @@ def XYZ_to_Lab(cobj, *args, **kwargs):
     lab_l = (116.0 * temp_y) - 16.0
     lab_a = 500.0 * (temp_x - temp_y)
     lab_b = 200.0 * (temp_y - temp_z)
-    return LabColor(
-        lab_l, lab_a, lab_b, observer=cobj.observer, illuminant=cobj.illuminant)
+    return LabColor._from_trusted(
+        lab_l, lab_a, lab_b, cobj.observer, cobj.illuminant)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -352,30 +335,22 @@ def XYZ_to_RGB(cobj, target_rgb="srgb", *args, **kwargs):
     XYZ to RGB conversion.
     """
 
-    from colormath.color_objects import RGBColor
     target_rgb = target_rgb.lower()
 
     temp_X = cobj.xyz_x
     temp_Y = cobj.xyz_y
     temp_Z = cobj.xyz_z
 
-    logger.debug("  \- Target RGB space: %s", target_rgb)
     target_illum = color_constants.RGB_SPECS[target_rgb]["native_illum"]
-    logger.debug("  \- Target native illuminant: %s", target_illum)
-    logger.debug("  \- XYZ color's illuminant: %s", cobj.illuminant)
    
     # If the XYZ values were taken with a different reference white than the
     # native reference white of the target RGB space, a transformation matrix
     # must be applied.
     if cobj.illuminant != target_illum:
-        logger.debug("  \* Applying transformation from %s to %s ",
-                     cobj.illuminant, target_illum)
         # Get the adjusted XYZ values, adapted for the target illuminant.
         temp_X, temp_Y, temp_Z = apply_chromatic_adaptation(
             temp_X, temp_Y, temp_Z,
             orig_illum=cobj.illuminant, targ_illum=target_illum)
-        logger.debug("  \*   New values: %.3f, %.3f, %.3f",
-                     temp_X, temp_Y, temp_Z)
    
     # Apply an RGB working space matrix to the XYZ values (matrix mul).
     rgb_r, rgb_g, rgb_b = apply_RGB_matrix(
@@ -401,9 +376,9 @@ def XYZ_to_RGB(cobj, target_rgb="srgb", *args, **kwargs):
             v = linear_channels[channel]
             nonlinear_channels[channel] = v * 12.92
 
-    return RGBColor(
-        nonlinear_channels['r'], nonlinear_channels['g'], nonlinear_channels['b'],
-        rgb_type=target_rgb)
+    return RGBColor._from_trusted(
+        float(nonlinear_channels['r']), float(nonlinear_channels['g']),
+        float(nonlinear_channels['b']), target_rgb)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -414,8 +389,6 @@ def RGB_to_XYZ(cobj, target_illuminant=None, *args, **kwargs):
     Based off of: http://www.brucelindbloom.com/index.html?Eqn_RGB_to_XYZ.html
     """
 
-    from colormath.color_objects import XYZColor
-
     # Will contain linearized RGB channels (removed the gamma func).
     linear_channels = {}
 
@@ -445,7 +418,8 @@ def RGB_to_XYZ(cobj, target_illuminant=None, *args, **kwargs):
     # The illuminant of the original RGB object. This will always match
     # the RGB colorspace's native illuminant.
     illuminant = color_constants.RGB_SPECS[cobj.rgb_type]["native_illum"]
-    xyzcolor = XYZColor(xyz_x, xyz_y, xyz_z, illuminant=illuminant)
+    xyzcolor = XYZColor._from_trusted(
+        float(xyz_x), float(xyz_y), float(xyz_z), '2', illuminant)
     # This will take care of any illuminant changes for us (if source
     # illuminant != target illuminant).
     xyzcolor.apply_adaptation(target_illuminant)
@@ -480,8 +454,6 @@ def RGB_to_HSV(cobj, *args, **kwargs):
     V values are a percentage, 0.0 to 1.0.
     """
 
-    from colormath.color_objects import HSVColor
-    
     var_R = cobj.rgb_r
     var_G = cobj.rgb_g
     var_B = cobj.rgb_b
@@ -492,7 +464,7 @@ def RGB_to_HSV(cobj, *args, **kwargs):
     var_H = __RGB_to_Hue(var_R, var_G, var_B, var_min, var_max)
     
     if var_max == 0:
-        var_S = 0
+        var_S = 0.0
     else:
         var_S = 1.0 - (var_min / var_max)
         
@@ -502,8 +474,7 @@ def RGB_to_HSV(cobj, *args, **kwargs):
     hsv_s = var_S
     hsv_v = var_V
 
-    return HSVColor(
-        var_H, var_S, var_V, rgb_type=cobj.rgb_type)
+    return HSVColor._from_trusted(var_H, var_S, var_V, cobj.rgb_type)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -516,8 +487,6 @@ def RGB_to_HSL(cobj, *args, **kwargs):
     L values are a percentage, 0.0 to 1.0.
     """
 
-    from colormath.color_objects import HSLColor
-    
     var_R = cobj.rgb_r
     var_G = cobj.rgb_g
     var_B = cobj.rgb_b
@@ -529,14 +498,13 @@ def RGB_to_HSL(cobj, *args, **kwargs):
     var_L = 0.5 * (var_max + var_min)
     
     if var_max == var_min:
-        var_S = 0
+        var_S = 0.0
     elif var_L <= 0.5:
         var_S = (var_max - var_min) / (2.0 * var_L)
     else:
         var_S = (var_max - var_min) / (2.0 - (2.0 * var_L))
     
-    return HSLColor(
-        var_H, var_S, var_L, rgb_type=cobj.rgb_type)
+    return HSLColor._from_trusted(var_H, var_S, var_L, cobj.rgb_type)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -571,8 +539,6 @@ def HSV_to_RGB(cobj, target_rgb=None, *args, **kwargs):
     V values are a percentage, 0.0 to 1.0.
     """
 
-    from colormath.color_objects import RGBColor
-    
     H = cobj.hsv_h
     S = cobj.hsv_s
     V = cobj.hsv_v
@@ -614,11 +580,11 @@ def HSV_to_RGB(cobj, target_rgb=None, *args, **kwargs):
     # In the event that they define an HSV color and want to convert it to 
     # a particular RGB space, let them override it here.
     if target_rgb is not None:
-        rgb_type = target_rgb
+        rgb_type = target_rgb.lower()
     else:
         rgb_type = cobj.rgb_type
         
-    return RGBColor(rgb_r, rgb_g, rgb_b, rgb_type=rgb_type)
+    return RGBColor._from_trusted(rgb_r, rgb_g, rgb_b, rgb_type)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -627,8 +593,6 @@ def HSL_to_RGB(cobj, target_rgb=None, *args, **kwargs):
     HSL to RGB conversion.
     """
 
-    from colormath.color_objects import RGBColor
-    
     H = cobj.hsl_h
     S = cobj.hsl_s
     L = cobj.hsl_l
@@ -654,11 +618,11 @@ def HSL_to_RGB(cobj, target_rgb=None, *args, **kwargs):
     # In the event that they define an HSV color and want to convert it to 
     # a particular RGB space, let them override it here.
     if target_rgb is not None:
-        rgb_type = target_rgb
+        rgb_type = target_rgb.lower()
     else:
         rgb_type = cobj.rgb_type
     
-    return RGBColor(rgb_r, rgb_g, rgb_b, rgb_type=rgb_type)
+    return RGBColor._from_trusted(rgb_r, rgb_g, rgb_b, rgb_type)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -669,13 +633,11 @@ def RGB_to_CMY(cobj, *args, **kwargs):
     NOTE: CMYK and CMY values range from 0.0 to 1.0
     """
 
-    from colormath.color_objects import CMYColor
-   
     cmy_c = 1.0 - cobj.rgb_r
     cmy_m = 1.0 - cobj.rgb_g
     cmy_y = 1.0 - cobj.rgb_b
     
-    return CMYColor(cmy_c, cmy_m, cmy_y)
+    return CMYColor._from_trusted(cmy_c, cmy_m, cmy_y)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -686,13 +648,11 @@ def CMY_to_RGB(cobj, *args, **kwargs):
     NOTE: Returned values are in the range of 0-255.
     """
 
-    from colormath.color_objects import RGBColor
-    
     rgb_r = 1.0 - cobj.cmy_c
     rgb_g = 1.0 - cobj.cmy_m
     rgb_b = 1.0 - cobj.cmy_y
     
-    return RGBColor(rgb_r, rgb_g, rgb_b)
+    return RGBColor._from_trusted(rgb_r, rgb_g, rgb_b, 'srgb')
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -703,8 +663,6 @@ def CMY_to_CMYK(cobj, *args, **kwargs):
     NOTE: CMYK and CMY values range from 0.0 to 1.0
     """
 
-    from colormath.color_objects import CMYKColor
-   
     var_k = 1.0
     if cobj.cmy_c < var_k:
         var_k = cobj.cmy_c
@@ -723,7 +681,7 @@ def CMY_to_CMYK(cobj, *args, **kwargs):
         cmyk_y = (cobj.cmy_y - var_k) / (1.0 - var_k)
     cmyk_k = var_k
 
-    return CMYKColor(cmyk_c, cmyk_m, cmyk_y, cmyk_k)
+    return CMYKColor._from_trusted(cmyk_c, cmyk_m, cmyk_y, cmyk_k)
 
 
 # noinspection PyPep8Naming,PyUnusedLocal
@@ -734,13 +692,11 @@ def CMYK_to_CMY(cobj, *args, **kwargs):
     NOTE: CMYK and CMY values range from 0.0 to 1.0
     """
 
-    from colormath.color_objects import CMYColor
-    
     cmy_c = cobj.cmyk_c * (1.0 - cobj.cmyk_k) + cobj.cmyk_k
     cmy_m = cobj.cmyk_m * (1.0 - cobj.cmyk_k) + cobj.cmyk_k
     cmy_y = cobj.cmyk_y * (1.0 - cobj.cmyk_k) + cobj.cmyk_k
     
-    return CMYColor(cmy_c, cmy_m, cmy_y)
+    return CMYColor._from_trusted(cmy_c, cmy_m, cmy_y)
 
 
 CONVERSION_TABLE = {
@@ -903,53 +859,132 @@ CONVERSION_TABLE = {
 }
 
 
+# The process-wide ConversionCache used by convert_color(), or None. Set
+# through colormath.conversion_cache.
+_conversion_cache = None
+
+# Classes whose instances convert themselves with a convert() method, such as
+# ColorArray and FrozenColor. Their modules import this one, so they register
+# themselves here on import instead of being imported on every call.
+_self_converting_classes = ()
+# The FrozenColor mixin and colormath.color_frozen.freeze(), once that module
+# is imported. Conversions to frozen classes are frozen.
+_frozen_color_cs = None
+_freeze = None
+
+
+def _register_self_converting(color_cs):
+    """
+    Makes :py:func:`convert_color` hand instances of `color_cs` to their own
+    ``convert()`` method.
+    """
+
+    global _self_converting_classes
+    _self_converting_classes += (color_cs,)
+
+
+def _get_color_space(color_cs):
+    """
+    :rtype: type
+    :returns: The first class in `color_cs`'s MRO that has a conversion
+        table, so that sub-classes (such as the views in
+        :py:mod:`colormath.color_arrays`) convert like their parent class.
+    """
+
+    for cls in color_cs.__mro__:
+        if cls.__name__ in CONVERSION_TABLE:
+            return cls
+    return color_cs
+
+
 def convert_color(color, target_cs, *args, **kwargs):
     """
     Converts the color to the designated color space.
 
-    :param color: A Color instance to convert.
+    :param color: A Color instance to convert, or a
+        :py:class:`colormath.color_arrays.ColorArray`.
     :param target_cs: The Color class to convert to. Note that this is not
         an instance, but a class.
-    :returns: An instance of the type passed in as ``target_cs``.
+    :returns: An instance of the type passed in as ``target_cs``. Color
+        arrays are converted to the matching color array class. Frozen
+        colors (see :py:mod:`colormath.color_frozen`) are converted to
+        frozen colors and remember their results.
     :raises: :py:exc:`colormath.color_exceptions.UndefinedConversionError`
         if conversion between the two color spaces isn't possible.
     """
 
+    if isinstance(color, _self_converting_classes):
+        return color.convert(target_cs, *args, **kwargs)
+    if _conversion_cache is not None:
+        new_color = _conversion_cache.convert(
+            color, target_cs, *args, **kwargs)
+    else:
+        new_color = _convert_color(color, target_cs, *args, **kwargs)
+    return _freeze_if_frozen(color, target_cs, new_color)
+
+
+def _freeze_if_frozen(color, target_cs, new_color):
+    """
+    :returns: `new_color`, frozen if :py:func:`convert_color` would have
+        frozen it: that is, if `color` or `target_cs` is frozen.
+    """
+
+    if _frozen_color_cs is not None and (
+            isinstance(color, _frozen_color_cs) or
+            isinstance(target_cs, type) and
+            issubclass(target_cs, _frozen_color_cs)):
+        return _freeze(new_color)
+    return new_color
+
+
+def _convert_color(color, target_cs, *args, **kwargs):
+    """
+    Does the work for :py:func:`convert_color` on a single color object.
+    """
+
     if isinstance(target_cs, str):
         raise ValueError("target_cs parameter must be a Color object.")
     if not issubclass(target_cs, ColorBase):
         raise ValueError("target_cs parameter must be a Color object.")
 
     # Find the origin color space's conversion table.
-    cs_table = CONVERSION_TABLE[color.__class__.__name__]
+    source_cs = _get_color_space(color.__class__)
+    cs_table = CONVERSION_TABLE[source_cs.__name__]
     try:
         # Look up the conversion path for the specified color space.
-        conversions = cs_table[target_cs.__name__]
+        conversions = cs_table[_get_color_space(target_cs).__name__]
     except KeyError:
         raise UndefinedConversionError(
-            color.__class__.__name__,
+            source_cs.__name__,
             target_cs.__name__,
         )
 
-    logger.debug('Converting %s to %s', color, target_cs)
-    logger.debug(' @ Conversion path: %s', conversions)
-
     # Start with original color in case we convert to the same color space.
     new_color = color
-    # Iterate through the list of functions for the conversion path, storing
-    # the results in a dictionary via update(). This way the user has access
-    # to all of the variables involved in the conversion.
+    # Tracing is checked once per conversion, so the untraced loop stays
+    # free of it.
+    if conversion_trace._tracer is not None:
+        return _convert_color_traced(new_color, conversions, args, kwargs)
+    # Iterate through the list of functions for the conversion path.
     for func in conversions:
-        # Execute the function in this conversion step and store the resulting
-        # Color object.
-        logger.debug(' * Conversion: %s passed to %s()',
-                     new_color.__class__.__name__, func)
-        logger.debug(' |->  in %s', new_color)
-
         if func:
             # This can be None if you try to convert a color to the color
             # space that is already in. IE: XYZ->XYZ.
             new_color = func(new_color, *args, **kwargs)
+    return new_color
+
+
+def _convert_color_traced(new_color, conversions, args, kwargs):
+    """
+    The conversion loop of :py:func:`_convert_color`, sending each step to
+    the tracer in :py:mod:`colormath.conversion_trace`.
+    """
 
-        logger.debug(' |-< out %s', new_color)
+    for func in conversions:
+        if func:
+            old_color = new_color
+            new_color = func(new_color, *args, **kwargs)
+            conversion_trace._emit(
+                func, (old_color,), (new_color,),
+                {'args': args, 'kwargs': kwargs})
     return new_color
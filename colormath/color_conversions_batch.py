@@ -0,0 +1,398 @@
+"""
+Batch conversion of many colors. :py:func:`convert_many` takes and returns
+rows of a NumPy array instead of color objects, so a batch can be split
+across processes without pickling millions of objects.
+:py:func:`convert_colors` and :py:class:`BatchingConverter` work with color
+objects and group them into vectorized batches behind the scenes.
+"""
+
+import logging
+import threading
+import time
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python < 3.8. convert_many() then always converts in this process.
+    shared_memory = None
+
+import numpy
+
+from colormath.color_conversions import _get_color_space, _freeze_if_frozen
+from colormath.color_conversions_matrix import convert_color_matrix, \
+    _convert_color_matrix, _META_ATTRIBUTES
+
+logger = logging.getLogger(__name__)
+
+# BatchingConverter's clock, which changes to the system time don't affect.
+# Python 2 only has the wall clock.
+_monotonic = getattr(time, 'monotonic', time.time)
+
+# State for slices converted in this process. Set by _init_worker_state().
+_worker_state = {}
+
+
+def _init_worker_state(input_name, output_name, input_shape, output_shape,
+                       source_cs, target_cs, source_kwargs, kwargs):
+    """
+    Attaches to the shared input and output arrays by name. Used as the
+    multiprocessing pool initializer.
+    """
+
+    input_shm = shared_memory.SharedMemory(name=input_name)
+    output_shm = shared_memory.SharedMemory(name=output_name)
+    _worker_state.update(
+        # The SharedMemory objects must outlive the arrays built on them.
+        shm=(input_shm, output_shm),
+        values=numpy.ndarray(input_shape, dtype=float, buffer=input_shm.buf),
+        result=numpy.ndarray(output_shape, dtype=float, buffer=output_shm.buf),
+        source_cs=source_cs,
+        target_cs=target_cs,
+        source_kwargs=source_kwargs,
+        kwargs=kwargs,
+    )
+
+
+def _convert_slice(rows):
+    """
+    Converts one contiguous slice of the shared input array.
+    """
+
+    state = _worker_state
+    state['result'][rows] = convert_color_matrix(
+        state['values'][rows], state['source_cs'], state['target_cs'],
+        state['source_kwargs'], **state['kwargs'])
+    return rows
+
+
+def convert_many(values, source_cs, target_cs, processes=1,
+                 source_kwargs=None, **kwargs):
+    """
+    Converts every row of `values` from `source_cs` to `target_cs` with
+    :py:func:`colormath.color_conversions_matrix.convert_color_matrix`.
+
+    With ``processes > 1`` the input and output arrays are placed in
+    :py:mod:`multiprocessing.shared_memory`. Worker processes attach to them
+    by name and convert contiguous slices, so only slice bounds are pickled.
+    Before Python 3.8, which added shared memory, `processes` is ignored and
+    the rows are converted in this process.
+
+    :param values: An ``(n, k)`` array. Each row holds one color's values in
+        the order of ``source_cs.VALUES``.
+    :param source_cs: The Color class the rows are in.
+    :param target_cs: The Color class to convert to.
+    :param int processes: How many processes convert slices.
+    :param dict source_kwargs: Extra constructor kwargs shared by every
+        source color, such as ``observer``, ``illuminant`` or
+        ``is_upscaled``.
+    :param kwargs: Passed on to each conversion step, as with
+        :py:func:`colormath.color_conversions.convert_color`.
+    :rtype: numpy.ndarray
+    :returns: An ``(n, len(target_cs.VALUES))`` array of target values.
+    :raises: ValueError if `values` has the wrong number of columns.
+    """
+
+    values = numpy.array(values, dtype=float, ndmin=2)
+    if values.shape[1] != len(source_cs.VALUES):
+        raise ValueError(
+            "%s has %d values, got %d columns." % (
+                source_cs.__name__, len(source_cs.VALUES), values.shape[1]))
+    source_kwargs = source_kwargs or {}
+    output_shape = (len(values), len(target_cs.VALUES))
+
+    if processes == 1 or len(values) < processes or shared_memory is None:
+        return convert_color_matrix(
+            values, source_cs, target_cs, source_kwargs, **kwargs)
+
+    import multiprocessing
+
+    input_shm = shared_memory.SharedMemory(create=True, size=values.nbytes)
+    output_shm = shared_memory.SharedMemory(
+        create=True, size=max(1, numpy.prod(output_shape)) * 8)
+    try:
+        shared_values = numpy.ndarray(
+            values.shape, dtype=float, buffer=input_shm.buf)
+        shared_values[:] = values
+        shared_result = numpy.ndarray(
+            output_shape, dtype=float, buffer=output_shm.buf)
+
+        # A few slices per process evens out uneven conversion costs.
+        slice_size = -(-len(values) // (processes * 4))
+        slices = [slice(start, start + slice_size)
+                  for start in range(0, len(values), slice_size)]
+        logger.debug("Converting %d colors in %d slices on %d processes",
+                     len(values), len(slices), processes)
+
+        pool = multiprocessing.Pool(
+            processes, initializer=_init_worker_state,
+            initargs=(input_shm.name, output_shm.name, values.shape,
+                      output_shape, source_cs, target_cs, source_kwargs,
+                      kwargs))
+        try:
+            for _ in pool.imap_unordered(_convert_slice, slices):
+                pass
+        finally:
+            pool.close()
+            pool.join()
+
+        result = shared_result.copy()
+        del shared_values, shared_result
+    finally:
+        input_shm.close()
+        input_shm.unlink()
+        output_shm.close()
+        output_shm.unlink()
+    return result
+
+
+def _get_color_meta(color):
+    """
+    :rtype: tuple
+    :returns: The ``(name, value)`` pairs of the color's metadata attributes,
+        such as its observer and illuminant.
+    """
+
+    return tuple((name, getattr(color, name))
+                 for name in _META_ATTRIBUTES if hasattr(color, name))
+
+
+def convert_colors(colors, target_cs, *args, **kwargs):
+    """
+    Converts a sequence of Color objects to `target_cs` with
+    :py:func:`colormath.color_conversions_matrix.convert_color_matrix`.
+    Colors are grouped by class and metadata, so each group is converted as
+    one matrix. The colors may come from any mix of color spaces.
+
+    :param colors: A sequence of Color instances.
+    :param target_cs: The Color class to convert to.
+    :param kwargs: Passed on to each conversion step, as with
+        :py:func:`colormath.color_conversions.convert_color`.
+    :rtype: list
+    :returns: Instances of `target_cs`, in the same order as `colors`.
+        As with :py:func:`colormath.color_conversions.convert_color`, they
+        are frozen if the source color or `target_cs` is frozen.
+    """
+
+    groups = {}
+    for i, color in enumerate(colors):
+        key = (_get_color_space(color.__class__), _get_color_meta(color))
+        groups.setdefault(key, []).append(i)
+
+    color_cs = _get_color_space(target_cs)
+    result = [None] * len(colors)
+    for (source_cs, meta), indices in groups.items():
+        values = [colors[i].get_value_tuple() for i in indices]
+        converted, target_meta = _convert_color_matrix(
+            values, source_cs, target_cs, dict(meta), *args, **kwargs)
+        # _from_trusted() takes the values, then the metadata.
+        trusted_meta = [target_meta[name] for name in _META_ATTRIBUTES
+                        if name in target_meta]
+        for i, row in zip(indices, converted.tolist()):
+            result[i] = _freeze_if_frozen(
+                colors[i], target_cs,
+                color_cs._from_trusted(*(row + trusted_meta)))
+    return result
+
+
+class ConversionFuture(object):
+    """
+    The pending result of a :py:meth:`BatchingConverter.submit` call.
+    """
+
+    __slots__ = ('_event', '_result', '_exception')
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+        self._exception = None
+
+    def done(self):
+        """
+        :rtype: bool
+        :returns: ``True`` once the conversion has finished or failed.
+        """
+
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """
+        Waits for the conversion and returns the converted color.
+
+        :param float timeout: Seconds to wait. Waits forever if ``None``.
+        :raises: The conversion's exception if it failed, or RuntimeError if
+            the timeout ran out first.
+        """
+
+        if not self._event.wait(timeout):
+            raise RuntimeError("Timed out waiting for a batched conversion.")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def _set_result(self, result):
+        self._result = result
+        self._event.set()
+
+    def _set_exception(self, exception):
+        self._exception = exception
+        self._event.set()
+
+
+class BatchingConverter(object):
+    """
+    A drop-in replacement for
+    :py:func:`colormath.color_conversions.convert_color` for programs that
+    convert one color at a time from many threads. Calls are queued and a
+    background thread converts them in batches with
+    :py:func:`convert_colors`.
+
+    A batch starts once it holds `max_batch_size` colors, or `max_latency`
+    seconds after its oldest color was queued.
+
+    :param float max_latency: The longest a color waits for its batch to
+        fill up, in seconds.
+    :param int max_batch_size: The most colors converted in one batch.
+    """
+
+    def __init__(self, max_latency=0.002, max_batch_size=1024):
+        self.max_latency = max_latency
+        self.max_batch_size = max_batch_size
+        self._condition = threading.Condition()
+        # (color, target_cs, args, kwargs, future, queued_at) tuples, with
+        # queued_at from _monotonic().
+        self._pending = []
+        self._closed = False
+        self._thread = None
+        self._stats = {'batches': 0, 'colors': 0, 'largest_batch': 0,
+                       'queue_wait': 0.0}
+
+    def submit(self, color, target_cs, *args, **kwargs):
+        """
+        Queues a conversion. Takes the same arguments as
+        :py:func:`colormath.color_conversions.convert_color`.
+
+        :rtype: ConversionFuture
+        """
+
+        future = ConversionFuture()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BatchingConverter has been closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='BatchingConverter')
+                self._thread.daemon = True
+                self._thread.start()
+            self._pending.append(
+                (color, target_cs, args, kwargs, future, _monotonic()))
+            # The worker only needs waking for a new batch or a full one.
+            if len(self._pending) in (1, self.max_batch_size):
+                self._condition.notify()
+        return future
+
+    def convert_color(self, color, target_cs, *args, **kwargs):
+        """
+        Queues a conversion and waits for its result. Takes the same
+        arguments and returns the same result as
+        :py:func:`colormath.color_conversions.convert_color`.
+        """
+
+        return self.submit(color, target_cs, *args, **kwargs).result()
+
+    def get_stats(self):
+        """
+        :rtype: dict
+        :returns: The number of ``batches`` and ``colors`` converted so far,
+            the ``largest_batch``, the ``mean_batch_size``, and the total
+            and mean ``queue_wait`` in seconds.
+        """
+
+        with self._condition:
+            stats = dict(self._stats)
+        batches = stats['batches'] or 1
+        colors = stats['colors'] or 1
+        stats['mean_batch_size'] = stats['colors'] / float(batches)
+        stats['mean_queue_wait'] = stats['queue_wait'] / colors
+        return stats
+
+    def close(self):
+        """
+        Converts anything still queued, then stops the background thread.
+        """
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _run(self):
+        """
+        The background thread's loop: waits for a batch, then converts it.
+        """
+
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                deadline = self._pending[0][-1] + self.max_latency
+                while len(self._pending) < self.max_batch_size and not self._closed:
+                    remaining = deadline - _monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._pending[:self.max_batch_size]
+                del self._pending[:self.max_batch_size]
+            try:
+                self._run_batch(batch)
+            except Exception as exception:
+                # Keep the thread alive for later batches, and don't leave
+                # anyone in this one waiting.
+                for _, _, _, _, future, _ in batch:
+                    if not future.done():
+                        future._set_exception(exception)
+
+    def _run_batch(self, batch):
+        """
+        Converts one batch, grouped by target and conversion arguments.
+        Conversions with unhashable arguments, such as an
+        ``illuminant_override`` array, are converted on their own.
+        """
+
+        started = _monotonic()
+        groups = {}
+        for color, target_cs, args, kwargs, future, _ in batch:
+            try:
+                key = (target_cs, args, tuple(sorted(kwargs.items())))
+                group = groups.setdefault(key, (target_cs, args, kwargs, [], []))
+            except TypeError:
+                group = groups[id(future)] = (target_cs, args, kwargs, [], [])
+            group[3].append(color)
+            group[4].append(future)
+
+        for target_cs, args, kwargs, colors, futures in groups.values():
+            try:
+                results = convert_colors(colors, target_cs, *args, **kwargs)
+            except Exception as exception:
+                for future in futures:
+                    future._set_exception(exception)
+                continue
+            for future, result in zip(futures, results):
+                future._set_result(result)
+
+        with self._condition:
+            self._stats['batches'] += 1
+            self._stats['colors'] += len(batch)
+            self._stats['largest_batch'] = max(
+                self._stats['largest_batch'], len(batch))
+            self._stats['queue_wait'] += sum(
+                started - queued_at for _, _, _, _, _, queued_at in batch)
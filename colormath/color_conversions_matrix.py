@@ -0,0 +1,404 @@
+"""
+Vectorized conversions between color spaces. The functions in this module
+work on NumPy arrays whose last axis holds a color's coordinates, so a whole
+``(n, 3)`` matrix of colors is converted in one call.
+
+This module also provides two perceptually uniform embeddings, DIN99 and
+CAM02-UCS. Plain Euclidean distance in either space approximates perceived
+color difference. Unlike CIEDE2000, that distance is a true metric, so
+embedded colors can go straight into a KD-tree or a BLAS ``||a - b||^2``
+expansion.
+
+:py:func:`convert_color_matrix` converts a whole matrix along the same paths
+as :py:func:`colormath.color_conversions.convert_color`. Steps with a
+vectorized form run on the whole matrix at once. The rest fall back to
+converting row by row.
+"""
+
+import numpy
+
+from colormath import color_constants
+from colormath import color_conversions
+from colormath import spectral_constants
+from colormath.chromatic_adaptation import _get_adaptation_matrix
+from colormath.color_conversions import convert_color
+from colormath.color_exceptions import InvalidIlluminantError, \
+    UndefinedConversionError
+from colormath.color_objects import ColorBase
+
+
+# CIECAM02 chromatic adaptation and Hunt-Pointer-Estevez matrices.
+CAT02_MATRIX = numpy.array((
+    (0.7328, 0.4296, -0.1624),
+    (-0.7036, 1.6975, 0.0061),
+    (0.0030, 0.0136, 0.9834)))
+HPE_MATRIX = numpy.array((
+    (0.38971, 0.68898, -0.07868),
+    (-0.22981, 1.18340, 0.04641),
+    (0.00000, 0.00000, 1.00000)))
+
+# CIECAM02 surround parameters: (F, c, N_c).
+CIECAM02_SURROUNDS = {
+    'average': (1.0, 0.69, 1.0),
+    'dim': (0.9, 0.59, 0.9),
+    'dark': (0.8, 0.525, 0.8),
+}
+
+# Default viewing conditions: a 64 lux ambient with a grey world background.
+CIECAM02_DEFAULT_L_A = 64.0 / numpy.pi / 5.0
+CIECAM02_DEFAULT_Y_B = 20.0
+
+
+def _get_illuminant_xyz(observer, illuminant):
+    """
+    :rtype: numpy.ndarray
+    :returns: The XYZ coordinates of the given illuminant's white point, as
+        a shared read-only array.
+    """
+
+    return color_constants.ILLUMINANT_XYZ[(str(observer), illuminant.lower())]
+
+
+# noinspection PyPep8Naming
+def Lab_to_XYZ(lab_matrix, observer='2', illuminant='d50'):
+    """
+    Converts an ``(..., 3)`` array of Lab colors to XYZ.
+    """
+
+    illum = _get_illuminant_xyz(observer, illuminant)
+    lab_matrix = numpy.asarray(lab_matrix, dtype=float)
+
+    xyz_y = (lab_matrix[..., 0] + 16.0) / 116.0
+    xyz_x = lab_matrix[..., 1] / 500.0 + xyz_y
+    xyz_z = xyz_y - lab_matrix[..., 2] / 200.0
+
+    xyz = numpy.stack((xyz_x, xyz_y, xyz_z), axis=-1)
+    cubed = numpy.power(xyz, 3)
+    xyz = numpy.where(
+        cubed > color_constants.CIE_E, cubed, (xyz - 16.0 / 116.0) / 7.787)
+    return xyz * illum
+
+
+# noinspection PyPep8Naming
+def Lab_to_DIN99(lab_matrix):
+    """
+    Converts an ``(..., 3)`` array of Lab colors to DIN99 (DIN 6176)
+    L99, a99, b99 coordinates.
+    """
+
+    lab_matrix = numpy.asarray(lab_matrix, dtype=float)
+    cos_16 = numpy.cos(numpy.radians(16.0))
+    sin_16 = numpy.sin(numpy.radians(16.0))
+
+    L99 = 105.51 * numpy.log1p(0.0158 * lab_matrix[..., 0])
+
+    e = lab_matrix[..., 1] * cos_16 + lab_matrix[..., 2] * sin_16
+    f = 0.7 * (lab_matrix[..., 2] * cos_16 - lab_matrix[..., 1] * sin_16)
+    G = numpy.sqrt(numpy.power(e, 2) + numpy.power(f, 2))
+
+    # C99 = ln(1 + 0.045 G) / 0.045, applied along the (e, f) direction.
+    # The scale factor tends to 1 as G tends to 0.
+    safe_G = numpy.where(G > 0, 0.045 * G, 1.0)
+    scale = numpy.where(G > 0, numpy.log1p(safe_G) / safe_G, 1.0)
+
+    return numpy.stack((L99, e * scale, f * scale), axis=-1)
+
+
+# noinspection PyPep8Naming
+def _ciecam02_forward(xyz_matrix, white_xyz, L_A, Y_b, surround):
+    """
+    The CIECAM02 forward model. XYZ and the white point are on a 0-100 scale.
+
+    :rtype: tuple
+    :returns: The lightness J, colorfulness M and hue angle h (radians) as
+        arrays.
+    """
+
+    F, c, N_c = CIECAM02_SURROUNDS[surround]
+    Y_w = white_xyz[1]
+
+    # Degree of adaptation.
+    D = F * (1 - (1 / 3.6) * numpy.exp((-L_A - 42) / 92.0))
+    D = min(max(D, 0.0), 1.0)
+
+    k = 1 / (5 * L_A + 1)
+    F_L = 0.2 * k ** 4 * (5 * L_A) + 0.1 * (1 - k ** 4) ** 2 * (5 * L_A) ** (1 / 3.0)
+    n = Y_b / Y_w
+    z = 1.48 + numpy.sqrt(n)
+    N_bb = N_cb = 0.725 * n ** -0.2
+
+    # Von Kries adaptation in CAT02 space, then conversion to HPE cone space.
+    rgb_w = numpy.dot(CAT02_MATRIX, white_xyz)
+    adaptation = Y_w * D / rgb_w + 1 - D
+    to_hpe = numpy.dot(HPE_MATRIX, numpy.linalg.inv(CAT02_MATRIX))
+    # Row vectors, so the combined matrix is applied transposed.
+    full_matrix = numpy.dot(to_hpe * adaptation, CAT02_MATRIX).T
+
+    def compress(rgb):
+        scaled = numpy.power(F_L * numpy.fabs(rgb) / 100.0, 0.42)
+        return numpy.sign(rgb) * 400 * scaled / (27.13 + scaled) + 0.1
+
+    rgb_a = compress(numpy.dot(xyz_matrix, full_matrix))
+    rgb_aw = compress(numpy.dot(white_xyz, full_matrix))
+
+    R_a, G_a, B_a = rgb_a[..., 0], rgb_a[..., 1], rgb_a[..., 2]
+    a = R_a - 12 * G_a / 11 + B_a / 11
+    b = (R_a + G_a - 2 * B_a) / 9
+    h = numpy.arctan2(b, a)
+
+    A = (2 * R_a + G_a + B_a / 20 - 0.305) * N_bb
+    A_w = (2 * rgb_aw[0] + rgb_aw[1] + rgb_aw[2] / 20 - 0.305) * N_bb
+    J = 100 * numpy.power(numpy.clip(A / A_w, 0, None), c * z)
+
+    e_t = 0.25 * (numpy.cos(h + 2) + 3.8)
+    t = (50000 / 13.0 * N_c * N_cb * e_t * numpy.sqrt(a * a + b * b)) / \
+        (R_a + G_a + 21 / 20.0 * B_a)
+    # t goes negative for imaginary colors well outside the spectrum locus.
+    # Clamping it keeps the whole Lab box finite instead of returning NaN.
+    C = numpy.power(numpy.clip(t, 0, None), 0.9) * numpy.sqrt(J / 100.0) * \
+        (1.64 - 0.29 ** n) ** 0.73
+    M = C * F_L ** 0.25
+
+    return J, M, h
+
+
+# noinspection PyPep8Naming
+def XYZ_to_CAM02UCS(xyz_matrix, observer='2', illuminant='d50',
+                    L_A=CIECAM02_DEFAULT_L_A, Y_b=CIECAM02_DEFAULT_Y_B,
+                    surround='average'):
+    """
+    Converts an ``(..., 3)`` array of XYZ colors to CAM02-UCS J', a', b'
+    coordinates (Luo, Cui and Li, 2006).
+
+    :param float L_A: Adapting field luminance in cd/m^2.
+    :param float Y_b: Relative luminance of the background.
+    :param str surround: One of ``'average'``, ``'dim'`` or ``'dark'``.
+    """
+
+    white_xyz = _get_illuminant_xyz(observer, illuminant) * 100.0
+    xyz_matrix = numpy.asarray(xyz_matrix, dtype=float) * 100.0
+    J, M, h = _ciecam02_forward(xyz_matrix, white_xyz, L_A, Y_b, surround)
+
+    J_p = 1.7 * J / (1 + 0.007 * J)
+    M_p = numpy.log1p(0.0228 * M) / 0.0228
+    return numpy.stack(
+        (J_p, M_p * numpy.cos(h), M_p * numpy.sin(h)), axis=-1)
+
+
+# noinspection PyPep8Naming
+def Lab_to_CAM02UCS(lab_matrix, observer='2', illuminant='d50', **kwargs):
+    """
+    Converts an ``(..., 3)`` array of Lab colors to CAM02-UCS. The viewing
+    condition kwargs are the same as :py:func:`XYZ_to_CAM02UCS`.
+    """
+
+    xyz_matrix = Lab_to_XYZ(lab_matrix, observer=observer, illuminant=illuminant)
+    return XYZ_to_CAM02UCS(
+        xyz_matrix, observer=observer, illuminant=illuminant, **kwargs)
+
+
+# Color attributes that describe a whole matrix rather than one row. They
+# are threaded through the vectorized steps as a dict.
+_META_ATTRIBUTES = ('observer', 'illuminant', 'rgb_type')
+
+
+def _get_meta(color):
+    """
+    :rtype: dict
+    :returns: The color's metadata attributes, such as its illuminant.
+    """
+
+    return dict((name, getattr(color, name))
+                for name in _META_ATTRIBUTES if hasattr(color, name))
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _Spectral_to_XYZ_step(values, meta, illuminant_override=None, *args,
+                          **kwargs):
+    if illuminant_override is not None:
+        reference_illum = illuminant_override
+    else:
+        try:
+            reference_illum = spectral_constants.REF_ILLUM_TABLE[meta['illuminant']]
+        except KeyError:
+            raise InvalidIlluminantError(meta['illuminant'])
+
+    # The (3, 50) X, Y, Z rows of the stacked observer table.
+    std_obs = spectral_constants.STDOBSERV_TABLE[
+        '10' if meta['observer'] == '10' else '2']
+
+    # Spectral_to_XYZ as one (n, 50) x (50, 3) product.
+    weights = std_obs * reference_illum
+    weights /= weights[1].sum()
+    return numpy.dot(values, weights.T), meta
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _Lab_to_XYZ_step(values, meta, *args, **kwargs):
+    return Lab_to_XYZ(values, meta['observer'], meta['illuminant']), meta
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _XYZ_to_Lab_step(values, meta, *args, **kwargs):
+    temp = values * color_constants.ILLUMINANT_XYZ_RECIPROCAL[
+        (meta['observer'], meta['illuminant'])]
+    temp = numpy.where(
+        temp > color_constants.CIE_E,
+        numpy.power(numpy.maximum(temp, color_constants.CIE_E), 1.0 / 3.0),
+        (7.787 * temp) + (16.0 / 116.0))
+
+    lab_l = (116.0 * temp[..., 1]) - 16.0
+    lab_a = 500.0 * (temp[..., 0] - temp[..., 1])
+    lab_b = 200.0 * (temp[..., 1] - temp[..., 2])
+    return numpy.stack((lab_l, lab_a, lab_b), axis=-1), meta
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _Lab_to_LCHab_step(values, meta, *args, **kwargs):
+    lch_c = numpy.sqrt(numpy.power(values[..., 1], 2) + numpy.power(values[..., 2], 2))
+    lch_h = numpy.degrees(numpy.arctan2(values[..., 2], values[..., 1]))
+    # Same as Lab_to_LCHab: a hue of exactly 0 comes out as 360.
+    lch_h = numpy.where(lch_h > 0, lch_h, 360 - numpy.fabs(lch_h))
+    return numpy.stack((values[..., 0], lch_c, lch_h), axis=-1), meta
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _LCHab_to_Lab_step(values, meta, *args, **kwargs):
+    lch_h = numpy.radians(values[..., 2])
+    lab_a = numpy.cos(lch_h) * values[..., 1]
+    lab_b = numpy.sin(lch_h) * values[..., 1]
+    return numpy.stack((values[..., 0], lab_a, lab_b), axis=-1), meta
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _XYZ_to_RGB_step(values, meta, target_rgb="srgb", *args, **kwargs):
+    target_rgb = target_rgb.lower()
+    target_illum = color_constants.RGB_SPECS[target_rgb]["native_illum"]
+    if meta['illuminant'] != target_illum:
+        # XYZ_to_RGB always adapts with the 2 degree observer.
+        values = numpy.dot(values, _get_adaptation_matrix(
+            meta['illuminant'], target_illum, '2', 'bradford'))
+
+    rgb_matrix = color_constants.RGB_SPECS[target_rgb]["conversions"]["xyz_to_rgb"]
+    linear = numpy.dot(values, rgb_matrix)
+    if target_rgb == "srgb":
+        nonlinear = numpy.where(
+            linear <= 0.0031308, linear * 12.92,
+            1.055 * numpy.power(numpy.maximum(linear, 0.0031308), 1 / 2.4) - 0.055)
+    else:
+        # Same as XYZ_to_RGB, which encodes every other space linearly.
+        nonlinear = linear * 12.92
+    return nonlinear, {'rgb_type': target_rgb}
+
+
+# noinspection PyPep8Naming,PyUnusedLocal
+def _RGB_to_XYZ_step(values, meta, target_illuminant=None, *args, **kwargs):
+    rgb_type = meta['rgb_type']
+    if rgb_type == "srgb":
+        linear = numpy.where(
+            values <= 0.04045, values / 12.92,
+            numpy.power((numpy.maximum(values, 0.04045) + 0.055) / 1.055, 2.4))
+    else:
+        linear = numpy.power(values, color_constants.RGB_SPECS[rgb_type]["gamma"])
+
+    rgb_matrix = color_constants.RGB_SPECS[rgb_type]["conversions"]["rgb_to_xyz"]
+    xyz = numpy.dot(linear, rgb_matrix)
+
+    illuminant = color_constants.RGB_SPECS[rgb_type]["native_illum"]
+    if target_illuminant is None:
+        target_illuminant = illuminant
+    if illuminant != target_illuminant:
+        xyz = numpy.dot(xyz, _get_adaptation_matrix(
+            illuminant, target_illuminant.lower(), '2', 'bradford'))
+        illuminant = target_illuminant.lower()
+    return xyz, {'observer': '2', 'illuminant': illuminant}
+
+
+# Maps the per-color conversion functions in colormath.color_conversions to
+# equivalents taking (values, meta, *args, **kwargs) and returning
+# (values, meta).
+VECTORIZED_CONVERSIONS = {
+    color_conversions.Spectral_to_XYZ: _Spectral_to_XYZ_step,
+    color_conversions.Lab_to_XYZ: _Lab_to_XYZ_step,
+    color_conversions.XYZ_to_Lab: _XYZ_to_Lab_step,
+    color_conversions.Lab_to_LCHab: _Lab_to_LCHab_step,
+    color_conversions.LCHab_to_Lab: _LCHab_to_Lab_step,
+    color_conversions.XYZ_to_RGB: _XYZ_to_RGB_step,
+    color_conversions.RGB_to_XYZ: _RGB_to_XYZ_step,
+}
+
+
+def _convert_color_matrix(values, source_cs, target_cs, source_kwargs,
+                          *args, **kwargs):
+    """
+    Does the work for :py:func:`convert_color_matrix`.
+
+    :rtype: tuple
+    :returns: The converted values, and a dict of the target colors'
+        metadata attributes. The dict is ``None`` if `values` is empty and
+        the path has no vectorized form.
+    """
+
+    if isinstance(target_cs, str) or not issubclass(target_cs, ColorBase):
+        raise ValueError("target_cs parameter must be a Color object.")
+    # Frozen and view classes convert like their color space.
+    source_cs = color_conversions._get_color_space(source_cs)
+    target_cs = color_conversions._get_color_space(target_cs)
+    values = numpy.array(values, dtype=float, ndmin=2)
+    if values.shape[1] != len(source_cs.VALUES):
+        raise ValueError(
+            "%s has %d values, got %d columns." % (
+                source_cs.__name__, len(source_cs.VALUES), values.shape[1]))
+    source_kwargs = source_kwargs or {}
+
+    try:
+        conversions = color_conversions.CONVERSION_TABLE[
+            source_cs.__name__][target_cs.__name__]
+    except KeyError:
+        raise UndefinedConversionError(source_cs.__name__, target_cs.__name__)
+
+    if all(func is None or func in VECTORIZED_CONVERSIONS for func in conversions):
+        # Build one color to validate and fill in the source metadata.
+        first_row = values[0] if len(values) else numpy.zeros(values.shape[1])
+        prototype = source_cs(*first_row, **source_kwargs)
+        meta = _get_meta(prototype)
+        if source_kwargs.get('is_upscaled'):
+            values = values / 255.0
+        for func in conversions:
+            if func:
+                values, meta = VECTORIZED_CONVERSIONS[func](
+                    values, meta, *args, **kwargs)
+        return values, meta
+
+    result = numpy.empty((len(values), len(target_cs.VALUES)))
+    meta = None
+    for i, row in enumerate(values):
+        color = source_cs(*row, **source_kwargs)
+        new_color = convert_color(color, target_cs, *args, **kwargs)
+        result[i] = new_color.get_value_tuple()
+        meta = _get_meta(new_color)
+    return result, meta
+
+
+def convert_color_matrix(values, source_cs, target_cs, source_kwargs=None,
+                         *args, **kwargs):
+    """
+    Converts every row of `values` from `source_cs` to `target_cs`, giving
+    the same results as calling
+    :py:func:`colormath.color_conversions.convert_color` on each row.
+
+    :param values: An ``(n, k)`` array. Each row holds one color's values in
+        the order of ``source_cs.VALUES``.
+    :param source_cs: The Color class the rows are in.
+    :param target_cs: The Color class to convert to.
+    :param dict source_kwargs: Extra constructor kwargs shared by every
+        source color, such as ``observer``, ``illuminant`` or
+        ``is_upscaled``.
+    :rtype: numpy.ndarray
+    :returns: An ``(n, len(target_cs.VALUES))`` array of target values.
+    :raises: :py:exc:`colormath.color_exceptions.UndefinedConversionError`
+        if conversion between the two color spaces isn't possible.
+    """
+
+    return _convert_color_matrix(
+        values, source_cs, target_cs, source_kwargs, *args, **kwargs)[0]
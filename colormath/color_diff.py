@@ -1,38 +1,245 @@
 """
 The functions in this module are used for comparing two LabColor objects
 using various Delta E formulas.
+
+Comparisons between a single pair of colors are computed with plain
+:py:mod:`math` instead of going through the NumPy kernels in
+:py:mod:`colormath.color_diff_matrix`. Building arrays for one row costs far
+more than the arithmetic itself. The scalar formulas below mirror the matrix
+kernels step for step, so both paths return the same values.
+
+The ``*_batch`` functions compare two equally long sequences of LabColor
+objects pairwise and hand the whole batch to the matrix kernels at once.
 """
 
+import math
+
 import numpy
 
 from colormath import color_diff_matrix
+from colormath.color_objects import LabColor
 
 
-def _get_lab_color1_vector(color):
+def _get_lab_color_tuple(color):
     """
-    Converts an LabColor into a NumPy vector.
+    Pulls the Lab coordinates out of an LabColor.
 
     :param LabColor color:
-    :rtype: numpy.ndarray
+    :rtype: tuple
     """
 
-    if not color.__class__.__name__ == 'LabColor':
+    if not isinstance(color, LabColor):
         raise ValueError(
             "Delta E functions can only be used with two LabColor objects.")
-    return numpy.array([color.lab_l, color.lab_a, color.lab_b])
+    return color.lab_l, color.lab_a, color.lab_b
 
 
-def _get_lab_color2_matrix(color):
+def _get_lab_color_batch_matrices(colors1, colors2):
     """
-    Converts an LabColor into a NumPy matrix.
+    Converts two sequences of LabColors into a pair of ``(n, 3)`` NumPy
+    matrices, ready for pairwise comparison. Plain ``(n, 3)`` arrays of Lab
+    values are passed through as floats.
 
-    :param LabColor color:
-    :rtype: numpy.ndarray
+    :param colors1: A sequence of LabColor objects, a LabArray, or an array
+        of Lab values.
+    :param colors2: A sequence of LabColor objects, a LabArray, or an array
+        of Lab values.
+    :rtype: tuple
     """
-    if not color.__class__.__name__ == 'LabColor':
+
+    from colormath.color_arrays import ColorArray, LabArray
+
+    matrices = []
+    spaces = set()
+    for colors in (colors1, colors2):
+        if isinstance(colors, numpy.ndarray):
+            colors = numpy.asarray(colors, dtype=float)
+            if colors.ndim != 2 or colors.shape[1] != 3:
+                raise ValueError(
+                    "Lab value arrays must have shape (n, 3), got %s." % (
+                        colors.shape,))
+            matrices.append(colors)
+            continue
+        if isinstance(colors, ColorArray):
+            if not isinstance(colors, LabArray):
+                raise ValueError(
+                    "Delta E functions can only be used with LabColor objects.")
+            spaces.add((colors.meta['observer'], colors.meta['illuminant']))
+            matrices.append(colors.values)
+            continue
+        colors = list(colors)
+        for color in colors:
+            if not isinstance(color, LabColor):
+                raise ValueError(
+                    "Delta E functions can only be used with LabColor objects.")
+        spaces.update((color.observer, color.illuminant) for color in colors)
+        matrices.append(numpy.array(
+            [(color.lab_l, color.lab_a, color.lab_b) for color in colors],
+            dtype=float).reshape(-1, 3))
+
+    if len(spaces) > 1:
         raise ValueError(
-            "Delta E functions can only be used with two LabColor objects.")
-    return numpy.array([(color.lab_l, color.lab_a, color.lab_b)])
+            "All colors in a Delta E batch must share the same observer and "
+            "illuminant. Got: %s" % ', '.join(sorted(map(str, spaces))))
+    if len(matrices[0]) != len(matrices[1]):
+        raise ValueError(
+            "Delta E batches must be the same length (%d != %d)." % (
+                len(matrices[0]), len(matrices[1])))
+    return matrices[0], matrices[1]
+
+
+def _delta_e_cie1976(lab_color1, lab_color2):
+    """
+    Scalar equivalent of :py:func:`color_diff_matrix.delta_e_cie1976`.
+    """
+
+    L1, a1, b1 = lab_color1
+    L2, a2, b2 = lab_color2
+    return math.sqrt((L1 - L2) ** 2 + (a1 - a2) ** 2 + (b1 - b2) ** 2)
+
+
+# noinspection PyPep8Naming
+def _delta_e_cie1994(lab_color1, lab_color2,
+                     K_L=1, K_C=1, K_H=1, K_1=0.045, K_2=0.015):
+    """
+    Scalar equivalent of :py:func:`color_diff_matrix.delta_e_cie1994`.
+    """
+
+    L1, a1, b1 = lab_color1
+    L2, a2, b2 = lab_color2
+
+    C_1 = math.sqrt(a1 ** 2 + b1 ** 2)
+    C_2 = math.sqrt(a2 ** 2 + b2 ** 2)
+
+    delta_L = L1 - L2
+    delta_C = C_1 - C_2
+
+    delta_H_sq = (a1 - a2) ** 2 + (b1 - b2) ** 2 - delta_C ** 2
+    delta_H = math.sqrt(max(delta_H_sq, 0))
+
+    S_L = 1
+    S_C = 1 + K_1 * C_1
+    S_H = 1 + K_2 * C_1
+
+    return math.sqrt(
+        (delta_L / (K_L * S_L)) ** 2 +
+        (delta_C / (K_C * S_C)) ** 2 +
+        (delta_H / (K_H * S_H)) ** 2)
+
+
+# noinspection PyPep8Naming
+def _delta_e_cmc(lab_color1, lab_color2, pl=2, pc=1):
+    """
+    Scalar equivalent of :py:func:`color_diff_matrix.delta_e_cmc`.
+    """
+
+    L1, a1, b1 = lab_color1
+    L2, a2, b2 = lab_color2
+
+    C_1 = math.sqrt(a1 ** 2 + b1 ** 2)
+    C_2 = math.sqrt(a2 ** 2 + b2 ** 2)
+
+    delta_L = L1 - L2
+    delta_C = C_1 - C_2
+
+    H_1 = math.degrees(math.atan2(b1, a1))
+
+    if H_1 < 0:
+        H_1 += 360
+
+    F = math.sqrt(C_1 ** 4 / (C_1 ** 4 + 1900.0))
+
+    if 164 <= H_1 <= 345:
+        T = 0.56 + abs(0.2 * math.cos(math.radians(H_1 + 168)))
+    else:
+        T = 0.36 + abs(0.4 * math.cos(math.radians(H_1 + 35)))
+
+    if L1 < 16:
+        S_L = 0.511
+    else:
+        S_L = (0.040975 * L1) / (1 + 0.01765 * L1)
+
+    S_C = ((0.0638 * C_1) / (1 + 0.0131 * C_1)) + 0.638
+    S_H = S_C * (F * T + 1 - F)
+
+    delta_H_sq = (a1 - a2) ** 2 + (b1 - b2) ** 2 - delta_C ** 2
+    delta_H = math.sqrt(max(delta_H_sq, 0))
+
+    return math.sqrt(
+        (delta_L / (pl * S_L)) ** 2 +
+        (delta_C / (pc * S_C)) ** 2 +
+        (delta_H / S_H) ** 2)
+
+
+# noinspection PyPep8Naming
+def _delta_e_cie2000(lab_color1, lab_color2, Kl=1, Kc=1, Kh=1):
+    """
+    Scalar equivalent of :py:func:`color_diff_matrix.delta_e_cie2000`.
+    """
+
+    L1, a1, b1 = lab_color1
+    L2, a2, b2 = lab_color2
+
+    avg_Lp = (L1 + L2) / 2.0
+
+    C1 = math.sqrt(a1 ** 2 + b1 ** 2)
+    C2 = math.sqrt(a2 ** 2 + b2 ** 2)
+
+    avg_C1_C2 = (C1 + C2) / 2.0
+
+    G = 0.5 * (1 - math.sqrt(avg_C1_C2 ** 7.0 / (avg_C1_C2 ** 7.0 + 25.0 ** 7.0)))
+
+    a1p = (1.0 + G) * a1
+    a2p = (1.0 + G) * a2
+
+    C1p = math.sqrt(a1p ** 2 + b1 ** 2)
+    C2p = math.sqrt(a2p ** 2 + b2 ** 2)
+
+    avg_C1p_C2p = (C1p + C2p) / 2.0
+
+    h1p = math.degrees(math.atan2(b1, a1p))
+    if h1p < 0:
+        h1p += 360
+
+    h2p = math.degrees(math.atan2(b2, a2p))
+    if h2p < 0:
+        h2p += 360
+
+    if math.fabs(h1p - h2p) > 180:
+        avg_Hp = (360 + h1p + h2p) / 2.0
+    else:
+        avg_Hp = (h1p + h2p) / 2.0
+
+    T = 1 - 0.17 * math.cos(math.radians(avg_Hp - 30)) + \
+        0.24 * math.cos(math.radians(2 * avg_Hp)) + \
+        0.32 * math.cos(math.radians(3 * avg_Hp + 6)) - \
+        0.2 * math.cos(math.radians(4 * avg_Hp - 63))
+
+    # The matrix kernel shifts delta_hp by whole turns using boolean masks;
+    # the same shifts are reproduced here so both paths agree exactly.
+    delta_hp = h2p - h1p
+    if math.fabs(delta_hp) > 180:
+        delta_hp += 360
+    if h2p > h1p:
+        delta_hp -= 720
+
+    delta_Lp = L2 - L1
+    delta_Cp = C2p - C1p
+    delta_Hp = 2 * math.sqrt(C2p * C1p) * math.sin(math.radians(delta_hp) / 2.0)
+
+    S_L = 1 + ((0.015 * (avg_Lp - 50) ** 2) / math.sqrt(20 + (avg_Lp - 50) ** 2.0))
+    S_C = 1 + 0.045 * avg_C1p_C2p
+    S_H = 1 + 0.015 * avg_C1p_C2p * T
+
+    delta_ro = 30 * math.exp(-(((avg_Hp - 275) / 25) ** 2.0))
+    R_C = math.sqrt(avg_C1p_C2p ** 7.0 / (avg_C1p_C2p ** 7.0 + 25.0 ** 7.0))
+    R_T = -2 * R_C * math.sin(2 * math.radians(delta_ro))
+
+    return math.sqrt(
+        (delta_Lp / (S_L * Kl)) ** 2 +
+        (delta_Cp / (S_C * Kc)) ** 2 +
+        (delta_Hp / (S_H * Kh)) ** 2 +
+        R_T * (delta_Cp / (S_C * Kc)) * (delta_Hp / (S_H * Kh)))
 
 
 # noinspection PyPep8Naming
@@ -41,10 +248,8 @@ def delta_e_cie1976(color1, color2):
     Calculates the Delta E (CIE1976) of two colors.
     """
 
-    color1_vector = _get_lab_color1_vector(color1)
-    color2_matrix = _get_lab_color2_matrix(color2)
-    delta_e = color_diff_matrix.delta_e_cie1976(color1_vector, color2_matrix)[0]
-    return numpy.asscalar(delta_e)
+    return _delta_e_cie1976(
+        _get_lab_color_tuple(color1), _get_lab_color_tuple(color2))
 
 
 # noinspection PyPep8Naming
@@ -63,11 +268,9 @@ def delta_e_cie1994(color1, color2, K_L=1, K_C=1, K_H=1, K_1=0.045, K_2=0.015):
       2 textiles
     """
 
-    color1_vector = _get_lab_color1_vector(color1)
-    color2_matrix = _get_lab_color2_matrix(color2)
-    delta_e = color_diff_matrix.delta_e_cie1994(
-        color1_vector, color2_matrix, K_L=K_L, K_C=K_C, K_H=K_H, K_1=K_1, K_2=K_2)[0]
-    return numpy.asscalar(delta_e)
+    return _delta_e_cie1994(
+        _get_lab_color_tuple(color1), _get_lab_color_tuple(color2),
+        K_L=K_L, K_C=K_C, K_H=K_H, K_1=K_1, K_2=K_2)
 
 
 # noinspection PyPep8Naming
@@ -76,11 +279,9 @@ def delta_e_cie2000(color1, color2, Kl=1, Kc=1, Kh=1):
     Calculates the Delta E (CIE2000) of two colors.
     """
 
-    color1_vector = _get_lab_color1_vector(color1)
-    color2_matrix = _get_lab_color2_matrix(color2)
-    delta_e = color_diff_matrix.delta_e_cie2000(
-        color1_vector, color2_matrix, Kl=Kl, Kc=Kc, Kh=Kh)[0]
-    return numpy.asscalar(delta_e)
+    return _delta_e_cie2000(
+        _get_lab_color_tuple(color1), _get_lab_color_tuple(color2),
+        Kl=Kl, Kc=Kc, Kh=Kh)
 
 
 # noinspection PyPep8Naming
@@ -93,8 +294,68 @@ def delta_e_cmc(color1, color2, pl=2, pc=1):
       Perceptability: pl=1, pc=1
     """
 
-    color1_vector = _get_lab_color1_vector(color1)
-    color2_matrix = _get_lab_color2_matrix(color2)
-    delta_e = color_diff_matrix.delta_e_cmc(
-        color1_vector, color2_matrix, pl=pl, pc=pc)[0]
-    return numpy.asscalar(delta_e)
+    return _delta_e_cmc(
+        _get_lab_color_tuple(color1), _get_lab_color_tuple(color2),
+        pl=pl, pc=pc)
+
+
+def delta_e_cie1976_batch(colors1, colors2):
+    """
+    Calculates the Delta E (CIE1976) between each pair of colors in two
+    sequences of LabColor objects.
+
+    :rtype: numpy.ndarray
+    :returns: One Delta E value per pair.
+    """
+
+    matrix1, matrix2 = _get_lab_color_batch_matrices(colors1, colors2)
+    return color_diff_matrix.delta_e_cie1976(matrix1, matrix2)
+
+
+# noinspection PyPep8Naming
+def delta_e_cie1994_batch(colors1, colors2,
+                          K_L=1, K_C=1, K_H=1, K_1=0.045, K_2=0.015):
+    """
+    Calculates the Delta E (CIE1994) between each pair of colors in two
+    sequences of LabColor objects. See :py:func:`delta_e_cie1994` for the
+    meaning of the weighting factors.
+
+    :rtype: numpy.ndarray
+    :returns: One Delta E value per pair.
+    """
+
+    matrix1, matrix2 = _get_lab_color_batch_matrices(colors1, colors2)
+    return color_diff_matrix.delta_e_cie1994(
+        matrix1, matrix2, K_L=K_L, K_C=K_C, K_H=K_H, K_1=K_1, K_2=K_2)
+
+
+# noinspection PyPep8Naming
+def delta_e_cie2000_batch(colors1, colors2, Kl=1, Kc=1, Kh=1, fast=False):
+    """
+    Calculates the Delta E (CIE2000) between each pair of colors in two
+    sequences of LabColor objects.
+
+    :param bool fast: Use the single precision approximation. See
+        :py:func:`colormath.color_diff_matrix.delta_e_cie2000`.
+    :rtype: numpy.ndarray
+    :returns: One Delta E value per pair.
+    """
+
+    matrix1, matrix2 = _get_lab_color_batch_matrices(colors1, colors2)
+    return color_diff_matrix.delta_e_cie2000(
+        matrix1, matrix2, Kl=Kl, Kc=Kc, Kh=Kh, fast=fast)
+
+
+# noinspection PyPep8Naming
+def delta_e_cmc_batch(colors1, colors2, pl=2, pc=1):
+    """
+    Calculates the Delta E (CMC) between each pair of colors in two
+    sequences of LabColor objects. See :py:func:`delta_e_cmc` for the
+    meaning of ``pl`` and ``pc``.
+
+    :rtype: numpy.ndarray
+    :returns: One Delta E value per pair.
+    """
+
+    matrix1, matrix2 = _get_lab_color_batch_matrices(colors1, colors2)
+    return color_diff_matrix.delta_e_cmc(matrix1, matrix2, pl=pl, pc=pc)
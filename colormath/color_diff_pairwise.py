@@ -0,0 +1,222 @@
+"""
+Out-of-core pairwise Delta E. A full distance matrix for a large palette
+does not fit in memory: 150k colors need 90 GB in float32. This module
+computes the matrix in square tiles with the :py:mod:`colormath.color_diff_matrix`
+kernels and writes each tile into a memory-mapped ``.npy`` file.
+
+Finished tiles are recorded in a second ``.npy`` file next to the output
+(``<filename>.tiles.npy``), and the run's method, arguments and a digest of
+its inputs in a small JSON header (``<filename>.run.json``). If a run is
+interrupted, calling :py:func:`pairwise_delta_e` again with the same
+arguments computes only the missing tiles. Tiles can be spread across
+several processes.
+"""
+
+import hashlib
+import json
+import os
+import logging
+import multiprocessing
+
+import numpy
+from numpy.lib.format import open_memmap
+
+from colormath import color_diff_matrix
+
+logger = logging.getLogger(__name__)
+
+PAIRWISE_METHODS = color_diff_matrix.DELTA_E_METHODS
+
+# Methods where swapping standard and sample gives the same value. For these,
+# self-distance runs compute only the upper triangle of tiles and mirror it.
+SYMMETRIC_METHODS = ('cie1976', 'cie2000', 'din99', 'cam02ucs')
+
+# State for tiles computed in this process. Set by _init_tile_state().
+_tile_state = {}
+
+
+def _get_progress_filename(filename):
+    """
+    :rtype: str
+    :returns: The path of the file that records which tiles are finished.
+    """
+
+    return filename + '.tiles.npy'
+
+
+def _get_header_filename(filename):
+    """
+    :rtype: str
+    :returns: The path of the file that describes the run that wrote
+        `filename`.
+    """
+
+    return filename + '.run.json'
+
+
+def _get_run_header(lab_matrix_a, lab_matrix_b, method, kwargs):
+    """
+    :rtype: dict
+    :returns: What identifies a run: the method, the kernel arguments and a
+        SHA-1 digest of both input matrices.
+    """
+
+    digest = hashlib.sha1()
+    for matrix in (lab_matrix_a, lab_matrix_b):
+        digest.update(repr(matrix.shape).encode('ascii'))
+        digest.update(numpy.ascontiguousarray(matrix, dtype='<f8').tobytes())
+    return {
+        'method': method,
+        'kwargs': repr(sorted(kwargs.items())),
+        'digest': digest.hexdigest(),
+    }
+
+
+def _init_tile_state(lab_matrix_a, lab_matrix_b, filename, method, tile_size,
+                     mirror, kwargs):
+    """
+    Opens the output and progress files for writing. Used as the
+    multiprocessing pool initializer, and directly for in-process runs.
+    """
+
+    _tile_state.update(
+        lab_matrix_a=lab_matrix_a,
+        lab_matrix_b=lab_matrix_b,
+        output=open_memmap(filename, mode='r+'),
+        progress=open_memmap(_get_progress_filename(filename), mode='r+'),
+        kernel=PAIRWISE_METHODS[method],
+        tile_size=tile_size,
+        mirror=mirror,
+        kwargs=kwargs,
+    )
+
+
+def _compute_tile(tile):
+    """
+    Computes one tile, flushes it to disk, then marks it finished.
+    """
+
+    state = _tile_state
+    tile_row, tile_col = tile
+    size = state['tile_size']
+    rows = slice(tile_row * size, (tile_row + 1) * size)
+    cols = slice(tile_col * size, (tile_col + 1) * size)
+
+    block = state['kernel'](
+        state['lab_matrix_a'][rows, numpy.newaxis],
+        state['lab_matrix_b'][numpy.newaxis, cols],
+        **state['kwargs'])
+
+    output = state['output']
+    output[rows, cols] = block
+    if state['mirror'] and tile_row != tile_col:
+        output[cols, rows] = block.T
+    # The tile must be on disk before it is marked as finished.
+    output.flush()
+
+    progress = state['progress']
+    progress[tile_row, tile_col] = True
+    progress.flush()
+    return tile
+
+
+def pairwise_delta_e(lab_matrix, filename, lab_matrix_b=None, method='cie2000',
+                     tile_size=1024, dtype=numpy.float32, processes=1,
+                     **kwargs):
+    """
+    Computes the Delta E between every color in `lab_matrix` and every color
+    in `lab_matrix_b`, writing the ``(n, m)`` result into `filename` as a
+    memory-mapped ``.npy`` file. If `lab_matrix_b` is omitted, `lab_matrix`
+    is compared against itself.
+
+    If a matching run was interrupted, only the unfinished tiles are
+    computed. The finished-tile record is left in place, so calling this
+    again on a finished matrix does nothing. Delete the output file to start
+    over.
+
+    :param numpy.ndarray lab_matrix: An ``(n, 3)`` matrix of Lab values.
+    :param str filename: Where to write the distance matrix.
+    :param str method: One of the keys of :py:data:`PAIRWISE_METHODS`.
+    :param int tile_size: Rows and columns per tile. Peak memory per process
+        is a few dozen times ``tile_size ** 2`` floats.
+    :param int processes: How many processes compute tiles.
+    :param kwargs: Passed on to the Delta E kernel.
+    :rtype: numpy.memmap
+    :returns: The distance matrix, opened read-only.
+    :raises: ValueError if the method is unknown or the existing files don't
+        match this run.
+    """
+
+    if method not in PAIRWISE_METHODS:
+        raise ValueError("Invalid pairwise Delta E method: %s" % method)
+
+    lab_matrix_a = numpy.asarray(lab_matrix, dtype=float)
+    mirror = lab_matrix_b is None and method in SYMMETRIC_METHODS
+    if lab_matrix_b is None:
+        lab_matrix_b = lab_matrix_a
+    lab_matrix_b = numpy.asarray(lab_matrix_b, dtype=float)
+
+    shape = (len(lab_matrix_a), len(lab_matrix_b))
+    tile_shape = (-(-shape[0] // tile_size), -(-shape[1] // tile_size))
+    progress_filename = _get_progress_filename(filename)
+    header_filename = _get_header_filename(filename)
+    header = _get_run_header(lab_matrix_a, lab_matrix_b, method, kwargs)
+
+    if os.path.exists(filename) and os.path.exists(progress_filename):
+        try:
+            with open(header_filename) as header_file:
+                existing_header = json.load(header_file)
+        except (IOError, OSError, ValueError):
+            existing_header = None
+        if existing_header != header:
+            raise ValueError(
+                "Existing output %s was written by a different run (method, "
+                "arguments or input colors)." % filename)
+        output = open_memmap(filename, mode='r')
+        progress = open_memmap(progress_filename, mode='r')
+        if output.shape != shape or output.dtype != numpy.dtype(dtype):
+            raise ValueError(
+                "Existing output %s has shape %s and dtype %s, expected %s and %s." % (
+                    filename, output.shape, output.dtype, shape,
+                    numpy.dtype(dtype)))
+        if progress.shape != tile_shape:
+            raise ValueError(
+                "Existing output %s was written with a different tile_size." % filename)
+        done = numpy.array(progress)
+        del output, progress
+    else:
+        open_memmap(filename, mode='w+', dtype=dtype, shape=shape).flush()
+        open_memmap(progress_filename, mode='w+', dtype=bool,
+                    shape=tile_shape).flush()
+        with open(header_filename, 'w') as header_file:
+            json.dump(header, header_file, sort_keys=True)
+        done = numpy.zeros(tile_shape, dtype=bool)
+
+    pending = [
+        (tile_row, tile_col)
+        for tile_row in range(tile_shape[0])
+        for tile_col in range(tile_row if mirror else 0, tile_shape[1])
+        if not done[tile_row, tile_col]]
+    logger.debug("Pairwise %s: %d of %d tiles pending", method, len(pending),
+                 done.size)
+
+    init_args = (lab_matrix_a, lab_matrix_b, filename, method, tile_size,
+                 mirror, kwargs)
+    if processes == 1:
+        _init_tile_state(*init_args)
+        try:
+            for tile in pending:
+                _compute_tile(tile)
+        finally:
+            _tile_state.clear()
+    elif pending:
+        pool = multiprocessing.Pool(
+            processes, initializer=_init_tile_state, initargs=init_args)
+        try:
+            for _ in pool.imap_unordered(_compute_tile, pending):
+                pass
+        finally:
+            pool.close()
+            pool.join()
+
+    return open_memmap(filename, mode='r')
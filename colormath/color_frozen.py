@@ -0,0 +1,288 @@
+"""
+Immutable, hashable variants of the color classes. A frozen color can't be
+changed after it is built, so it can be used as a dict key or set member,
+and it can safely remember its own conversions.
+
+Each frozen color keeps a small memo of its
+:py:func:`colormath.color_conversions.convert_color` results, keyed by the
+target class and conversion arguments. Converting the same frozen color
+again returns the remembered result. The memo holds at most
+:py:data:`MEMO_SIZE` results; the oldest is dropped to make room.
+Conversion results are frozen too, so the memo can't be changed through
+them::
+
+    accent = FrozenRGBColor(0.2, 0.4, 0.8)
+    convert_color(accent, LabColor)   # Converted and remembered.
+    convert_color(accent, LabColor)   # Returned from the memo.
+
+Frozen colors, memo included, are safe to share between threads.
+
+Two frozen colors are equal if they are of the same class and have the same
+values, observer, illuminant and RGB type.
+"""
+
+import threading
+
+from colormath import color_conversions
+from colormath.color_conversions import _convert_color, _get_color_space
+from colormath.color_conversions_matrix import _META_ATTRIBUTES
+from colormath.color_objects import SpectralColor, LabColor, LCHabColor, \
+    LCHuvColor, LuvColor, XYZColor, xyYColor, RGBColor, HSLColor, HSVColor, \
+    CMYColor, CMYKColor
+
+# The slots every frozen class adds to its color class: the cached hash and
+# the conversion memo. A color is frozen once its memo is set.
+_FROZEN_SLOTS = ('_hash', '_memo')
+
+# The most conversion results each frozen color remembers.
+MEMO_SIZE = 8
+
+# Held while adding to any frozen color's memo, so that two threads
+# converting the same color can't both drop the same oldest result.
+_memo_lock = threading.Lock()
+
+
+def _get_trusted_args(color):
+    """
+    :rtype: list
+    :returns: The color's values and metadata, in the order the color
+        class's ``_from_trusted()`` takes them.
+    """
+
+    return list(color.get_value_tuple()) + [
+        getattr(color, name) for name in _META_ATTRIBUTES
+        if hasattr(color, name)]
+
+
+def _make_frozen(frozen_cs, args):
+    """
+    Builds a frozen color from trusted arguments. Also used to unpickle
+    frozen colors.
+    """
+
+    color = frozen_cs._from_trusted(*args)
+    color._freeze()
+    return color
+
+
+class FrozenColor(object):
+    """
+    Mixin for the frozen color classes. Setting any attribute of a frozen
+    color raises an AttributeError.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        super(FrozenColor, self).__init__(*args, **kwargs)
+        self._freeze()
+
+    def _freeze(self):
+        object.__setattr__(self, '_memo', {})
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_memo', None) is not None:
+            raise AttributeError(
+                "%s is immutable. Use thaw() to get a mutable copy." %
+                self.__class__.__name__)
+        super(FrozenColor, self).__setattr__(name, value)
+
+    def _get_key(self):
+        return self.__class__, tuple(_get_trusted_args(self))
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenColor):
+            return NotImplemented
+        return self._get_key() == other._get_key()
+
+    def __ne__(self, other):
+        if not isinstance(other, FrozenColor):
+            return NotImplemented
+        return self._get_key() != other._get_key()
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            object.__setattr__(self, '_hash', hash(self._get_key()))
+            return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return _make_frozen, (self.__class__, _get_trusted_args(self))
+
+    def thaw(self):
+        """
+        :returns: A mutable copy of this color, as an instance of the
+            regular color class.
+        """
+
+        color_cs = _get_color_space(self.__class__)
+        return color_cs._from_trusted(*_get_trusted_args(self))
+
+    def convert(self, target_cs, *args, **kwargs):
+        """
+        Converts this color, or returns the remembered result of an earlier
+        identical conversion. Takes the same arguments as
+        :py:func:`colormath.color_conversions.convert_color`. Only the last
+        :py:data:`MEMO_SIZE` distinct conversions are remembered.
+
+        :returns: A frozen instance of `target_cs`'s color space.
+        """
+
+        try:
+            key = (target_cs, args, tuple(sorted(kwargs.items())))
+            result = self._memo.get(key)
+        except TypeError:
+            # Unhashable conversion arguments can't be remembered.
+            return freeze(_convert_color(self, target_cs, *args, **kwargs))
+        if result is None:
+            result = freeze(_convert_color(self, target_cs, *args, **kwargs))
+            with _memo_lock:
+                if len(self._memo) >= MEMO_SIZE:
+                    # Drop the oldest result. Dicts keep insertion order.
+                    del self._memo[next(iter(self._memo))]
+                self._memo[key] = result
+        return result
+
+
+class FrozenSpectralColor(FrozenColor, SpectralColor):
+    """
+    An immutable :py:class:`colormath.color_objects.SpectralColor`. The array
+    returned by ``get_numpy_view()`` is read-only.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+    @classmethod
+    def from_array(cls, spectral_array, observer='2', illuminant='d50'):
+        color = super(FrozenSpectralColor, cls).from_array(
+            spectral_array, observer=observer, illuminant=illuminant)
+        color._freeze()
+        return color
+
+    def _freeze(self):
+        self._values.flags.writeable = False
+        super(FrozenSpectralColor, self)._freeze()
+
+
+class FrozenLabColor(FrozenColor, LabColor):
+    """
+    An immutable :py:class:`colormath.color_objects.LabColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenLCHabColor(FrozenColor, LCHabColor):
+    """
+    An immutable :py:class:`colormath.color_objects.LCHabColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenLCHuvColor(FrozenColor, LCHuvColor):
+    """
+    An immutable :py:class:`colormath.color_objects.LCHuvColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenLuvColor(FrozenColor, LuvColor):
+    """
+    An immutable :py:class:`colormath.color_objects.LuvColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenXYZColor(FrozenColor, XYZColor):
+    """
+    An immutable :py:class:`colormath.color_objects.XYZColor`.
+    ``apply_adaptation()`` raises an AttributeError; adapt a thawed copy
+    instead.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenxyYColor(FrozenColor, xyYColor):
+    """
+    An immutable :py:class:`colormath.color_objects.xyYColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenRGBColor(FrozenColor, RGBColor):
+    """
+    An immutable :py:class:`colormath.color_objects.RGBColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenHSLColor(FrozenColor, HSLColor):
+    """
+    An immutable :py:class:`colormath.color_objects.HSLColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenHSVColor(FrozenColor, HSVColor):
+    """
+    An immutable :py:class:`colormath.color_objects.HSVColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenCMYColor(FrozenColor, CMYColor):
+    """
+    An immutable :py:class:`colormath.color_objects.CMYColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+class FrozenCMYKColor(FrozenColor, CMYKColor):
+    """
+    An immutable :py:class:`colormath.color_objects.CMYKColor`.
+    """
+
+    __slots__ = _FROZEN_SLOTS
+
+
+FROZEN_COLOR_CLASSES = dict(
+    (_get_color_space(frozen_cs), frozen_cs)
+    for frozen_cs in (
+        FrozenSpectralColor, FrozenLabColor, FrozenLCHabColor,
+        FrozenLCHuvColor, FrozenLuvColor, FrozenXYZColor, FrozenxyYColor,
+        FrozenRGBColor, FrozenHSLColor, FrozenHSVColor, FrozenCMYColor,
+        FrozenCMYKColor))
+
+
+def freeze(color):
+    """
+    :param color: Any color object.
+    :returns: A frozen copy of `color`, or `color` itself if it is already
+        frozen.
+    """
+
+    if isinstance(color, FrozenColor):
+        return color
+    frozen_cs = FROZEN_COLOR_CLASSES[_get_color_space(color.__class__)]
+    return _make_frozen(frozen_cs, _get_trusted_args(color))
+
+
+color_conversions._register_self_converting(FrozenColor)
+color_conversions._frozen_color_cs = FrozenColor
+color_conversions._freeze = freeze
@@ -2,7 +2,6 @@
 This module contains classes to represent various color spaces.
 """
 
-import logging
 import math
 
 import numpy as np
@@ -12,8 +11,6 @@ from colormath import density
 from colormath.chromatic_adaptation import apply_chromatic_adaptation_on_color
 from colormath.color_exceptions import InvalidObserverError, InvalidIlluminantError
 
-logger = logging.getLogger(__name__)
-
 
 class ColorBase(object):
     """
@@ -23,6 +20,30 @@ class ColorBase(object):
     # Attribute names containing color data on the sub-class. For example,
     # the RGBColor would be ['rgb_r', 'rgb_g', 'rgb_b']
     VALUES = []
+    # Sub-classes declare their VALUES (and any OTHER_VALUES) as slots, so
+    # instances carry no per-object __dict__.
+    __slots__ = ()
+
+    @classmethod
+    def _from_trusted(cls, *args):
+        """
+        Builds a color without validating or coercing anything. This is for
+        internal callers, such as the conversion functions, whose inputs are
+        already valid. Sub-classes override it with faster, explicit
+        versions.
+
+        :param args: The float VALUES, then any OTHER_VALUES, then the
+            observer and illuminant for classes that have them. Strings must
+            already be normalized (e.g. lower case illuminants).
+        """
+
+        names = list(cls.VALUES) + list(getattr(cls, 'OTHER_VALUES', []))
+        if issubclass(cls, IlluminantMixin):
+            names += ['observer', 'illuminant']
+        color = cls.__new__(cls)
+        for name, value in zip(names, args):
+            setattr(color, name, value)
+        return color
 
     def get_value_tuple(self):
         """
@@ -65,6 +86,8 @@ class IlluminantMixin(object):
     Color spaces that have a notion of an illuminant should inherit this.
     """
 
+    __slots__ = ('observer', 'illuminant')
+
     # noinspection PyAttributeOutsideInit
     def set_observer(self, observer):
         """
@@ -101,20 +124,16 @@ class IlluminantMixin(object):
         :returns: the color's illuminant's XYZ values.
         """
 
-        try:
-            if observer is None:
-                observer = self.observer
-
-            illums_observer = color_constants.ILLUMINANTS[observer]
-        except KeyError:
-            raise InvalidObserverError(self)
+        if observer is None:
+            observer = self.observer
+        if illuminant is None:
+            illuminant = self.illuminant
 
         try:
-            if illuminant is None:
-                illuminant = self.illuminant
-
-            illum_xyz = illums_observer[illuminant]
-        except (KeyError, AttributeError):
+            illum_xyz = color_constants.WHITE_POINTS[(observer, illuminant)]
+        except (KeyError, TypeError):
+            if observer not in color_constants.ILLUMINANTS:
+                raise InvalidObserverError(self)
             raise InvalidIlluminantError(illuminant)
 
         return {'X': illum_xyz[0], 'Y': illum_xyz[1], 'Z': illum_xyz[2]}
@@ -146,6 +165,9 @@ class SpectralColor(IlluminantMixin, ColorBase):
         'spec_780nm', 'spec_790nm', 'spec_800nm', 'spec_810nm',
         'spec_820nm', 'spec_830nm'
     ]
+    # The reflectances live in one float64 array, in the order of VALUES.
+    # The spec_XXXnm attributes are properties that read and write it.
+    __slots__ = ('_values',)
 
     def __init__(self,
         spec_340nm=0.0, spec_350nm=0.0, spec_360nm=0.0, spec_370nm=0.0,
@@ -168,85 +190,86 @@ class SpectralColor(IlluminantMixin, ColorBase):
 
         super(SpectralColor, self).__init__()
         # Spectral fields
-        self.spec_340nm = float(spec_340nm)
-        self.spec_350nm = float(spec_350nm)
-        self.spec_360nm = float(spec_360nm)
-        self.spec_370nm = float(spec_370nm)
-        # begin Blue wavelengths
-        self.spec_380nm = float(spec_380nm)
-        self.spec_390nm = float(spec_390nm)
-        self.spec_400nm = float(spec_400nm)
-        self.spec_410nm = float(spec_410nm)
-        self.spec_420nm = float(spec_420nm)
-        self.spec_430nm = float(spec_430nm)
-        self.spec_440nm = float(spec_440nm)
-        self.spec_450nm = float(spec_450nm)
-        self.spec_460nm = float(spec_460nm)
-        self.spec_470nm = float(spec_470nm)
-        self.spec_480nm = float(spec_480nm)
-        self.spec_490nm = float(spec_490nm)
-        # end Blue wavelengths
-        # start Green wavelengths
-        self.spec_500nm = float(spec_500nm)
-        self.spec_510nm = float(spec_510nm)
-        self.spec_520nm = float(spec_520nm)
-        self.spec_530nm = float(spec_530nm)
-        self.spec_540nm = float(spec_540nm)
-        self.spec_550nm = float(spec_550nm)
-        self.spec_560nm = float(spec_560nm)
-        self.spec_570nm = float(spec_570nm)
-        self.spec_580nm = float(spec_580nm)
-        self.spec_590nm = float(spec_590nm)
-        self.spec_600nm = float(spec_600nm)
-        self.spec_610nm = float(spec_610nm)
-        # end Green wavelengths
-        # start Red wavelengths
-        self.spec_620nm = float(spec_620nm)
-        self.spec_630nm = float(spec_630nm)
-        self.spec_640nm = float(spec_640nm)
-        self.spec_650nm = float(spec_650nm)
-        self.spec_660nm = float(spec_660nm)
-        self.spec_670nm = float(spec_670nm)
-        self.spec_680nm = float(spec_680nm)
-        self.spec_690nm = float(spec_690nm)
-        self.spec_700nm = float(spec_700nm)
-        self.spec_710nm = float(spec_710nm)
-        self.spec_720nm = float(spec_720nm)
-        # end Red wavelengths
-        self.spec_730nm = float(spec_730nm)
-        self.spec_740nm = float(spec_740nm)
-        self.spec_750nm = float(spec_750nm)
-        self.spec_760nm = float(spec_760nm)
-        self.spec_770nm = float(spec_770nm)
-        self.spec_780nm = float(spec_780nm)
-        self.spec_790nm = float(spec_790nm)
-        self.spec_800nm = float(spec_800nm)
-        self.spec_810nm = float(spec_810nm)
-        self.spec_820nm = float(spec_820nm)
-        self.spec_830nm = float(spec_830nm)
+        self._values = np.array((
+            spec_340nm, spec_350nm, spec_360nm, spec_370nm,
+            # begin Blue wavelengths
+            spec_380nm, spec_390nm, spec_400nm, spec_410nm, spec_420nm,
+            spec_430nm, spec_440nm, spec_450nm, spec_460nm, spec_470nm,
+            spec_480nm, spec_490nm,
+            # end Blue wavelengths
+            # start Green wavelengths
+            spec_500nm, spec_510nm, spec_520nm, spec_530nm, spec_540nm,
+            spec_550nm, spec_560nm, spec_570nm, spec_580nm, spec_590nm,
+            spec_600nm, spec_610nm,
+            # end Green wavelengths
+            # start Red wavelengths
+            spec_620nm, spec_630nm, spec_640nm, spec_650nm, spec_660nm,
+            spec_670nm, spec_680nm, spec_690nm, spec_700nm, spec_710nm,
+            spec_720nm,
+            # end Red wavelengths
+            spec_730nm, spec_740nm, spec_750nm, spec_760nm, spec_770nm,
+            spec_780nm, spec_790nm, spec_800nm, spec_810nm, spec_820nm,
+            spec_830nm), dtype=float)
 
         self.set_observer(observer)
         self.set_illuminant(illuminant)
 
+    @classmethod
+    def from_array(cls, spectral_array, observer='2', illuminant='d50'):
+        """
+        Builds a color from an array of reflectances, without going through
+        the 50 keyword arguments.
+
+        :param spectral_array: 50 values, in the order of :py:attr:`VALUES`.
+            The values are copied.
+        :param str observer: Observer angle. Either ``'2'`` or ``'10'`` degrees.
+        :param illuminant: See :doc:`illuminants` for valid values.
+        :raises: ValueError if `spectral_array` doesn't hold 50 values.
+        """
+
+        values = np.array(spectral_array, dtype=float).ravel()
+        if values.shape != (len(cls.VALUES),):
+            raise ValueError(
+                "SpectralColor needs %d values, got %d." % (
+                    len(cls.VALUES), values.size))
+        color = cls.__new__(cls)
+        color._values = values
+        color.set_observer(observer)
+        color.set_illuminant(illuminant)
+        return color
+
+    @classmethod
+    def _from_trusted(cls, *args):
+        color = cls.__new__(cls)
+        color._values = np.array(args[:len(cls.VALUES)], dtype=float)
+        color.observer, color.illuminant = args[len(cls.VALUES):]
+        return color
+
+    def get_value_tuple(self):
+        return tuple(self._values.tolist())
+
     def get_numpy_array(self):
         """
-        Dump this color into NumPy array.
+        Returns a copy of the color's reflectances as a ``(1, 50)`` NumPy
+        array.
         """
 
-        # This holds the obect's spectral data, and will be passed to
-        # numpy.array() to create a numpy array (matrix) for the matrix math
-        # that will be done during the conversion to XYZ.
-        values = []
+        return self._values[np.newaxis].copy()
 
-        # Use the required value list to build this dynamically. Default to
-        # 0.0, since that ultimately won't affect the outcome due to the math
-        # involved.
-        for val in self.VALUES:
-            values.append(getattr(self, val, 0.0))
+    def get_numpy_view(self):
+        """
+        Returns the color's reflectances as a ``(1, 50)`` NumPy array without
+        copying them. This is a view: changing it changes the color.
+        """
+
+        return self._values[np.newaxis]
 
-        # Create and the actual numpy array/matrix from the spectral list.
-        color_array = np.array([values])
-        return color_array
+    def __copy__(self):
+        color = self.__class__.__new__(self.__class__)
+        color._values = self._values.copy()
+        color.observer = self.observer
+        color.illuminant = self.illuminant
+        return color
 
     def calc_density(self, density_standard=None):
         """
@@ -262,12 +285,32 @@ class SpectralColor(IlluminantMixin, ColorBase):
             return density.auto_density(self)
 
 
+def _make_spectral_property(index):
+    """
+    :returns: A property for one wavelength of a SpectralColor.
+    """
+
+    def fget(self):
+        return float(self._values[index])
+
+    def fset(self, value):
+        self._values[index] = value
+
+    return property(fget, fset)
+
+
+for _index, _name in enumerate(SpectralColor.VALUES):
+    setattr(SpectralColor, _name, _make_spectral_property(_index))
+del _index, _name
+
+
 class LabColor(IlluminantMixin, ColorBase):
     """
     Represents an Lab color.
     """
 
     VALUES = ['lab_l', 'lab_a', 'lab_b']
+    __slots__ = tuple(VALUES)
 
     def __init__(self, lab_l, lab_a, lab_b, observer='2', illuminant='d50'):
         super(LabColor, self).__init__()
@@ -277,6 +320,16 @@ class LabColor(IlluminantMixin, ColorBase):
         self.set_observer(observer)
         self.set_illuminant(illuminant)
 
+    @classmethod
+    def _from_trusted(cls, lab_l, lab_a, lab_b, observer, illuminant):
+        color = cls.__new__(cls)
+        color.lab_l = lab_l
+        color.lab_a = lab_a
+        color.lab_b = lab_b
+        color.observer = observer
+        color.illuminant = illuminant
+        return color
+
 
 class LCHabColor(IlluminantMixin, ColorBase):
     """
@@ -284,6 +337,7 @@ class LCHabColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ['lch_l', 'lch_c', 'lch_h']
+    __slots__ = tuple(VALUES)
 
     def __init__(self, lch_l, lch_c, lch_h, observer='2', illuminant='d50'):
         super(LCHabColor, self).__init__()
@@ -293,6 +347,16 @@ class LCHabColor(IlluminantMixin, ColorBase):
         self.set_observer(observer)
         self.set_illuminant(illuminant)
 
+    @classmethod
+    def _from_trusted(cls, lch_l, lch_c, lch_h, observer, illuminant):
+        color = cls.__new__(cls)
+        color.lch_l = lch_l
+        color.lch_c = lch_c
+        color.lch_h = lch_h
+        color.observer = observer
+        color.illuminant = illuminant
+        return color
+
 
 class LCHuvColor(IlluminantMixin, ColorBase):
     """
@@ -300,6 +364,7 @@ class LCHuvColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ['lch_l', 'lch_c', 'lch_h']
+    __slots__ = tuple(VALUES)
 
     def __init__(self, lch_l, lch_c, lch_h, observer='2', illuminant='d50'):
         super(LCHuvColor, self).__init__()
@@ -309,6 +374,16 @@ class LCHuvColor(IlluminantMixin, ColorBase):
         self.set_observer(observer)
         self.set_illuminant(illuminant)
 
+    @classmethod
+    def _from_trusted(cls, lch_l, lch_c, lch_h, observer, illuminant):
+        color = cls.__new__(cls)
+        color.lch_l = lch_l
+        color.lch_c = lch_c
+        color.lch_h = lch_h
+        color.observer = observer
+        color.illuminant = illuminant
+        return color
+
 
 class LuvColor(IlluminantMixin, ColorBase):
     """
@@ -316,6 +391,7 @@ class LuvColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ['luv_l', 'luv_u', 'luv_v']
+    __slots__ = tuple(VALUES)
 
     def __init__(self, luv_l, luv_u, luv_v, observer='2', illuminant='d50'):
         super(LuvColor, self).__init__()
@@ -325,6 +401,16 @@ class LuvColor(IlluminantMixin, ColorBase):
         self.set_observer(observer)
         self.set_illuminant(illuminant)
 
+    @classmethod
+    def _from_trusted(cls, luv_l, luv_u, luv_v, observer, illuminant):
+        color = cls.__new__(cls)
+        color.luv_l = luv_l
+        color.luv_u = luv_u
+        color.luv_v = luv_v
+        color.observer = observer
+        color.illuminant = illuminant
+        return color
+
 
 class XYZColor(IlluminantMixin, ColorBase):
     """
@@ -332,6 +418,7 @@ class XYZColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ['xyz_x', 'xyz_y', 'xyz_z']
+    __slots__ = tuple(VALUES)
 
     def __init__(self, xyz_x, xyz_y, xyz_z, observer='2', illuminant='d50'):
         super(XYZColor, self).__init__()
@@ -341,21 +428,26 @@ class XYZColor(IlluminantMixin, ColorBase):
         self.set_observer(observer)
         self.set_illuminant(illuminant)
 
+    @classmethod
+    def _from_trusted(cls, xyz_x, xyz_y, xyz_z, observer, illuminant):
+        color = cls.__new__(cls)
+        color.xyz_x = xyz_x
+        color.xyz_y = xyz_y
+        color.xyz_z = xyz_z
+        color.observer = observer
+        color.illuminant = illuminant
+        return color
+
     def apply_adaptation(self, target_illuminant, adaptation='bradford'):
         """
         This applies an adaptation matrix to change the XYZ color's illuminant.
         You'll most likely only need this during RGB conversions.
         """
 
-        logger.debug("  \- Original illuminant: %s", self.illuminant)
-        logger.debug("  \- Target illuminant: %s", target_illuminant)
-
         # If the XYZ values were taken with a different reference white than the
         # native reference white of the target RGB space, a transformation matrix
         # must be applied.
         if self.illuminant != target_illuminant:
-            logger.debug("  \* Applying transformation from %s to %s ",
-                         self.illuminant, target_illuminant)
             # Sets the adjusted XYZ values, and the new illuminant.
             apply_chromatic_adaptation_on_color(
                 color=self,
@@ -370,6 +462,7 @@ class xyYColor(IlluminantMixin, ColorBase):
     """
 
     VALUES = ['xyy_x', 'xyy_y', 'xyy_Y']
+    __slots__ = tuple(VALUES)
 
     def __init__(self, xyy_x, xyy_y, xyy_Y, observer='2', illuminant='d50'):
         super(xyYColor, self).__init__()
@@ -379,6 +472,16 @@ class xyYColor(IlluminantMixin, ColorBase):
         self.set_observer(observer)
         self.set_illuminant(illuminant)
 
+    @classmethod
+    def _from_trusted(cls, xyy_x, xyy_y, xyy_Y, observer, illuminant):
+        color = cls.__new__(cls)
+        color.xyy_x = xyy_x
+        color.xyy_y = xyy_y
+        color.xyy_Y = xyy_Y
+        color.observer = observer
+        color.illuminant = illuminant
+        return color
+
 
 class RGBColor(ColorBase):
     """
@@ -387,6 +490,7 @@ class RGBColor(ColorBase):
 
     VALUES = ['rgb_r', 'rgb_g', 'rgb_b']
     OTHER_VALUES = ['rgb_type']
+    __slots__ = tuple(VALUES + OTHER_VALUES)
 
     def __init__(self, rgb_r, rgb_g, rgb_b, rgb_type='srgb', is_upscaled=False):
         super(RGBColor, self).__init__()
@@ -400,6 +504,15 @@ class RGBColor(ColorBase):
             self.rgb_b = float(rgb_b)
         self.rgb_type = rgb_type.lower()
 
+    @classmethod
+    def _from_trusted(cls, rgb_r, rgb_g, rgb_b, rgb_type):
+        color = cls.__new__(cls)
+        color.rgb_r = rgb_r
+        color.rgb_g = rgb_g
+        color.rgb_b = rgb_b
+        color.rgb_type = rgb_type
+        return color
+
     def __str__(self):
         parent_str = super(RGBColor, self).__str__()
         return '%s [%s]' % (parent_str, self.rgb_type)
@@ -448,6 +561,7 @@ class HSLColor(ColorBase):
 
     VALUES = ['hsl_h', 'hsl_s', 'hsl_l']
     OTHER_VALUES = ['rgb_type']
+    __slots__ = tuple(VALUES + OTHER_VALUES)
 
     def __init__(self, hsl_h, hsl_s, hsl_l, rgb_type='srgb'):
         super(HSLColor, self).__init__()
@@ -456,6 +570,15 @@ class HSLColor(ColorBase):
         self.hsl_l = float(hsl_l)
         self.rgb_type = rgb_type.lower()
 
+    @classmethod
+    def _from_trusted(cls, hsl_h, hsl_s, hsl_l, rgb_type):
+        color = cls.__new__(cls)
+        color.hsl_h = hsl_h
+        color.hsl_s = hsl_s
+        color.hsl_l = hsl_l
+        color.rgb_type = rgb_type
+        return color
+
 
 class HSVColor(ColorBase):
     """
@@ -464,6 +587,7 @@ class HSVColor(ColorBase):
 
     VALUES = ['hsv_h', 'hsv_s', 'hsv_v']
     OTHER_VALUES = ['rgb_type']
+    __slots__ = tuple(VALUES + OTHER_VALUES)
 
     def __init__(self, hsv_h, hsv_s, hsv_v, rgb_type='srgb'):
         super(HSVColor, self).__init__()
@@ -472,6 +596,15 @@ class HSVColor(ColorBase):
         self.hsv_v = float(hsv_v)
         self.rgb_type = rgb_type.lower()
 
+    @classmethod
+    def _from_trusted(cls, hsv_h, hsv_s, hsv_v, rgb_type):
+        color = cls.__new__(cls)
+        color.hsv_h = hsv_h
+        color.hsv_s = hsv_s
+        color.hsv_v = hsv_v
+        color.rgb_type = rgb_type
+        return color
+
 
 class CMYColor(ColorBase):
     """
@@ -479,6 +612,7 @@ class CMYColor(ColorBase):
     """
 
     VALUES = ['cmy_c', 'cmy_m', 'cmy_y']
+    __slots__ = tuple(VALUES)
 
     def __init__(self, cmy_c, cmy_m, cmy_y):
         super(CMYColor, self).__init__()
@@ -486,6 +620,14 @@ class CMYColor(ColorBase):
         self.cmy_m = float(cmy_m)
         self.cmy_y = float(cmy_y)
 
+    @classmethod
+    def _from_trusted(cls, cmy_c, cmy_m, cmy_y):
+        color = cls.__new__(cls)
+        color.cmy_c = cmy_c
+        color.cmy_m = cmy_m
+        color.cmy_y = cmy_y
+        return color
+
 
 class CMYKColor(ColorBase):
     """
@@ -493,6 +635,7 @@ class CMYKColor(ColorBase):
     """
 
     VALUES = ['cmyk_c', 'cmyk_m', 'cmyk_y', 'cmyk_k']
+    __slots__ = tuple(VALUES)
 
     def __init__(self, cmyk_c, cmyk_m, cmyk_y, cmyk_k):
         super(CMYKColor, self).__init__()
@@ -500,3 +643,12 @@ class CMYKColor(ColorBase):
         self.cmyk_m = float(cmyk_m)
         self.cmyk_y = float(cmyk_y)
         self.cmyk_k = float(cmyk_k)
+
+    @classmethod
+    def _from_trusted(cls, cmyk_c, cmyk_m, cmyk_y, cmyk_k):
+        color = cls.__new__(cls)
+        color.cmyk_c = cmyk_c
+        color.cmyk_m = cmyk_m
+        color.cmyk_y = cmyk_y
+        color.cmyk_k = cmyk_k
+        return color
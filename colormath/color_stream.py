@@ -0,0 +1,83 @@
+"""
+Generators for converting and comparing colors from streams too large for
+memory, such as big CSV or JSON lines files.
+
+Rows are buffered into fixed-size blocks with :py:func:`iter_blocks`. Each
+block is then processed by the vectorized conversion and Delta E kernels.
+Every stage is a generator that takes the previous stage's blocks, so memory
+use depends on the block size, not the length of the input. A slow consumer
+simply stops pulling blocks through the pipeline::
+
+    blocks = iter_blocks(csv.reader(f))
+    lab_blocks = convert_blocks(blocks, RGBColor, LabColor,
+                                source_kwargs={'is_upscaled': True})
+    for delta_e in delta_e_blocks(lab_blocks, standard):
+        ...
+"""
+
+import itertools
+
+import numpy
+
+from colormath import color_diff_matrix
+from colormath.color_conversions_matrix import convert_color_matrix
+
+# Rows buffered per block by default.
+DEFAULT_BLOCK_SIZE = 65536
+
+
+def iter_blocks(rows, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Buffers an iterable of rows into ``(m, k)`` float arrays of up to
+    `block_size` rows. Rows may hold numbers or numeric strings.
+
+    :param rows: Any iterable of equally long sequences.
+    :param int block_size: The number of rows per block. Only the last block
+        may be shorter.
+    """
+
+    rows = iter(rows)
+    while True:
+        block = list(itertools.islice(rows, block_size))
+        if not block:
+            return
+        yield numpy.array(block, dtype=float, ndmin=2)
+
+
+def iter_rows(blocks):
+    """
+    Yields the rows of each block in turn, undoing :py:func:`iter_blocks`.
+    """
+
+    for block in blocks:
+        for row in block:
+            yield row
+
+
+def convert_blocks(blocks, source_cs, target_cs, source_kwargs=None,
+                   *args, **kwargs):
+    """
+    Converts each block of `source_cs` values to `target_cs` with
+    :py:func:`colormath.color_conversions_matrix.convert_color_matrix`.
+    The arguments have the same meaning.
+    """
+
+    for block in blocks:
+        yield convert_color_matrix(
+            block, source_cs, target_cs, source_kwargs, *args, **kwargs)
+
+
+def delta_e_blocks(blocks, lab_color_vector,
+                   kernel=color_diff_matrix.delta_e_cie2000, **kwargs):
+    """
+    Yields the Delta E between `lab_color_vector` and each block of Lab
+    values.
+
+    :param kernel: Any of the :py:mod:`colormath.color_diff_matrix` Delta E
+        functions.
+    :param kwargs: Passed on to `kernel`.
+    """
+
+    lab_color_vector = numpy.asarray(lab_color_vector, dtype=float)
+    for block in blocks:
+        yield kernel(lab_color_vector, block, **kwargs)
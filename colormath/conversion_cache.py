@@ -0,0 +1,206 @@
+"""
+An opt-in, process-wide LRU cache for
+:py:func:`colormath.color_conversions.convert_color`. Programs that convert
+the same colors over and over, such as a fixed brand palette, can skip the
+conversion math on repeated calls.
+
+The cache is off by default. Turn it on for the whole process with
+:py:func:`enable_conversion_cache`, or for a block of code with
+:py:func:`cached_conversions`::
+
+    with cached_conversions(max_entries=10000) as cache:
+        for color in palette:
+            convert_color(color, LabColor)
+    print(cache.get_stats())
+
+Entries are keyed by the source class, its values and metadata (observer,
+illuminant and RGB type), the target class and the conversion arguments. The
+cache stores values, not color objects: every hit builds a fresh color, so
+changing a returned color never changes the cache.
+"""
+
+import contextlib
+import sys
+import threading
+from collections import OrderedDict
+
+from colormath import color_conversions
+from colormath.color_conversions_matrix import _META_ATTRIBUTES
+
+# How many entries a cache holds by default.
+DEFAULT_MAX_ENTRIES = 65536
+
+
+def _get_entry_size(key, value):
+    """
+    :rtype: int
+    :returns: An estimate of the bytes held by one cache entry: the key and
+        value tuples and the objects directly inside them.
+    """
+
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+    for item in key[2] + value[1]:
+        size += sys.getsizeof(item)
+    return size
+
+
+class ConversionCache(object):
+    """
+    A thread-safe LRU cache of conversion results. The least recently used
+    entries are evicted once either limit is exceeded.
+
+    :param int max_entries: The most entries to keep. ``None`` means no
+        limit.
+    :param int max_bytes: The most bytes to keep, as estimated by
+        ``sys.getsizeof()`` on each entry's keys and values. ``None`` means
+        no limit.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Key -> (target class, trusted constructor args, entry size).
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def convert(self, color, target_cs, *args, **kwargs):
+        """
+        Converts `color` like
+        :py:func:`colormath.color_conversions.convert_color`, using the
+        cached result if there is one.
+        """
+
+        try:
+            key = (color.__class__, target_cs, color.get_value_tuple(),
+                   getattr(color, 'observer', None),
+                   getattr(color, 'illuminant', None),
+                   getattr(color, 'rgb_type', None),
+                   args, tuple(sorted(kwargs.items())) if kwargs else ())
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                else:
+                    self._stats['misses'] += 1
+        except TypeError:
+            # Unhashable conversion arguments can't be cached.
+            return color_conversions._convert_color(
+                color, target_cs, *args, **kwargs)
+
+        if entry is not None:
+            return entry[0]._from_trusted(*entry[1])
+
+        new_color = color_conversions._convert_color(
+            color, target_cs, *args, **kwargs)
+        value = (new_color.__class__, tuple(
+            list(new_color.get_value_tuple()) +
+            [getattr(new_color, name) for name in _META_ATTRIBUTES
+             if hasattr(new_color, name)]))
+        self._add(key, value)
+        return new_color
+
+    def _add(self, key, value):
+        """
+        Stores a new entry, then evicts old entries until the limits hold.
+        """
+
+        size = _get_entry_size(key, value)
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = value + (size,)
+            self._bytes += size
+            while self._entries and (
+                    (self.max_entries is not None and
+                     len(self._entries) > self.max_entries) or
+                    (self.max_bytes is not None and
+                     self._bytes > self.max_bytes)):
+                self._bytes -= self._entries.popitem(last=False)[1][2]
+                self._stats['evictions'] += 1
+
+    def get_stats(self):
+        """
+        :rtype: dict
+        :returns: The number of ``hits``, ``misses`` and ``evictions`` so
+            far, the ``hit_rate``, and the current number of ``entries`` and
+            estimated ``bytes``.
+        """
+
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / float(lookups) if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """
+        Drops every entry and resets the counters.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+
+def get_conversion_cache():
+    """
+    :rtype: ConversionCache
+    :returns: The cache used by ``convert_color()``, or ``None`` if caching
+        is off.
+    """
+
+    return color_conversions._conversion_cache
+
+
+def enable_conversion_cache(max_entries=DEFAULT_MAX_ENTRIES, max_bytes=None,
+                            cache=None):
+    """
+    Turns on caching in ``convert_color()`` for the whole process.
+
+    :param cache: A :py:class:`ConversionCache` to use. A new one is built
+        from `max_entries` and `max_bytes` if ``None``.
+    :rtype: ConversionCache
+    :returns: The cache now in use.
+    """
+
+    if cache is None:
+        cache = ConversionCache(max_entries=max_entries, max_bytes=max_bytes)
+    color_conversions._conversion_cache = cache
+    return cache
+
+
+def disable_conversion_cache():
+    """
+    Turns off caching in ``convert_color()``. The cache's entries are kept,
+    so it can be enabled again later.
+    """
+
+    color_conversions._conversion_cache = None
+
+
+@contextlib.contextmanager
+def cached_conversions(max_entries=DEFAULT_MAX_ENTRIES, max_bytes=None,
+                       cache=None):
+    """
+    A context manager that enables caching like
+    :py:func:`enable_conversion_cache` and restores the previous cache (or
+    no cache) on exit. Like the global switch, it affects every thread.
+
+    :rtype: ConversionCache
+    """
+
+    previous = get_conversion_cache()
+    cache = enable_conversion_cache(max_entries, max_bytes, cache)
+    try:
+        yield cache
+    finally:
+        color_conversions._conversion_cache = previous
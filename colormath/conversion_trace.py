@@ -0,0 +1,102 @@
+"""
+Opt-in tracing of color conversions. A tracer is a callable that receives a
+:py:class:`TraceEvent` for every step of every conversion: each function on
+a :py:func:`colormath.color_conversions.convert_color` path, and the RGB
+matrices and chromatic adaptations applied inside them.
+
+Tracing is off by default and costs one check per step while off. Turn it on
+for the whole process with :py:func:`set_conversion_tracer`, or collect the
+events of a block of code with :py:func:`traced_conversions`::
+
+    with traced_conversions() as events:
+        convert_color(rgb, LabColor)
+    for event in events:
+        print(event.step.__name__, event.inputs, event.outputs)
+
+:py:func:`logging_tracer` writes the events to the ``colormath`` debug log.
+"""
+
+import contextlib
+import logging
+from collections import namedtuple
+
+logger = logging.getLogger(__name__)
+
+#: One step of a conversion. ``step`` is the function that ran, ``inputs``
+#: and ``outputs`` are tuples of the values it took and returned, and
+#: ``details`` is a dict of its other parameters, such as the illuminants of
+#: a chromatic adaptation.
+TraceEvent = namedtuple('TraceEvent', ('step', 'inputs', 'outputs', 'details'))
+
+# The process-wide tracer, or None. Checked by the conversion functions.
+_tracer = None
+
+
+def _emit(step, inputs, outputs, details=None):
+    """
+    Sends an event to the tracer. Callers check that ``_tracer`` is set
+    first, so nothing is built while tracing is off.
+    """
+
+    tracer = _tracer
+    if tracer is not None:
+        tracer(TraceEvent(step, tuple(inputs), tuple(outputs), details or {}))
+
+
+def logging_tracer(event):
+    """
+    A tracer that writes each event to this module's logger at DEBUG level.
+    """
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('%s(%s) -> %s %s', event.step.__name__,
+                     ', '.join(map(str, event.inputs)),
+                     ', '.join(map(str, event.outputs)), event.details)
+
+
+def get_conversion_tracer():
+    """
+    :returns: The tracer in use, or ``None`` if tracing is off.
+    """
+
+    return _tracer
+
+
+def set_conversion_tracer(tracer):
+    """
+    Sets the tracer for the whole process, and every thread in it.
+
+    :param tracer: A callable that takes a :py:class:`TraceEvent`, or
+        ``None`` to turn tracing off.
+    :returns: The previous tracer, or ``None``.
+    """
+
+    global _tracer
+    previous = _tracer
+    _tracer = tracer
+    return previous
+
+
+@contextlib.contextmanager
+def traced_conversions(tracer=None):
+    """
+    A context manager that sets a tracer like
+    :py:func:`set_conversion_tracer` and restores the previous one on exit.
+
+    :param tracer: The tracer to use. If ``None``, the events are collected
+        in a list instead.
+    :returns: The list of events if no tracer was given, otherwise the
+        tracer.
+    """
+
+    if tracer is None:
+        events = []
+        tracer = events.append
+        result = events
+    else:
+        result = tracer
+    previous = set_conversion_tracer(tracer)
+    try:
+        yield result
+    finally:
+        set_conversion_tracer(previous)
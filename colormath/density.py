@@ -3,8 +3,7 @@ Formulas for density calculation.
 """
 
 from math import log10
-from colormath.density_standards import ANSI_STATUS_T_BLUE, ANSI_STATUS_T_GREEN, \
-    ANSI_STATUS_T_RED, VISUAL_DENSITY_THRESH, ISO_VISUAL
+from colormath import density_standards
 
 
 def ansi_density(color, density_standard):
@@ -21,7 +20,7 @@ def ansi_density(color, density_standard):
     """
 
     # Load the spec_XXXnm attributes into a Numpy array.
-    sample = color.get_numpy_array()
+    sample = color.get_numpy_view()
     # Matrix multiplication
     intermediate = sample * density_standard
     
@@ -44,9 +43,9 @@ def auto_density(color):
     :returns: The density value, with the filter selected automatically.
     """
 
-    blue_density = ansi_density(color, ANSI_STATUS_T_BLUE)
-    green_density = ansi_density(color, ANSI_STATUS_T_GREEN)
-    red_density = ansi_density(color, ANSI_STATUS_T_RED)
+    blue_density = ansi_density(color, density_standards.ANSI_STATUS_T_BLUE)
+    green_density = ansi_density(color, density_standards.ANSI_STATUS_T_GREEN)
+    red_density = ansi_density(color, density_standards.ANSI_STATUS_T_RED)
     
     densities = [blue_density, green_density, red_density]
     min_density = min(densities)
@@ -55,8 +54,8 @@ def auto_density(color):
     
     # See comments in density_standards.py for VISUAL_DENSITY_THRESH to
     # understand what this is doing.
-    if density_range <= VISUAL_DENSITY_THRESH:
-        return ansi_density(color, ISO_VISUAL)
+    if density_range <= density_standards.VISUAL_DENSITY_THRESH:
+        return ansi_density(color, density_standards.ISO_VISUAL)
     elif blue_density > green_density and blue_density > red_density:
         return blue_density
     elif green_density > blue_density and green_density > red_density:
@@ -0,0 +1,260 @@
+"""
+A persistent, content-addressed cache for spectral conversions. Reference
+standards such as ink drawdowns are often measured again and again with
+identical readings. This cache stores their conversions in an SQLite file
+that is shared between processes and runs::
+
+    with SpectralCache('/var/cache/colormath/spectral.db') as cache:
+        lab = cache.convert(spectral_color, LabColor)
+
+Entries are keyed by a SHA-1 hash of the 50 reflectance values, the
+observer and illuminant, the target class, the conversion arguments and the
+colormath version. Identical readings hit the same entry no matter which
+object or process they come from. Once the cache grows past its entry or
+byte limit, the least recently used entries are deleted until it is a tenth
+below the limits.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+import numpy
+
+import colormath
+from colormath import color_objects
+from colormath.color_conversions import convert_color, _get_color_space, \
+    _freeze_if_frozen
+from colormath.color_conversions_matrix import _META_ATTRIBUTES
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS conversions (
+    key TEXT PRIMARY KEY,
+    color_cs TEXT NOT NULL,
+    args TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS conversions_last_used ON conversions (last_used);
+'''
+
+
+def _update_digest(digest, value):
+    """
+    Adds a conversion argument to `digest`. NumPy arrays, such as an
+    ``illuminant_override``, are hashed by their contents.
+    """
+
+    if isinstance(value, numpy.ndarray):
+        value = numpy.ascontiguousarray(value, dtype='<f8')
+        digest.update(repr(value.shape).encode('ascii'))
+        digest.update(value.tobytes())
+    else:
+        digest.update(repr(value).encode('utf-8'))
+    digest.update(b'\0')
+
+
+def get_cache_key(color, target_cs, *args, **kwargs):
+    """
+    :param SpectralColor color: The color to convert.
+    :param target_cs: The Color class to convert to.
+    :rtype: str
+    :returns: The hex digest that identifies this conversion in a
+        :py:class:`SpectralCache`.
+    """
+
+    digest = hashlib.sha1()
+    digest.update(numpy.ascontiguousarray(
+        color.get_numpy_view(), dtype='<f8').tobytes())
+    for value in (colormath.VERSION, color.observer, color.illuminant,
+                  _get_color_space(target_cs).__name__):
+        _update_digest(digest, value)
+    for value in args:
+        _update_digest(digest, value)
+    for name, value in sorted(kwargs.items()):
+        _update_digest(digest, name)
+        _update_digest(digest, value)
+    return digest.hexdigest()
+
+
+class SpectralCache(object):
+    """
+    An SQLite-backed cache of :py:class:`colormath.color_objects.SpectralColor`
+    conversions. It is safe to share one instance between threads, and one
+    file between processes.
+
+    :param str filename: The SQLite database to use. It is created if it
+        doesn't exist.
+    :param int max_entries: The most entries to keep. ``None`` means no
+        limit.
+    :param int max_bytes: The most bytes of stored entries to keep.
+        ``None`` means no limit.
+    :param float timeout: Seconds to wait for another process's lock on the
+        database.
+    :param float touch_interval: A hit only records its use time if the
+        entry hasn't been used for this many seconds. Eviction order is
+        accurate to about this interval, and most hits don't write.
+    """
+
+    def __init__(self, filename, max_entries=100000, max_bytes=None,
+                 timeout=30.0, touch_interval=60.0):
+        self.filename = filename
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._connection = sqlite3.connect(
+            filename, timeout=timeout, check_same_thread=False)
+        with self._lock, self._connection:
+            # Write-ahead logging lets readers and one writer work at once.
+            # Losing the newest entries in a power cut is harmless here.
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.executescript(_SCHEMA)
+            # Running totals, so that inserts don't have to scan the table.
+            # Entries added by other processes are counted at the next
+            # eviction.
+            self._entries, self._bytes = self._count()
+
+    def convert(self, color, target_cs, *args, **kwargs):
+        """
+        Converts `color` like
+        :py:func:`colormath.color_conversions.convert_color`, using the
+        stored result if this conversion has been done before.
+
+        :param SpectralColor color: The color to convert.
+        :raises: ValueError if `color` isn't a SpectralColor.
+        """
+
+        if not isinstance(color, color_objects.SpectralColor):
+            raise ValueError("SpectralCache can only convert SpectralColors.")
+        key = get_cache_key(color, target_cs, *args, **kwargs)
+
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                'SELECT color_cs, args, last_used FROM conversions '
+                'WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                now = time.time()
+                if now - row[2] > self.touch_interval:
+                    self._connection.execute(
+                        'UPDATE conversions SET last_used = ? WHERE key = ?',
+                        (now, key))
+                self._stats['hits'] += 1
+            else:
+                self._stats['misses'] += 1
+
+        if row is not None:
+            color_cs = getattr(color_objects, row[0])
+            return _freeze_if_frozen(
+                color, target_cs, color_cs._from_trusted(*json.loads(row[1])))
+
+        new_color = convert_color(color, target_cs, *args, **kwargs)
+        stored_args = json.dumps(
+            list(new_color.get_value_tuple()) +
+            [getattr(new_color, name) for name in _META_ATTRIBUTES
+             if hasattr(new_color, name)])
+        color_cs = _get_color_space(new_color.__class__).__name__
+        size = len(key) + len(color_cs) + len(stored_args)
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                'INSERT OR IGNORE INTO conversions VALUES (?, ?, ?, ?, ?)',
+                (key, color_cs, stored_args, size, time.time()))
+            # Another process may have stored the same conversion first.
+            if cursor.rowcount == 1:
+                self._entries += 1
+                self._bytes += size
+                if self._is_full():
+                    self._evict()
+        return new_color
+
+    def _count(self):
+        """
+        :returns: The number of entries and bytes in the database.
+        """
+
+        return self._connection.execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM conversions'
+        ).fetchone()
+
+    def _is_full(self):
+        return (self.max_entries is not None and
+                self._entries > self.max_entries) or \
+            (self.max_bytes is not None and self._bytes > self.max_bytes)
+
+    def _evict(self):
+        """
+        Deletes the least recently used entries until the database is a
+        tenth below both limits, so that the next few hundred inserts don't
+        have to evict. Called with the lock held, inside a transaction.
+        """
+
+        # Other processes may have added or evicted entries since the counts
+        # were last taken.
+        self._entries, self._bytes = self._count()
+        excess = 0
+        if self.max_entries is not None:
+            excess = max(0, self._entries - (
+                self.max_entries - self.max_entries // 10))
+        if self.max_bytes is not None:
+            # Count how many of the oldest entries must go to fit.
+            total = self._bytes
+            max_bytes = self.max_bytes - self.max_bytes // 10
+            oldest = 0
+            for size, in self._connection.execute(
+                    'SELECT size FROM conversions ORDER BY last_used'):
+                if total <= max_bytes:
+                    break
+                total -= size
+                oldest += 1
+            excess = max(excess, oldest)
+        if excess > 0:
+            self._connection.execute(
+                'DELETE FROM conversions WHERE key IN ('
+                'SELECT key FROM conversions ORDER BY last_used LIMIT ?)',
+                (excess,))
+            self._entries, self._bytes = self._count()
+            self._stats['evictions'] += excess
+            logger.debug("Evicted %d spectral cache entries", excess)
+
+    def get_stats(self):
+        """
+        :rtype: dict
+        :returns: This instance's ``hits``, ``misses`` and ``evictions``,
+            and the ``entries`` and ``bytes`` currently in the database.
+        """
+
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'], stats['bytes'] = self._count()
+        return stats
+
+    def clear(self):
+        """
+        Deletes every entry from the database and resets the counters.
+        """
+
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM conversions')
+            self._entries = self._bytes = 0
+            self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -8,6 +8,8 @@ the follow two files
 lab-colors is a cPickled list of color names and lab-matrix is a
 cPickled (n,3) numpy array LAB values such that row q maps to
 index q in the lab color list
+
+To compare every color against every other color, see delta_e_pairwise.py.
 """
 
 import sys
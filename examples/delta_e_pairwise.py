@@ -0,0 +1,36 @@
+"""
+Builds the full CIEDE2000 distance matrix for the colors in
+lab_matrix.csv.bz2 and writes it to disk as a memory-mapped .npy file.
+
+The same call scales to palettes far too large for memory. If a run is
+interrupted, running this script again computes only the missing tiles.
+"""
+
+import sys
+import csv
+import bz2
+
+import numpy as np
+
+# Does some sys.path manipulation so we can run examples in-place.
+# noinspection PyUnresolvedReferences
+import example_config
+
+from colormath.color_diff_pairwise import pairwise_delta_e
+
+
+if sys.version_info >= (3, 0):
+    reader = csv.DictReader(bz2.open('lab_matrix.csv.bz2', mode='rt'))
+    lab_matrix = np.array([list(map(float, row.values())) for row in reader])
+else:
+    reader = csv.DictReader(bz2.BZ2File('lab_matrix.csv.bz2'))
+    lab_matrix = np.array([map(float, row.values()) for row in reader])
+
+distances = pairwise_delta_e(
+    lab_matrix, 'delta_e_cie2000.npy', tile_size=256, processes=2)
+
+# The nearest other color for each row, ignoring the zero diagonal.
+masked = np.where(np.eye(len(distances), dtype=bool), np.inf, distances)
+nearest = np.argmin(masked, axis=1)
+print('Color 0 %s is closest to color %d %s (Delta E %.3f)' % (
+    lab_matrix[0], nearest[0], lab_matrix[nearest[0]], masked[0, nearest[0]]))
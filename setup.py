@@ -31,6 +31,9 @@ setup(
     url='https://github.com/gtaylor/python-colormath',
     download_url='http://pypi.python.org/pypi/colormath/',
     packages=['colormath'],
+    package_data={'colormath': ['data/*.npy']},
+    # The constant tables are memory mapped, so they must be real files.
+    zip_safe=False,
     platforms=['Platform Independent'],
     license='BSD',
     classifiers=CLASSIFIERS,
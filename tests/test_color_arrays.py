@@ -0,0 +1,205 @@
+"""
+Tests for array-backed color collections.
+"""
+
+import copy
+import pickle
+import unittest
+
+import numpy
+
+from colormath.color_arrays import LabArray, RGBArray, SpectralArray, \
+    XYZArray, HSLArray
+from colormath.color_conversions import convert_color
+from colormath.color_conversions_batch import convert_colors
+from colormath.color_diff import delta_e_cie2000, delta_e_cmc, \
+    delta_e_cie2000_batch
+from colormath.color_exceptions import InvalidIlluminantError
+from colormath.color_objects import LabColor, RGBColor, SpectralColor, \
+    XYZColor, HSLColor
+
+
+class ColorArrayTestCase(unittest.TestCase):
+    def setUp(self):
+        self.values = numpy.array((
+            (50.0, 10.0, -10.0), (20.0, 0.0, 5.0), (90.0, -30.0, 60.0),
+            (60.0, 45.0, 0.0)))
+        self.labs = LabArray(self.values, illuminant='D65')
+
+    def test_metadata(self):
+        self.assertEqual(self.labs.meta, {'observer': '2', 'illuminant': 'd65'})
+        self.assertRaises(InvalidIlluminantError, LabArray, self.values,
+                          illuminant='nope')
+        self.assertRaises(ValueError, LabArray, numpy.zeros((2, 4)))
+
+    def test_sequence(self):
+        self.assertEqual(len(self.labs), 4)
+        color = self.labs[2]
+        self.assertTrue(isinstance(color, LabColor))
+        self.assertEqual(color.get_value_tuple(), (90.0, -30.0, 60.0))
+        self.assertEqual(color.illuminant, 'd65')
+        self.assertEqual([c.lab_l for c in self.labs], [50.0, 20.0, 90.0, 60.0])
+
+    def test_slices_are_views(self):
+        sliced = self.labs[1:3]
+        self.assertTrue(isinstance(sliced, LabArray))
+        self.assertEqual(len(sliced), 2)
+        self.assertEqual(sliced.meta, self.labs.meta)
+        sliced.values[0, 0] = 25.0
+        self.assertEqual(self.labs.values[1, 0], 25.0)
+
+    def test_array_protocol(self):
+        numpy.testing.assert_array_equal(numpy.asarray(self.labs), self.values)
+        self.assertEqual(numpy.asarray(self.labs, dtype=numpy.float32).dtype,
+                         numpy.float32)
+        self.assertIs(self.labs.__array__(), self.labs.values)
+        copied = self.labs.__array__(copy=True)
+        numpy.testing.assert_array_equal(copied, self.values)
+        copied[0, 0] = -1.0
+        self.assertNotEqual(self.labs.values[0, 0], -1.0)
+
+    def test_from_colors(self):
+        colors = [LabColor(*row, illuminant='d65') for row in self.values]
+        labs = LabArray.from_colors(colors)
+        numpy.testing.assert_array_equal(labs.values, self.values)
+        self.assertEqual(labs.meta, self.labs.meta)
+        colors.append(LabColor(1, 2, 3))
+        self.assertRaises(ValueError, LabArray.from_colors, colors)
+        self.assertRaises(ValueError, LabArray.from_colors, [XYZColor(1, 2, 3)])
+
+    def test_convert_color(self):
+        for target_cs in (RGBColor, XYZColor, HSLColor):
+            result = convert_color(self.labs, target_cs, target_rgb='adobe_rgb')
+            for i, values in enumerate(self.values):
+                expected = convert_color(
+                    LabColor(*values, illuminant='d65'), target_cs,
+                    target_rgb='adobe_rgb')
+                converted = result[i]
+                self.assertEqual(converted.__class__, target_cs)
+                self.assertEqual(repr(converted)[:20], repr(expected)[:20])
+                numpy.testing.assert_allclose(
+                    converted.get_value_tuple(), expected.get_value_tuple(),
+                    atol=1e-12)
+        self.assertTrue(isinstance(self.labs.convert(XYZArray), XYZArray))
+        self.assertTrue(isinstance(self.labs.convert(HSLColor), HSLArray))
+
+    def test_rgb_array(self):
+        rgbs = RGBArray(((255, 128, 0), (0, 0, 0)), is_upscaled=True)
+        self.assertEqual(rgbs.meta, {'rgb_type': 'srgb'})
+        self.assertAlmostEqual(rgbs[0].rgb_g, 128 / 255.0)
+        result = convert_color(rgbs, LabColor)
+        expected = convert_color(RGBColor(255, 128, 0, is_upscaled=True), LabColor)
+        numpy.testing.assert_allclose(
+            result[0].get_value_tuple(), expected.get_value_tuple())
+
+    def test_spectral_array(self):
+        values = numpy.linspace(0.05, 0.9, 50)
+        spectra = SpectralArray((values, values[::-1]), observer='10')
+        self.assertEqual(spectra.values.shape, (2, 50))
+        for i, row in enumerate(spectra.values):
+            expected = convert_color(
+                SpectralColor(*row, observer='10'), LabColor)
+            result = convert_color(spectra, LabColor)[i]
+            self.assertEqual(result.observer, '10')
+            numpy.testing.assert_allclose(
+                result.get_value_tuple(), expected.get_value_tuple(),
+                rtol=1e-12)
+
+
+class ColorViewTestCase(unittest.TestCase):
+    def setUp(self):
+        self.labs = LabArray(
+            [(50.0, 10.0, -10.0), (20.0, 0.0, 5.0)], illuminant='D65')
+
+    def test_reads_and_writes_row(self):
+        view = self.labs.view(-1)
+        self.assertTrue(isinstance(view, LabColor))
+        self.assertFalse(hasattr(view, '__dict__'))
+        self.assertEqual(view.get_value_tuple(), (20.0, 0.0, 5.0))
+        self.assertEqual(view.illuminant, 'd65')
+        view.lab_l = 25.0
+        self.assertEqual(self.labs.values[1, 0], 25.0)
+        self.labs.values[1, 1] = 3.0
+        self.assertEqual(view.lab_a, 3.0)
+        self.assertRaises(IndexError, self.labs.view, 2)
+
+    def test_metadata_is_read_only(self):
+        view = self.labs.view(0)
+        self.assertRaises(AttributeError, view.set_illuminant, 'd50')
+        self.assertEqual(self.labs.meta['illuminant'], 'd65')
+
+    def test_iteration_yields_copies(self):
+        for color in self.labs:
+            self.assertEqual(type(color), LabColor)
+            color.lab_b = 0.0
+        self.assertEqual(self.labs.values[:, 2].tolist(), [-10.0, 5.0])
+
+    def test_views(self):
+        for view in self.labs.views():
+            view.lab_b = 0.0
+        self.assertEqual(self.labs.values[:, 2].tolist(), [0.0, 0.0])
+
+    def test_conversions(self):
+        view = self.labs.view(0)
+        expected = convert_color(self.labs[0], XYZColor)
+        self.assertEqual(convert_color(view, XYZColor).get_value_tuple(),
+                         expected.get_value_tuple())
+        converted = convert_colors(list(self.labs), XYZColor)
+        numpy.testing.assert_allclose(
+            converted[0].get_value_tuple(), expected.get_value_tuple())
+        self.assertAlmostEqual(
+            delta_e_cie2000(view, self.labs.view(1)),
+            delta_e_cie2000(self.labs[0], self.labs[1]))
+        self.assertEqual(
+            LabArray.from_colors(self.labs).values.tolist(),
+            self.labs.values.tolist())
+
+    def test_copies_are_detached(self):
+        view = self.labs.view(0)
+        for other in (copy.copy(view), pickle.loads(pickle.dumps(view))):
+            self.assertEqual(type(other), LabColor)
+            self.assertEqual(other.illuminant, 'd65')
+            other.lab_l = 0.0
+            self.assertEqual(view.lab_l, 50.0)
+
+
+class LabArrayDeltaETestCase(unittest.TestCase):
+    def setUp(self):
+        self.labs1 = LabArray(((50.0, 10.0, -10.0), (20.0, 0.0, 5.0)))
+        self.labs2 = LabArray(((52.0, 12.0, -9.0), (25.0, 3.0, 1.0)))
+
+    def test_pairs(self):
+        result = self.labs1.delta_e(self.labs2, method='cmc', pl=1)
+        for i in range(2):
+            self.assertAlmostEqual(
+                result[i], delta_e_cmc(self.labs1[i], self.labs2[i], pl=1), 9)
+
+    def test_single_color(self):
+        standard = LabColor(40.0, 5.0, 5.0)
+        result = self.labs1.delta_e(standard)
+        for i in range(2):
+            self.assertAlmostEqual(
+                result[i], delta_e_cie2000(self.labs1[i], standard), 9)
+
+    def test_batch_functions(self):
+        result = delta_e_cie2000_batch(self.labs1, self.labs2)
+        numpy.testing.assert_allclose(
+            result, self.labs1.delta_e(self.labs2))
+        self.assertRaises(ValueError, delta_e_cie2000_batch,
+                          self.labs1, LabArray(((1, 2, 3), (4, 5, 6)),
+                                               illuminant='d65'))
+        self.assertRaises(ValueError, delta_e_cie2000_batch,
+                          self.labs1, RGBArray(((0, 0, 0), (1, 1, 1))))
+
+    def test_errors(self):
+        self.assertRaises(ValueError, self.labs1.delta_e, self.labs2[:1])
+        self.assertRaises(ValueError, self.labs1.delta_e, self.labs2,
+                          method='cie3000')
+        self.assertRaises(ValueError, self.labs1.delta_e, RGBColor(0, 0, 0))
+
+    def test_illuminant_mismatch(self):
+        d65 = LabArray(self.labs2.values, illuminant='d65')
+        self.assertRaises(ValueError, self.labs1.delta_e, d65)
+        self.assertRaises(ValueError, self.labs1.delta_e,
+                          LabColor(40.0, 5.0, 5.0, observer='10'))
+        self.assertRaises(ValueError, delta_e_cie2000_batch, self.labs1, d65)
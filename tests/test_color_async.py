@@ -0,0 +1,133 @@
+"""
+Tests for the asyncio micro-batching wrappers. AsyncColorBatcher needs
+Python 3.7, so these tests are skipped on older versions. They don't use
+async syntax, so that this module still imports there.
+"""
+
+import sys
+import unittest
+
+import numpy
+
+from colormath.color_conversions import convert_color
+from colormath.color_diff import delta_e_cie2000, delta_e_cmc
+from colormath.color_objects import LabColor, RGBColor, XYZColor, \
+    SpectralColor
+
+if sys.version_info >= (3, 7):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    from colormath.color_async import AsyncColorBatcher
+
+    class CountingExecutor(ThreadPoolExecutor):
+        """
+        Counts the batches submitted to it.
+        """
+
+        def __init__(self):
+            super(CountingExecutor, self).__init__(max_workers=1)
+            self.submitted = 0
+
+        def submit(self, *args, **kwargs):
+            self.submitted += 1
+            return super(CountingExecutor, self).submit(*args, **kwargs)
+
+
+@unittest.skipIf(sys.version_info < (3, 7),
+                 "AsyncColorBatcher needs Python 3.7 or later.")
+class AsyncColorBatcherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.executor = CountingExecutor()
+        self.colors = [LabColor(l, l - 50.0, 20.0) for l in range(0, 100, 5)]
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def _gather(self, *coroutines, **kwargs):
+        """
+        Runs the coroutines together on a new event loop and returns their
+        results, like asyncio.gather().
+        """
+
+        loop = asyncio.new_event_loop()
+        try:
+            tasks = [loop.create_task(coroutine) for coroutine in coroutines]
+            return loop.run_until_complete(asyncio.gather(*tasks, **kwargs))
+        finally:
+            loop.close()
+
+    def test_convert_color(self):
+        batcher = AsyncColorBatcher(executor=self.executor)
+
+        results = self._gather(*[
+            batcher.convert_color(color, RGBColor, target_rgb='adobe_rgb')
+            for color in self.colors])
+        self.assertEqual(self.executor.submitted, 1)
+        for color, result in zip(self.colors, results):
+            expected = convert_color(color, RGBColor, target_rgb='adobe_rgb')
+            self.assertEqual(result.rgb_type, expected.rgb_type)
+            for got, want in zip(result.get_value_tuple(),
+                                 expected.get_value_tuple()):
+                self.assertAlmostEqual(got, want, 9)
+
+    def test_mixed_requests(self):
+        batcher = AsyncColorBatcher(executor=self.executor)
+        color = LabColor(50.0, 10.0, 10.0, illuminant='d65')
+
+        xyz1, xyz2, cie2000, cmc = self._gather(
+            batcher.convert_color(color, XYZColor),
+            batcher.convert_color(self.colors[3], XYZColor),
+            batcher.delta_e(color, self.colors[3]),
+            batcher.delta_e(color, self.colors[3], method='cmc', pl=1))
+        # One batch each for the conversion, CIE2000 and CMC queues.
+        self.assertEqual(self.executor.submitted, 3)
+        self.assertEqual(xyz1.illuminant, 'd65')
+        self.assertEqual(xyz2.illuminant, 'd50')
+        self.assertAlmostEqual(cie2000, delta_e_cie2000(color, self.colors[3]), 9)
+        self.assertAlmostEqual(cmc, delta_e_cmc(color, self.colors[3], pl=1), 9)
+
+    def test_max_batch_size(self):
+        batcher = AsyncColorBatcher(
+            max_delay=10, max_batch_size=5, executor=self.executor)
+
+        results = self._gather(*[
+            batcher.delta_e(color, self.colors[0]) for color in self.colors])
+        self.assertEqual(len(results), 20)
+        self.assertEqual(self.executor.submitted, 4)
+
+    def test_unhashable_arguments(self):
+        batcher = AsyncColorBatcher(executor=self.executor)
+        spectral = SpectralColor.from_array(numpy.linspace(0.1, 0.5, 50))
+        override = numpy.linspace(50.0, 150.0, 50)
+
+        results = self._gather(
+            batcher.convert_color(
+                spectral, XYZColor, illuminant_override=override),
+            batcher.convert_color(
+                spectral, XYZColor, illuminant_override=override * 2))
+        self.assertEqual(self.executor.submitted, 2)
+        for result, scale in zip(results, (1, 2)):
+            expected = convert_color(
+                spectral, XYZColor, illuminant_override=override * scale)
+            numpy.testing.assert_allclose(
+                result.get_value_tuple(), expected.get_value_tuple())
+
+    def test_errors(self):
+        batcher = AsyncColorBatcher(executor=self.executor)
+
+        self.assertRaises(
+            ValueError, self._gather,
+            batcher.delta_e(self.colors[0], RGBColor(0, 0, 0)))
+        self.assertRaises(
+            ValueError, self._gather,
+            batcher.delta_e(self.colors[0], self.colors[1], method='cie3000'))
+
+    def test_batch_error(self):
+        batcher = AsyncColorBatcher(executor=self.executor)
+
+        results = self._gather(
+            batcher.convert_color(self.colors[0], RGBColor, target_rgb='nope'),
+            batcher.convert_color(self.colors[1], RGBColor, target_rgb='nope'),
+            return_exceptions=True)
+        self.assertTrue(all(isinstance(result, KeyError) for result in results))
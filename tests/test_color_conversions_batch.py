@@ -0,0 +1,174 @@
+"""
+Tests for batch conversions.
+"""
+
+import threading
+import unittest
+
+import numpy
+
+from colormath.color_conversions import convert_color
+from colormath.color_conversions_batch import convert_many, convert_colors, \
+    BatchingConverter
+from colormath.color_frozen import FrozenColor, FrozenLabColor, FrozenRGBColor
+from colormath.color_objects import LabColor, RGBColor, XYZColor, HSLColor, \
+    SpectralColor
+
+
+class ConvertManyTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        self.labs = numpy.column_stack((
+            rng.uniform(0, 100, 40),
+            rng.uniform(-80, 80, 40),
+            rng.uniform(-80, 80, 40)))
+
+    def _expected(self, target_cs, source_kwargs=None, **kwargs):
+        source_kwargs = source_kwargs or {}
+        return numpy.array([
+            convert_color(LabColor(*row, **source_kwargs), target_cs,
+                          **kwargs).get_value_tuple()
+            for row in self.labs])
+
+    def test_single_process(self):
+        result = convert_many(self.labs, LabColor, XYZColor)
+        self.assertEqual(result.shape, (40, 3))
+        numpy.testing.assert_allclose(result, self._expected(XYZColor))
+
+    def test_kwargs(self):
+        source_kwargs = {'illuminant': 'd65'}
+        result = convert_many(self.labs, LabColor, RGBColor,
+                              source_kwargs=source_kwargs,
+                              target_rgb='adobe_rgb')
+        numpy.testing.assert_allclose(
+            result, self._expected(RGBColor, source_kwargs,
+                                   target_rgb='adobe_rgb'))
+
+    def test_processes(self):
+        result = convert_many(self.labs, LabColor, RGBColor, processes=2,
+                              source_kwargs={'illuminant': 'd65'})
+        numpy.testing.assert_allclose(
+            result, self._expected(RGBColor, {'illuminant': 'd65'}))
+
+    def test_wrong_columns(self):
+        self.assertRaises(ValueError, convert_many,
+                          self.labs[:, :2], LabColor, XYZColor)
+
+
+class ConvertColorsTestCase(unittest.TestCase):
+    def test_mixed_sources(self):
+        colors = [
+            LabColor(50.0, 10.0, 10.0),
+            RGBColor(0.2, 0.4, 0.6),
+            LabColor(30.0, -10.0, 40.0, illuminant='d65'),
+            HSLColor(120.0, 0.5, 0.5),
+            LabColor(70.0, 0.0, -20.0),
+        ]
+        results = convert_colors(colors, XYZColor)
+        for color, result in zip(colors, results):
+            expected = convert_color(color, XYZColor)
+            self.assertTrue(isinstance(result, XYZColor))
+            self.assertEqual(result.illuminant, expected.illuminant)
+            numpy.testing.assert_allclose(
+                result.get_value_tuple(), expected.get_value_tuple())
+
+    def test_same_space(self):
+        colors = [LabColor(50.0, 10.0, 10.0), LabColor(20.0, 5.0, 5.0)]
+        results = convert_colors(colors, LabColor)
+        self.assertEqual(results[1].get_value_tuple(), (20.0, 5.0, 5.0))
+
+    def test_frozen_source(self):
+        colors = [FrozenRGBColor(0.2, 0.4, 0.6), RGBColor(0.2, 0.4, 0.6)]
+        results = convert_colors(colors, LabColor)
+        self.assertIsInstance(results[0], FrozenLabColor)
+        self.assertNotIsInstance(results[1], FrozenColor)
+        self.assertEqual(results[0], convert_color(colors[0], LabColor))
+        numpy.testing.assert_allclose(
+            results[1].get_value_tuple(), results[0].get_value_tuple())
+
+    def test_frozen_target(self):
+        colors = [RGBColor(0.2, 0.4, 0.6), LabColor(50.0, 10.0, 10.0)]
+        results = convert_colors(colors, FrozenLabColor)
+        for color, result in zip(colors, results):
+            self.assertIsInstance(result, FrozenLabColor)
+            expected = convert_color(color, FrozenLabColor)
+            self.assertEqual(result.illuminant, expected.illuminant)
+            numpy.testing.assert_allclose(
+                result.get_value_tuple(), expected.get_value_tuple())
+        with BatchingConverter() as converter:
+            self.assertIsInstance(
+                converter.convert_color(colors[0], FrozenLabColor),
+                FrozenLabColor)
+
+
+class BatchingConverterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.colors = [RGBColor(r / 10.0, 0.5, 1 - r / 10.0) for r in range(11)]
+
+    def test_threads(self):
+        results = {}
+
+        def worker(thread_id):
+            results[thread_id] = [
+                converter.convert_color(color, LabColor) for color in self.colors]
+
+        with BatchingConverter(max_latency=0.01) as converter:
+            threads = [threading.Thread(target=worker, args=(i,))
+                       for i in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            stats = converter.get_stats()
+
+        expected = [convert_color(color, LabColor) for color in self.colors]
+        for converted in results.values():
+            for result, want in zip(converted, expected):
+                numpy.testing.assert_allclose(
+                    result.get_value_tuple(), want.get_value_tuple())
+        self.assertEqual(stats['colors'], 88)
+        self.assertTrue(stats['batches'] < 88)
+        self.assertTrue(stats['largest_batch'] > 1)
+        self.assertTrue(stats['mean_queue_wait'] >= 0)
+
+    def test_max_batch_size(self):
+        with BatchingConverter(max_latency=10, max_batch_size=4) as converter:
+            futures = [converter.submit(color, XYZColor) for color in self.colors[:8]]
+            for future in futures:
+                self.assertTrue(isinstance(future.result(5), XYZColor))
+            self.assertEqual(converter.get_stats()['largest_batch'], 4)
+
+    def test_close_drains_queue(self):
+        converter = BatchingConverter(max_latency=10)
+        futures = [converter.submit(color, XYZColor) for color in self.colors]
+        converter.close()
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertRaises(RuntimeError, converter.submit, self.colors[0], XYZColor)
+
+    def test_errors(self):
+        with BatchingConverter() as converter:
+            bad = converter.submit(self.colors[0], LabColor, target_illuminant='nope')
+            good = converter.submit(self.colors[0], LabColor)
+            self.assertRaises(KeyError, bad.result, 5)
+            self.assertTrue(isinstance(good.result(5), LabColor))
+
+    def test_unhashable_arguments(self):
+        spectral = SpectralColor.from_array(numpy.linspace(0.1, 0.9, 50))
+        override = numpy.ones(50)
+        expected = convert_colors(
+            [spectral], XYZColor, illuminant_override=override)[0]
+        with BatchingConverter(max_latency=0.05) as converter:
+            futures = [
+                converter.submit(spectral, XYZColor,
+                                 illuminant_override=override),
+                converter.submit(spectral, XYZColor,
+                                 illuminant_override=list(override)),
+                converter.submit(self.colors[0], LabColor),
+            ]
+            results = [future.result(5) for future in futures]
+            # The thread is still running.
+            later = converter.submit(self.colors[1], LabColor).result(5)
+        for result in results[:2]:
+            self.assertAlmostEqual(result.xyz_y, expected.xyz_y, 12)
+        self.assertTrue(isinstance(results[2], LabColor))
+        self.assertTrue(isinstance(later, LabColor))
@@ -0,0 +1,166 @@
+"""
+Tests for the vectorized color conversions.
+"""
+
+import math
+import unittest
+
+import numpy
+
+from colormath import color_constants, color_conversions, \
+    color_conversions_matrix
+from colormath.color_conversions import convert_color
+from colormath.color_exceptions import UndefinedConversionError
+from colormath.color_objects import LabColor, XYZColor, LCHabColor, \
+    RGBColor, HSLColor, CMYKColor, SpectralColor
+
+
+class LabToXYZTestCase(unittest.TestCase):
+    def test_matches_convert_color(self):
+        labs = [(1.807, -3.749, -2.547), (50.0, 60.0, -30.0), (95.0, 0.0, 5.0)]
+        result = color_conversions_matrix.Lab_to_XYZ(labs, illuminant='d65')
+        for row, lab in zip(result, labs):
+            expected = convert_color(
+                LabColor(*lab, illuminant='d65'), XYZColor).get_value_tuple()
+            for got, want in zip(row, expected):
+                self.assertAlmostEqual(got, want, 9)
+
+
+class WhitePointTestCase(unittest.TestCase):
+    def test_tables(self):
+        for observer, illuminants in color_constants.ILLUMINANTS.items():
+            for illuminant, (x, y, z) in illuminants.items():
+                key = (observer, illuminant)
+                denominator = x + 15.0 * y + 3.0 * z
+                expected = (x, y, z, 1.0 / x, 1.0 / y, 1.0 / z,
+                            4.0 * x / denominator, 9.0 * y / denominator)
+                for got, want in zip(color_constants.WHITE_POINTS[key],
+                                     expected):
+                    self.assertAlmostEqual(got, want, 12)
+                self.assertEqual(
+                    tuple(color_constants.ILLUMINANT_XYZ[key]), (x, y, z))
+
+    def test_read_only(self):
+        illum = color_conversions_matrix._get_illuminant_xyz('2', 'D65')
+        self.assertIs(illum, color_constants.ILLUMINANT_XYZ[('2', 'd65')])
+        self.assertRaises(ValueError, illum.__setitem__, 0, 1.0)
+        reciprocal = color_constants.ILLUMINANT_XYZ_RECIPROCAL[('2', 'd65')]
+        self.assertRaises(ValueError, reciprocal.__setitem__, 0, 1.0)
+
+
+class LabToDIN99TestCase(unittest.TestCase):
+    def _din99(self, lab_l, lab_a, lab_b):
+        """
+        Polar form of the DIN 6176 formula, for comparison.
+        """
+
+        hue = math.radians(16)
+        e = lab_a * math.cos(hue) + lab_b * math.sin(hue)
+        f = 0.7 * (lab_b * math.cos(hue) - lab_a * math.sin(hue))
+        G = math.hypot(e, f)
+        C99 = math.log(1 + 0.045 * G) / 0.045
+        h_ef = math.atan2(f, e)
+        return (105.51 * math.log(1 + 0.0158 * lab_l),
+                C99 * math.cos(h_ef), C99 * math.sin(h_ef))
+
+    def test_reference_white(self):
+        result = color_conversions_matrix.Lab_to_DIN99((100.0, 0.0, 0.0))
+        self.assertAlmostEqual(result[0], 100.0, 1)
+        self.assertEqual(result[1], 0.0)
+        self.assertEqual(result[2], 0.0)
+
+    def test_polar_form(self):
+        labs = [(50.0, 10.0, 10.0), (30.0, -60.0, 40.0), (75.0, 5.0, -90.0)]
+        result = color_conversions_matrix.Lab_to_DIN99(labs)
+        for row, lab in zip(result, labs):
+            for got, want in zip(row, self._din99(*lab)):
+                self.assertAlmostEqual(got, want, 9)
+
+
+class CAM02UCSTestCase(unittest.TestCase):
+    def test_ciecam02_worked_example(self):
+        """
+        The CIE 159 worked example.
+        """
+
+        J, M, h = color_conversions_matrix._ciecam02_forward(
+            numpy.array((19.31, 23.93, 10.14)),
+            numpy.array((98.88, 90.00, 32.03)), 200.0, 18.0, 'average')
+        self.assertAlmostEqual(J, 48.0314, 4)
+        self.assertAlmostEqual(M, 38.7789, 3)
+        self.assertAlmostEqual(numpy.degrees(h) % 360, 191.0452, 4)
+
+    def test_white_point(self):
+        # Adaptation is incomplete at the default luminance, so the white
+        # point keeps a little colorfulness. Only J' is pinned down.
+        result = color_conversions_matrix.Lab_to_CAM02UCS(
+            (100.0, 0.0, 0.0), illuminant='d65')
+        self.assertAlmostEqual(result[0], 100.0, 6)
+
+    def test_matrix_shape(self):
+        labs = numpy.zeros((4, 2, 3))
+        labs[..., 0] = 50.0
+        result = color_conversions_matrix.Lab_to_CAM02UCS(labs)
+        self.assertEqual(result.shape, (4, 2, 3))
+
+
+class ConvertColorMatrixTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = numpy.random.RandomState(0)
+        self.labs = numpy.column_stack((
+            rng.uniform(5, 95, 30),
+            rng.uniform(-60, 60, 30),
+            rng.uniform(-60, 60, 30)))
+        self.labs[0] = (50.0, 0.0, 0.0)
+
+    def _check(self, values, source_cs, target_cs, source_kwargs=None,
+               **kwargs):
+        result = color_conversions_matrix.convert_color_matrix(
+            values, source_cs, target_cs, source_kwargs, **kwargs)
+        expected = [
+            convert_color(source_cs(*row, **(source_kwargs or {})), target_cs,
+                          **kwargs).get_value_tuple()
+            for row in values]
+        numpy.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-10)
+        return result
+
+    def test_vectorized_paths(self):
+        self._check(self.labs, LabColor, XYZColor)
+        self._check(self.labs, LabColor, LCHabColor)
+        self._check(self.labs, LabColor, RGBColor, {'illuminant': 'd65'})
+        self._check(self.labs, LabColor, RGBColor, target_rgb='adobe_rgb')
+
+    def test_round_trips(self):
+        lch = self._check(self.labs, LabColor, LCHabColor, {'observer': '10'})
+        self._check(lch, LCHabColor, LabColor, {'observer': '10'})
+        rgb = self._check(self.labs, LabColor, RGBColor)
+        self._check(numpy.clip(rgb, 0, 1), RGBColor, LabColor)
+
+    def test_rgb_options(self):
+        rgb = numpy.array(((0, 0, 0), (12, 128, 255), (255, 255, 255)))
+        self._check(rgb, RGBColor, LabColor, {'is_upscaled': True})
+        self._check(rgb / 255.0, RGBColor, XYZColor, target_illuminant='d50')
+        self._check(rgb / 255.0, RGBColor, XYZColor, {'rgb_type': 'adobe_rgb'})
+
+    def test_row_fallback(self):
+        self.assertFalse(
+            color_conversions.RGB_to_HSL in color_conversions_matrix.VECTORIZED_CONVERSIONS)
+        self._check(self.labs, LabColor, HSLColor)
+        self._check(self.labs, LabColor, CMYKColor)
+
+    def test_empty(self):
+        result = color_conversions_matrix.convert_color_matrix(
+            numpy.empty((0, 3)), LabColor, CMYKColor)
+        self.assertEqual(result.shape, (0, 4))
+
+    def test_errors(self):
+        self.assertRaises(
+            ValueError, color_conversions_matrix.convert_color_matrix,
+            self.labs[:, :2], LabColor, XYZColor)
+        self.assertRaises(
+            ValueError, color_conversions_matrix.convert_color_matrix,
+            self.labs, LabColor, 'XYZColor')
+        self.assertRaises(
+            UndefinedConversionError,
+            color_conversions_matrix.convert_color_matrix,
+            self.labs, LabColor, SpectralColor)
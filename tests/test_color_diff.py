@@ -4,8 +4,12 @@ Tests for color difference (Delta E) equations.
 
 import unittest
 
+import numpy
+
+from colormath import color_diff_matrix
 from colormath.color_diff import delta_e_cie1976, delta_e_cie1994, \
-    delta_e_cie2000, delta_e_cmc
+    delta_e_cie2000, delta_e_cmc, delta_e_cie1976_batch, \
+    delta_e_cie1994_batch, delta_e_cie2000_batch, delta_e_cmc_batch
 from colormath.color_objects import LabColor, RGBColor
 
 
@@ -212,3 +216,373 @@ class DeltaETestCase(unittest.TestCase):
         other_color = RGBColor(1.0, 0.5, 0.3)
         self.assertRaises(
             ValueError, delta_e_cie2000, self.color1, other_color)
+
+
+class ScalarMatrixAgreementTestCase(unittest.TestCase):
+    """
+    The object-pair Delta E functions use pure Python scalar formulas. Make
+    sure they agree with the matrix kernels over a shared corpus.
+    """
+
+    def setUp(self):
+        values = (-90.0, -25.5, -0.001, 0.0, 0.001, 2.49, 33.3, 110.0)
+        lightness = (0.0, 7.5, 16.0, 50.0, 72.25, 100.0)
+        self.corpus = [
+            (L, a, b) for L in lightness for a in values for b in values]
+        self.references = [
+            (50.0, 2.6772, -79.7751),
+            (61.2901, 3.7196, -5.3901),
+            (15.0, 0.0, 0.0),
+            (90.8027, -2.0831, 1.4410),
+        ]
+
+    def assertAgrees(self, scalar_func, matrix_func, **kwargs):
+        matrix = numpy.array(self.corpus)
+        for reference in self.references:
+            expected = matrix_func(numpy.array(reference), matrix, **kwargs)
+            color1 = LabColor(*reference)
+            for lab, matrix_result in zip(self.corpus, expected):
+                result = scalar_func(color1, LabColor(*lab), **kwargs)
+                self.assertIsInstance(result, float)
+                self.assertAlmostEqual(
+                    result, matrix_result, 9,
+                    "%s mismatch for %s vs %s: %r != %r" % (
+                        scalar_func.__name__, reference, lab, result,
+                        matrix_result))
+
+    def test_cie1976(self):
+        self.assertAgrees(delta_e_cie1976, color_diff_matrix.delta_e_cie1976)
+
+    def test_cie1994(self):
+        self.assertAgrees(delta_e_cie1994, color_diff_matrix.delta_e_cie1994)
+        self.assertAgrees(
+            delta_e_cie1994, color_diff_matrix.delta_e_cie1994,
+            K_1=0.048, K_2=0.014, K_L=2)
+
+    def test_cie2000(self):
+        self.assertAgrees(delta_e_cie2000, color_diff_matrix.delta_e_cie2000)
+        self.assertAgrees(
+            delta_e_cie2000, color_diff_matrix.delta_e_cie2000, Kl=2)
+
+    def test_cmc(self):
+        self.assertAgrees(delta_e_cmc, color_diff_matrix.delta_e_cmc)
+        self.assertAgrees(
+            delta_e_cmc, color_diff_matrix.delta_e_cmc, pl=1, pc=1)
+
+
+class BatchDeltaETestCase(unittest.TestCase):
+    def setUp(self):
+        self.standards = [
+            LabColor(lab_l=0.9, lab_a=16.3, lab_b=-2.22),
+            LabColor(lab_l=32.8911, lab_a=-53.0107, lab_b=-43.3182),
+            LabColor(lab_l=50.0, lab_a=2.6772, lab_b=-79.7751),
+            LabColor(lab_l=69.417, lab_a=-12.612, lab_b=-11.271),
+        ]
+        self.samples = [
+            LabColor(lab_l=0.7, lab_a=14.2, lab_b=-1.80),
+            LabColor(lab_l=77.1797, lab_a=25.5928, lab_b=17.9412),
+            LabColor(lab_l=50.0, lab_a=0.0, lab_b=-82.7485),
+            LabColor(lab_l=83.386, lab_a=39.426, lab_b=-17.525),
+        ]
+
+    def assertMatchesPairs(self, batch_func, pair_func, **kwargs):
+        result = batch_func(self.standards, self.samples, **kwargs)
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual(result.shape, (len(self.standards),))
+        for value, color1, color2 in zip(result, self.standards, self.samples):
+            self.assertAlmostEqual(
+                value, pair_func(color1, color2, **kwargs), 9)
+
+    def test_cie1976(self):
+        self.assertMatchesPairs(delta_e_cie1976_batch, delta_e_cie1976)
+
+    def test_cie1994(self):
+        self.assertMatchesPairs(delta_e_cie1994_batch, delta_e_cie1994)
+        self.assertMatchesPairs(
+            delta_e_cie1994_batch, delta_e_cie1994,
+            K_1=0.048, K_2=0.014, K_L=2)
+
+    def test_cie2000(self):
+        self.assertMatchesPairs(delta_e_cie2000_batch, delta_e_cie2000)
+
+    def test_cmc(self):
+        self.assertMatchesPairs(delta_e_cmc_batch, delta_e_cmc)
+        self.assertMatchesPairs(delta_e_cmc_batch, delta_e_cmc, pl=1, pc=1)
+
+    def test_array_input(self):
+        matrix = numpy.array([color.get_value_tuple() for color in self.samples])
+        result = delta_e_cie2000_batch(self.standards, matrix)
+        expected = delta_e_cie2000_batch(self.standards, self.samples)
+        numpy.testing.assert_allclose(result, expected)
+
+    def test_array_shape(self):
+        matrix = numpy.zeros((3, 3))
+        self.assertRaises(ValueError, delta_e_cie1976_batch,
+                          numpy.array([50.0, 1.0, 2.0]), matrix)
+        self.assertRaises(ValueError, delta_e_cie1976_batch,
+                          numpy.zeros((3, 4)), numpy.ones((3, 4)))
+        self.assertRaises(ValueError, delta_e_cie1976_batch,
+                          matrix, numpy.zeros((1, 3, 3)))
+
+    def test_empty_batch(self):
+        self.assertEqual(delta_e_cie2000_batch([], []).shape, (0,))
+
+    def test_mixed_illuminants(self):
+        self.samples[0] = LabColor(0.7, 14.2, -1.80, illuminant='d65')
+        self.assertRaises(
+            ValueError, delta_e_cie2000_batch, self.standards, self.samples)
+
+    def test_length_mismatch(self):
+        self.assertRaises(
+            ValueError, delta_e_cie1976_batch, self.standards, self.samples[1:])
+
+    def test_non_lab_color(self):
+        self.samples[0] = RGBColor(1.0, 0.5, 0.3)
+        self.assertRaises(
+            ValueError, delta_e_cie1976_batch, self.standards, self.samples)
+
+
+class MatrixBroadcastTestCase(unittest.TestCase):
+    """
+    The matrix kernels should accept arrays on both sides and broadcast
+    over leading dimensions.
+    """
+
+    kernels = (
+        (color_diff_matrix.delta_e_cie1976, delta_e_cie1976),
+        (color_diff_matrix.delta_e_cie1994, delta_e_cie1994),
+        (color_diff_matrix.delta_e_cie2000, delta_e_cie2000),
+        (color_diff_matrix.delta_e_cmc, delta_e_cmc),
+    )
+
+    def setUp(self):
+        # Covers L above and below 16 and hues on both sides of the CMC
+        # 164-345 degree boundary.
+        self.standards = numpy.array([
+            (0.9, 16.3, -2.22),
+            (32.8911, -53.0107, -43.3182),
+            (50.0, 2.6772, -79.7751),
+            (69.417, -12.612, -11.271),
+            (90.0, -30.0, 5.0),
+        ])
+        self.samples = numpy.array([
+            (0.7, 14.2, -1.80),
+            (77.1797, 25.5928, 17.9412),
+            (50.0, 0.0, -82.7485),
+            (83.386, 39.426, -17.525),
+            (10.0, 0.0, 0.0),
+        ])
+
+    def test_paired_rows(self):
+        for kernel, pair_func in self.kernels:
+            result = kernel(self.standards, self.samples)
+            self.assertEqual(result.shape, (5,))
+            for value, standard, sample in zip(
+                    result, self.standards, self.samples):
+                expected = pair_func(LabColor(*standard), LabColor(*sample))
+                self.assertAlmostEqual(value, expected, 9)
+
+    def test_swapped_standard(self):
+        sample = self.samples[1]
+        for kernel, pair_func in self.kernels:
+            result = kernel(self.standards, sample)
+            for value, standard in zip(result, self.standards):
+                expected = pair_func(LabColor(*standard), LabColor(*sample))
+                self.assertAlmostEqual(value, expected, 9)
+
+    def test_outer_table(self):
+        for kernel, pair_func in self.kernels:
+            result = kernel(self.standards[:, None, :], self.samples[None, :, :])
+            self.assertEqual(result.shape, (5, 5))
+            for i, standard in enumerate(self.standards):
+                numpy.testing.assert_allclose(
+                    result[i], kernel(standard, self.samples), rtol=1e-12)
+
+
+class FastCIE2000TestCase(unittest.TestCase):
+    """
+    The single precision CIE2000 approximation must stay within its
+    published error bound of the exact kernel.
+    """
+
+    def test_error_bound_on_grid(self):
+        lightness = numpy.arange(0.0, 101.0, 20.0)
+        chroma = numpy.arange(-128.0, 129.0, 16.0)
+        grid = numpy.stack(
+            numpy.meshgrid(lightness, chroma, chroma, indexing='ij'),
+            axis=-1).reshape(-1, 3)
+        for lab_color_vector in grid[::7]:
+            exact = color_diff_matrix.delta_e_cie2000(lab_color_vector, grid)
+            approx = color_diff_matrix.delta_e_cie2000(
+                lab_color_vector, grid, fast=True)
+            self.assertLessEqual(
+                numpy.max(numpy.fabs(exact - approx)),
+                color_diff_matrix.CIE2000_FAST_MAX_ERROR)
+
+    def test_opposite_hues(self):
+        # Hue differences of exactly 180 degrees sit on the mean hue
+        # discontinuity and must still match the exact kernel.
+        standards = numpy.array([
+            (50.0, 10.0, 0.0), (10.0, 120.0, -120.0), (60.0, -100.0, 100.0)])
+        samples = numpy.array([
+            (50.0, -10.0, 0.0), (10.0, -110.0, 110.0), (60.0, 110.0, -110.0)])
+        numpy.testing.assert_allclose(
+            color_diff_matrix.delta_e_cie2000(standards, samples, fast=True),
+            color_diff_matrix.delta_e_cie2000(standards, samples),
+            atol=color_diff_matrix.CIE2000_FAST_MAX_ERROR)
+
+    def test_returns_float32(self):
+        result = delta_e_cie2000_batch(
+            [LabColor(0.9, 16.3, -2.22)], [LabColor(0.7, 14.2, -1.80)],
+            fast=True)
+        self.assertEqual(result.dtype, numpy.float32)
+        self.assertAlmostEqual(result[0], 1.523, 3)
+
+
+class UniformSpaceDistanceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.labs = numpy.array((
+            (50.0, 10.0, 10.0), (30.0, -60.0, 40.0), (75.0, 5.0, -90.0),
+            (0.9, 16.3, -2.22)))
+
+    def _check_metric(self, func):
+        table = func(self.labs[:, numpy.newaxis], self.labs[numpy.newaxis])
+        self.assertEqual(table.shape, (4, 4))
+        numpy.testing.assert_allclose(numpy.diag(table), 0.0, atol=1e-12)
+        numpy.testing.assert_allclose(table, table.T)
+        # Triangle inequality through every intermediate color.
+        for k in range(len(self.labs)):
+            self.assertTrue(numpy.all(
+                table <= table[:, k:k + 1] + table[k:k + 1, :] + 1e-9))
+
+    def test_din99_metric(self):
+        self._check_metric(color_diff_matrix.delta_e_din99)
+
+    def test_cam02ucs_metric(self):
+        self._check_metric(color_diff_matrix.delta_e_cam02ucs)
+
+    def test_din99_lightness_only(self):
+        result = color_diff_matrix.delta_e_din99(
+            numpy.array((50.0, 0.0, 0.0)), numpy.array(((60.0, 0.0, 0.0),)))
+        expected = 105.51 * (numpy.log1p(0.0158 * 60) - numpy.log1p(0.0158 * 50))
+        self.assertAlmostEqual(result[0], expected, 9)
+
+
+class PairwiseCIE1976TestCase(unittest.TestCase):
+    def setUp(self):
+        grid = numpy.linspace(-80.0, 80.0, 4)
+        self.labs = numpy.array(
+            [(l, a, b) for l in (10.0, 55.0, 90.0) for a in grid for b in grid])
+        self.expected = color_diff_matrix.delta_e_cie1976(
+            self.labs[:, numpy.newaxis], self.labs[numpy.newaxis])
+
+    def test_self_distances(self):
+        result = color_diff_matrix.delta_e_cie1976_pairwise(
+            self.labs, tile_size=7)
+        numpy.testing.assert_allclose(result, self.expected, atol=1e-6)
+        self.assertTrue(numpy.all(numpy.diag(result) == 0))
+
+    def test_two_sets(self):
+        result = color_diff_matrix.delta_e_cie1976_pairwise(
+            self.labs[:5], self.labs, tile_size=2)
+        self.assertEqual(result.shape, (5, len(self.labs)))
+        numpy.testing.assert_allclose(result, self.expected[:5], atol=1e-6)
+
+    def test_squared(self):
+        result = color_diff_matrix.delta_e_cie1976_pairwise(
+            self.labs, squared=True)
+        numpy.testing.assert_allclose(
+            result, self.expected ** 2, rtol=1e-9, atol=1e-6)
+
+    def test_condensed(self):
+        result = color_diff_matrix.delta_e_cie1976_pairwise(
+            self.labs, condensed=True, tile_size=5)
+        rows, cols = numpy.triu_indices(len(self.labs), k=1)
+        numpy.testing.assert_allclose(
+            result, self.expected[rows, cols], atol=1e-6)
+
+    def test_tile_shape(self):
+        shapes = []
+        dot = numpy.dot
+
+        def recording_dot(a, b):
+            shapes.append((len(a), b.shape[1]))
+            return dot(a, b)
+
+        numpy.dot = recording_dot
+        try:
+            for condensed in (False, True):
+                color_diff_matrix.delta_e_cie1976_pairwise(
+                    self.labs, condensed=condensed, tile_size=10)
+        finally:
+            numpy.dot = dot
+        self.assertEqual(max(max(shape) for shape in shapes), 10)
+
+    def test_condensed_two_sets(self):
+        self.assertRaises(
+            ValueError, color_diff_matrix.delta_e_cie1976_pairwise,
+            self.labs, self.labs, condensed=True)
+
+
+class ThreadedKernelTestCase(unittest.TestCase):
+    def setUp(self):
+        # Small chunks, so that the test matrices are split across threads.
+        self.chunk_size = color_diff_matrix.MIN_ROW_CHUNK_SIZE
+        color_diff_matrix.MIN_ROW_CHUNK_SIZE = 7
+        rng = numpy.random.RandomState(0)
+        self.labs = numpy.column_stack((
+            rng.uniform(0, 100, 50),
+            rng.uniform(-128, 128, 50),
+            rng.uniform(-128, 128, 50)))
+
+    def tearDown(self):
+        color_diff_matrix.MIN_ROW_CHUNK_SIZE = self.chunk_size
+
+    def test_chunk_sizes(self):
+        def kernel(lab_color_vector, lab_color_matrix):
+            rows.append(len(lab_color_matrix))
+            return lab_color_matrix[:, 0]
+
+        for workers, expected in ((1, [50]), (3, [17, 17, 16]),
+                                  (4, [13, 13, 13, 11]), (10, [7] * 7 + [1])):
+            rows = []
+            result = color_diff_matrix._map_row_chunks(
+                kernel, self.labs[0], self.labs, workers)
+            self.assertEqual(sorted(rows, reverse=True), expected)
+            numpy.testing.assert_array_equal(result, self.labs[:, 0])
+
+    def test_kernels(self):
+        for kernel in (color_diff_matrix.delta_e_cie1976,
+                       color_diff_matrix.delta_e_cie1994,
+                       color_diff_matrix.delta_e_cmc,
+                       color_diff_matrix.delta_e_cie2000):
+            expected = kernel(self.labs[0], self.labs)
+            result = kernel(self.labs[0], self.labs, workers=3)
+            numpy.testing.assert_array_equal(result, expected)
+
+    def test_kernel_kwargs(self):
+        expected = color_diff_matrix.delta_e_cmc(
+            self.labs[0], self.labs, pl=1, pc=1)
+        result = color_diff_matrix.delta_e_cmc(
+            self.labs[0], self.labs, pl=1, pc=1, workers=2)
+        numpy.testing.assert_array_equal(result, expected)
+
+    def test_paired_rows(self):
+        expected = color_diff_matrix.delta_e_cie2000(self.labs, self.labs[::-1])
+        result = color_diff_matrix.delta_e_cie2000(
+            self.labs, self.labs[::-1], workers=4)
+        numpy.testing.assert_array_equal(result, expected)
+
+    def test_outer_table(self):
+        standards = self.labs[:20, numpy.newaxis]
+        samples = self.labs[numpy.newaxis]
+        expected = color_diff_matrix.delta_e_cie2000(standards, samples)
+        result = color_diff_matrix.delta_e_cie2000(
+            standards, samples, workers=2)
+        self.assertEqual(result.shape, (20, 50))
+        numpy.testing.assert_array_equal(result, expected)
+
+    def test_fast_dtype(self):
+        result = color_diff_matrix.delta_e_cie2000(
+            self.labs[0], self.labs, fast=True, workers=2)
+        self.assertEqual(result.dtype, numpy.float32)
@@ -0,0 +1,115 @@
+"""
+Tests for the out-of-core pairwise Delta E driver.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+from numpy.lib.format import open_memmap
+
+from colormath import color_diff_matrix
+from colormath.color_diff_pairwise import pairwise_delta_e
+
+
+class PairwiseDeltaETestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'delta_e.npy')
+        rng = numpy.random.RandomState(0)
+        self.labs = numpy.column_stack((
+            rng.uniform(0, 100, 23),
+            rng.uniform(-128, 128, 23),
+            rng.uniform(-128, 128, 23)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _expected(self, kernel, lab_matrix_b=None):
+        if lab_matrix_b is None:
+            lab_matrix_b = self.labs
+        return kernel(self.labs[:, numpy.newaxis], lab_matrix_b[numpy.newaxis])
+
+    def test_self_distances(self):
+        result = pairwise_delta_e(self.labs, self.filename, tile_size=5)
+        self.assertEqual(result.dtype, numpy.float32)
+        numpy.testing.assert_allclose(
+            result, self._expected(color_diff_matrix.delta_e_cie2000),
+            rtol=1e-6, atol=1e-5)
+
+    def test_asymmetric_method(self):
+        result = pairwise_delta_e(
+            self.labs, self.filename, method='cmc', tile_size=4,
+            dtype=numpy.float64, pl=1)
+        expected = color_diff_matrix.delta_e_cmc(
+            self.labs[:, numpy.newaxis], self.labs[numpy.newaxis], pl=1)
+        numpy.testing.assert_allclose(result, expected)
+
+    def test_two_sets(self):
+        result = pairwise_delta_e(
+            self.labs, self.filename, lab_matrix_b=self.labs[:7],
+            method='cie1976', tile_size=4, dtype=numpy.float64)
+        self.assertEqual(result.shape, (23, 7))
+        numpy.testing.assert_allclose(
+            result, self._expected(color_diff_matrix.delta_e_cie1976,
+                                   self.labs[:7]))
+
+    def test_resume(self):
+        pairwise_delta_e(self.labs, self.filename, method='cie1976',
+                         tile_size=5, dtype=numpy.float64)
+
+        # Simulate an interrupted run: tile (0, 1) is marked finished but
+        # holds a sentinel, tile (2, 3) is lost.
+        output = open_memmap(self.filename, mode='r+')
+        progress = open_memmap(self.filename + '.tiles.npy', mode='r+')
+        output[0, 5] = -1.0
+        output[10:15, 15:20] = 0.0
+        progress[2, 3] = False
+        output.flush()
+        progress.flush()
+        del output, progress
+
+        result = pairwise_delta_e(self.labs, self.filename, method='cie1976',
+                                  tile_size=5, dtype=numpy.float64)
+        expected = self._expected(color_diff_matrix.delta_e_cie1976)
+        # Finished tiles are not recomputed...
+        self.assertEqual(result[0, 5], -1.0)
+        # ...but missing ones are, along with their mirror image.
+        numpy.testing.assert_allclose(result[10:15, 15:20], expected[10:15, 15:20])
+        numpy.testing.assert_allclose(result[15:20, 10:15], expected[15:20, 10:15])
+
+    def test_resume_mismatch(self):
+        pairwise_delta_e(self.labs, self.filename, tile_size=5)
+        self.assertRaises(ValueError, pairwise_delta_e,
+                          self.labs, self.filename, tile_size=4)
+        self.assertRaises(ValueError, pairwise_delta_e,
+                          self.labs, self.filename, tile_size=5,
+                          dtype=numpy.float64)
+
+    def test_resume_different_run(self):
+        pairwise_delta_e(self.labs, self.filename, tile_size=5)
+        self.assertRaises(ValueError, pairwise_delta_e,
+                          self.labs * 2, self.filename, method='cie1976',
+                          tile_size=5)
+        self.assertRaises(ValueError, pairwise_delta_e,
+                          self.labs, self.filename, method='cie1976',
+                          tile_size=5)
+        self.assertRaises(ValueError, pairwise_delta_e,
+                          self.labs * 2, self.filename, tile_size=5)
+        self.assertRaises(ValueError, pairwise_delta_e,
+                          self.labs, self.filename, tile_size=5, Kl=2)
+        # The same run still resumes.
+        pairwise_delta_e(self.labs, self.filename, tile_size=5)
+
+    def test_processes(self):
+        result = pairwise_delta_e(self.labs, self.filename, method='din99',
+                                  tile_size=6, processes=2)
+        numpy.testing.assert_allclose(
+            result, self._expected(color_diff_matrix.delta_e_din99),
+            rtol=1e-6, atol=1e-5)
+
+    def test_invalid_method(self):
+        self.assertRaises(ValueError, pairwise_delta_e,
+                          self.labs, self.filename, method='cie3000')
@@ -0,0 +1,114 @@
+"""
+Tests for immutable, hashable colors.
+"""
+
+import copy
+import pickle
+import threading
+import unittest
+
+from colormath.color_conversions import convert_color
+from colormath.color_diff import delta_e_cie2000
+from colormath.color_frozen import FrozenLabColor, FrozenRGBColor, \
+    FrozenSpectralColor, FrozenXYZColor, freeze, MEMO_SIZE
+from colormath.color_objects import LabColor, XYZColor
+
+
+class FrozenColorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.color = FrozenLabColor(50.0, 10.0, -10.0, illuminant='D65')
+
+    def test_immutable(self):
+        self.assertTrue(isinstance(self.color, LabColor))
+        self.assertRaises(AttributeError, setattr, self.color, 'lab_l', 1.0)
+        self.assertRaises(AttributeError, self.color.set_illuminant, 'd50')
+        self.assertEqual(self.color.get_value_tuple(), (50.0, 10.0, -10.0))
+        xyz = FrozenXYZColor(0.1, 0.2, 0.3)
+        self.assertRaises(AttributeError, xyz.apply_adaptation, 'd65')
+        self.assertEqual(xyz.xyz_x, 0.1)
+
+    def test_hash_and_equality(self):
+        same = FrozenLabColor(50.0, 10.0, -10.0, illuminant='d65')
+        self.assertEqual(self.color, same)
+        self.assertEqual(hash(self.color), hash(same))
+        self.assertEqual(len(set([self.color, same])), 1)
+        self.assertNotEqual(
+            self.color, FrozenLabColor(50.0, 10.0, -10.0, illuminant='d50'))
+        self.assertNotEqual(self.color, LabColor(50.0, 10.0, -10.0))
+
+    def test_conversion_memo(self):
+        xyz = convert_color(self.color, XYZColor)
+        self.assertTrue(isinstance(xyz, FrozenXYZColor))
+        self.assertTrue(convert_color(self.color, XYZColor) is xyz)
+        self.assertFalse(convert_color(self.color, XYZColor, foo=1) is xyz)
+        expected = convert_color(self.color.thaw(), XYZColor)
+        self.assertEqual(xyz.get_value_tuple(), expected.get_value_tuple())
+        self.assertEqual(xyz.illuminant, 'd65')
+
+    def test_memo_size(self):
+        first = convert_color(self.color, XYZColor, foo=0)
+        for foo in range(1, MEMO_SIZE + 5):
+            convert_color(self.color, XYZColor, foo=foo)
+        self.assertEqual(len(self.color._memo), MEMO_SIZE)
+        # The oldest results were dropped, the newest are still remembered.
+        self.assertFalse(convert_color(self.color, XYZColor, foo=0) is first)
+        last = convert_color(self.color, XYZColor, foo=MEMO_SIZE + 4)
+        self.assertTrue(
+            convert_color(self.color, XYZColor, foo=MEMO_SIZE + 4) is last)
+
+    def test_memo_threads(self):
+        errors = []
+
+        def convert():
+            try:
+                for foo in range(MEMO_SIZE * 20):
+                    convert_color(self.color, XYZColor, foo=foo)
+            except Exception as exception:
+                errors.append(exception)
+
+        threads = [threading.Thread(target=convert) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.color._memo), MEMO_SIZE)
+
+    def test_convert_to_frozen_class(self):
+        rgb = convert_color(LabColor(50.0, 10.0, -10.0), FrozenRGBColor)
+        self.assertEqual(type(rgb), FrozenRGBColor)
+
+    def test_freeze_and_thaw(self):
+        color = LabColor(50.0, 10.0, -10.0, illuminant='d65')
+        frozen = freeze(color)
+        self.assertEqual(frozen, self.color)
+        self.assertTrue(freeze(frozen) is frozen)
+        thawed = self.color.thaw()
+        self.assertEqual(type(thawed), LabColor)
+        thawed.lab_l = 1.0
+        self.assertEqual(self.color.lab_l, 50.0)
+
+    def test_copy_and_pickle(self):
+        self.assertTrue(copy.copy(self.color) is self.color)
+        self.assertTrue(copy.deepcopy(self.color) is self.color)
+        clone = pickle.loads(pickle.dumps(self.color))
+        self.assertEqual(clone, self.color)
+        self.assertRaises(AttributeError, setattr, clone, 'lab_l', 1.0)
+
+    def test_delta_e(self):
+        self.assertEqual(
+            delta_e_cie2000(self.color, self.color.thaw()), 0.0)
+
+    def test_rgb(self):
+        color = FrozenRGBColor.new_from_rgb_hex('#336699')
+        self.assertEqual(color.get_rgb_hex(), '#336699')
+        self.assertRaises(AttributeError, setattr, color, 'rgb_type', 'adobe_rgb')
+
+    def test_spectral(self):
+        color = FrozenSpectralColor.from_array([0.1] * 50)
+        self.assertRaises(AttributeError, setattr, color, 'spec_500nm', 1.0)
+        self.assertRaises(ValueError, color.get_numpy_view().__setitem__,
+                          (0, 0), 1.0)
+        self.assertEqual(freeze(color.thaw()), color)
+        color.thaw().spec_500nm = 1.0
+        self.assertEqual(color.spec_500nm, 0.1)
@@ -2,8 +2,12 @@
 Various tests for color objects.
 """
 
+import copy
+import pickle
 import unittest
 
+import numpy
+
 from colormath.color_conversions import convert_color
 from colormath.color_objects import SpectralColor, XYZColor, xyYColor, \
     LabColor, LuvColor, LCHabColor, LCHuvColor, RGBColor, HSLColor, HSVColor, \
@@ -76,6 +80,35 @@ class SpectralConversionTestCase(BaseColorConversionTest):
         same_color = convert_color(self.color, SpectralColor)
         self.assertEqual(self.color, same_color)
 
+    def test_from_array(self):
+        color = SpectralColor.from_array(
+            self.color.get_numpy_array(), illuminant='D65')
+        self.assertEqual(color.get_value_tuple(), self.color.get_value_tuple())
+        self.assertEqual(color.illuminant, 'd65')
+        self.assertRaises(ValueError, SpectralColor.from_array, [0.1, 0.2])
+
+    def test_numpy_array_is_copy(self):
+        sample = self.color.get_numpy_array()
+        self.assertEqual(sample.shape, (1, 50))
+        sample[0, 16] = 0.5
+        self.assertEqual(self.color.spec_500nm, 0.0651)
+
+    def test_numpy_view(self):
+        sample = self.color.get_numpy_view()
+        self.assertEqual(sample.shape, (1, 50))
+        sample[0, 16] = 0.5
+        self.assertEqual(self.color.spec_500nm, 0.5)
+        self.color.spec_510nm = 0.25
+        self.assertEqual(sample[0, 17], 0.25)
+        self.assertEqual(type(self.color.spec_510nm), float)
+
+    def test_copy_is_independent(self):
+        clone = copy.copy(self.color)
+        clone.spec_500nm = 1.0
+        self.assertEqual(self.color.spec_500nm, 0.0651)
+        self.assertFalse(numpy.may_share_memory(
+            clone.get_numpy_view(), self.color.get_numpy_view()))
+
 
 class XYZConversionTestCase(BaseColorConversionTest):
     def setUp(self):
@@ -344,3 +377,49 @@ class CMYKConversionTestCase(BaseColorConversionTest):
     def test_convert_to_self(self):
         same_color = convert_color(self.color, CMYKColor)
         self.assertEqual(self.color, same_color)
+
+
+class ColorSlotsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.colors = [
+            SpectralColor(spec_500nm=0.5), XYZColor(0.1, 0.2, 0.3),
+            xyYColor(0.3, 0.3, 0.5), LabColor(50.0, 10.0, -10.0),
+            LuvColor(50.0, 10.0, -10.0), LCHabColor(50.0, 10.0, 90.0),
+            LCHuvColor(50.0, 10.0, 90.0), RGBColor(0.1, 0.2, 0.3),
+            HSLColor(90.0, 0.5, 0.5), HSVColor(90.0, 0.5, 0.5),
+            CMYColor(0.1, 0.2, 0.3), CMYKColor(0.1, 0.2, 0.3, 0.4)]
+
+    def test_no_instance_dict(self):
+        for color in self.colors:
+            self.assertFalse(hasattr(color, '__dict__'), color)
+            self.assertRaises(AttributeError, setattr, color, 'not_a_value', 1)
+
+    def test_copy_and_pickle(self):
+        for color in self.colors:
+            for clone in (copy.copy(color), pickle.loads(pickle.dumps(color))):
+                self.assertEqual(clone.get_value_tuple(), color.get_value_tuple())
+                self.assertEqual(repr(clone), repr(color))
+                for name in ('observer', 'illuminant', 'rgb_type'):
+                    self.assertEqual(getattr(clone, name, None),
+                                     getattr(color, name, None))
+
+    def test_from_trusted(self):
+        for color in self.colors:
+            args = list(color.get_value_tuple())
+            args += [getattr(color, name)
+                     for name in ('rgb_type', 'observer', 'illuminant')
+                     if hasattr(color, name)]
+            trusted = color.__class__._from_trusted(*args)
+            self.assertEqual(repr(trusted), repr(color))
+            self.assertEqual(str(trusted), str(color))
+
+    def test_conversions_return_floats(self):
+        for color in self.colors:
+            for target_cs in (XYZColor, xyYColor, LabColor, LCHabColor,
+                              LuvColor, RGBColor, HSVColor, HSLColor,
+                              CMYKColor):
+                if isinstance(color, SpectralColor) and target_cs is not XYZColor:
+                    continue
+                new_color = convert_color(color, target_cs)
+                for value in new_color.get_value_tuple():
+                    self.assertEqual(type(value), float, new_color)
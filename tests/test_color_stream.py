@@ -0,0 +1,53 @@
+"""
+Tests for the streaming conversion pipeline.
+"""
+
+import itertools
+import unittest
+
+import numpy
+
+from colormath import color_diff_matrix
+from colormath.color_conversions_matrix import convert_color_matrix
+from colormath.color_objects import LabColor, RGBColor
+from colormath.color_stream import iter_blocks, iter_rows, convert_blocks, \
+    delta_e_blocks
+
+
+class StreamTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rows = [(r, g, 128) for r in range(0, 256, 40) for g in range(0, 256, 60)]
+
+    def test_iter_blocks(self):
+        blocks = list(iter_blocks(self.rows, block_size=8))
+        self.assertEqual([len(block) for block in blocks], [8, 8, 8, 8, 3])
+        numpy.testing.assert_array_equal(numpy.vstack(blocks), self.rows)
+
+    def test_string_rows(self):
+        blocks = list(iter_blocks([('1.5', '2', '3')]))
+        numpy.testing.assert_array_equal(blocks[0], [(1.5, 2.0, 3.0)])
+
+    def test_lazy(self):
+        # An endless input only produces the blocks that are asked for.
+        rows = ((i, 0, 0) for i in itertools.count())
+        blocks = iter_blocks(rows, block_size=4)
+        next(blocks)
+        self.assertEqual(next(blocks)[0, 0], 4)
+
+    def test_pipeline(self):
+        standard = (50.0, 10.0, -10.0)
+        blocks = iter_blocks(self.rows, block_size=6)
+        lab_blocks = convert_blocks(blocks, RGBColor, LabColor,
+                                    source_kwargs={'is_upscaled': True})
+        result = numpy.concatenate(list(delta_e_blocks(
+            lab_blocks, standard, kernel=color_diff_matrix.delta_e_cmc, pl=1)))
+
+        labs = convert_color_matrix(self.rows, RGBColor, LabColor,
+                                    {'is_upscaled': True})
+        expected = color_diff_matrix.delta_e_cmc(numpy.array(standard), labs, pl=1)
+        numpy.testing.assert_allclose(result, expected)
+
+    def test_iter_rows(self):
+        rows = list(iter_rows(iter_blocks(self.rows, block_size=5)))
+        self.assertEqual(len(rows), len(self.rows))
+        numpy.testing.assert_array_equal(rows[-1], self.rows[-1])
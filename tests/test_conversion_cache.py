@@ -0,0 +1,105 @@
+"""
+Tests for the process-wide conversion cache.
+"""
+
+import threading
+import unittest
+
+from colormath.color_conversions import convert_color
+from colormath.color_objects import LabColor, RGBColor, XYZColor
+from colormath.conversion_cache import ConversionCache, cached_conversions, \
+    enable_conversion_cache, disable_conversion_cache, get_conversion_cache
+
+
+class ConversionCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.color = RGBColor(0.2, 0.4, 0.6)
+
+    def tearDown(self):
+        disable_conversion_cache()
+
+    def test_hits_and_misses(self):
+        with cached_conversions() as cache:
+            first = convert_color(self.color, LabColor)
+            second = convert_color(self.color, LabColor)
+            convert_color(RGBColor(0.2, 0.4, 0.6, rgb_type='adobe_rgb'),
+                          LabColor)
+            convert_color(self.color, LabColor, target_illuminant='d65')
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 3))
+        self.assertEqual(stats['entries'], 3)
+        self.assertTrue(stats['bytes'] > 0)
+        self.assertEqual(stats['hit_rate'], 0.25)
+        self.assertFalse(first is second)
+        self.assertEqual(first.get_value_tuple(), second.get_value_tuple())
+        self.assertEqual(second.illuminant, first.illuminant)
+        self.assertEqual(
+            first.get_value_tuple(),
+            convert_color(self.color, LabColor).get_value_tuple())
+
+    def test_results_are_copies(self):
+        with cached_conversions():
+            convert_color(self.color, LabColor).lab_l = 0.0
+            self.assertNotEqual(convert_color(self.color, LabColor).lab_l, 0.0)
+
+    def test_eviction_by_entries(self):
+        with cached_conversions(max_entries=2) as cache:
+            for value in (0.1, 0.2, 0.3):
+                convert_color(LabColor(value * 100, 0.0, 0.0), XYZColor)
+            # The oldest color was evicted, the newest is still there.
+            convert_color(LabColor(30.0, 0.0, 0.0), XYZColor)
+            convert_color(LabColor(10.0, 0.0, 0.0), XYZColor)
+        stats = cache.get_stats()
+        self.assertEqual(stats['entries'], 2)
+        self.assertEqual(stats['evictions'], 2)
+        self.assertEqual(stats['hits'], 1)
+
+    def test_eviction_by_bytes(self):
+        cache = ConversionCache(max_entries=None, max_bytes=1)
+        cache.convert(self.color, LabColor)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get_stats()['bytes'], 0)
+
+    def test_clear(self):
+        cache = ConversionCache()
+        cache.convert(self.color, LabColor)
+        cache.clear()
+        stats = cache.get_stats()
+        self.assertEqual((stats['entries'], stats['misses']), (0, 0))
+
+    def test_switches(self):
+        self.assertTrue(get_conversion_cache() is None)
+        cache = enable_conversion_cache(max_entries=10)
+        self.assertTrue(get_conversion_cache() is cache)
+        with cached_conversions() as inner:
+            self.assertTrue(get_conversion_cache() is inner)
+        self.assertTrue(get_conversion_cache() is cache)
+        disable_conversion_cache()
+        self.assertTrue(get_conversion_cache() is None)
+
+    def test_unhashable_kwargs(self):
+        with cached_conversions() as cache:
+            convert_color(self.color, LabColor, unused=[1])
+        self.assertEqual(cache.get_stats()['entries'], 0)
+
+    def test_threads(self):
+        colors = [RGBColor(i / 50.0, 0.5, 0.5) for i in range(50)]
+        expected = [convert_color(c, LabColor).get_value_tuple()
+                    for c in colors]
+        results = []
+
+        def worker():
+            results.append([convert_color(c, LabColor).get_value_tuple()
+                            for c in colors])
+
+        with cached_conversions(max_entries=20) as cache:
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        for result in results:
+            self.assertEqual(result, expected)
+        stats = cache.get_stats()
+        self.assertEqual(stats['hits'] + stats['misses'], 200)
+        self.assertEqual(stats['entries'], 20)
@@ -0,0 +1,71 @@
+"""
+Tests for conversion tracing.
+"""
+
+import logging
+import unittest
+
+from colormath import color_conversions
+from colormath.chromatic_adaptation import apply_chromatic_adaptation
+from colormath.color_conversions import convert_color
+from colormath.color_objects import LabColor, RGBColor, XYZColor
+from colormath.conversion_trace import get_conversion_tracer, \
+    set_conversion_tracer, traced_conversions, logging_tracer
+
+
+class ConversionTraceTestCase(unittest.TestCase):
+    def tearDown(self):
+        set_conversion_tracer(None)
+
+    def test_steps(self):
+        color = XYZColor(0.1, 0.2, 0.3, illuminant='d50')
+        with traced_conversions() as events:
+            lab = convert_color(color, LabColor)
+        self.assertEqual(len(events), 1)
+        event = events[0]
+        self.assertIs(event.step, color_conversions.XYZ_to_Lab)
+        self.assertEqual(event.inputs, (color,))
+        self.assertEqual(event.outputs, (lab,))
+        self.assertEqual(event.details, {'args': (), 'kwargs': {}})
+
+    def test_nested_steps(self):
+        color = XYZColor(0.1, 0.2, 0.3, illuminant='d50')
+        with traced_conversions() as events:
+            rgb = convert_color(color, RGBColor, target_rgb='srgb')
+        steps = [event.step for event in events]
+        self.assertEqual(steps, [
+            apply_chromatic_adaptation, color_conversions.apply_RGB_matrix,
+            color_conversions.XYZ_to_RGB])
+        self.assertEqual(events[0].details['targ_illum'], 'd65')
+        self.assertEqual(events[-1].outputs, (rgb,))
+        self.assertEqual(events[-1].details['kwargs'], {'target_rgb': 'srgb'})
+
+    def test_restores_tracer(self):
+        self.assertIsNone(get_conversion_tracer())
+        calls = []
+        with traced_conversions(calls.append) as tracer:
+            self.assertEqual(tracer, calls.append)
+            with traced_conversions() as events:
+                convert_color(RGBColor(0.2, 0.4, 0.6), XYZColor)
+            self.assertEqual(get_conversion_tracer(), calls.append)
+        self.assertIsNone(get_conversion_tracer())
+        self.assertTrue(events)
+        self.assertEqual(calls, [])
+
+    def test_logging_tracer(self):
+        # Collected by hand, since Python 2 has no assertLogs().
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger = logging.getLogger('colormath.conversion_trace')
+        level = logger.level
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        try:
+            with traced_conversions(logging_tracer):
+                convert_color(XYZColor(0.1, 0.2, 0.3), LabColor)
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(level)
+        self.assertEqual(len(records), 1)
+        self.assertIn('XYZ_to_Lab', records[0].getMessage())
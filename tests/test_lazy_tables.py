@@ -0,0 +1,62 @@
+"""
+Tests for the lazily loaded spectral and density tables.
+"""
+
+import subprocess
+import sys
+import unittest
+
+import numpy
+
+from colormath import density_standards, spectral_constants
+from colormath import _density_tables, _spectral_tables
+
+
+class LazyTablesTestCase(unittest.TestCase):
+    @unittest.skipIf(sys.version_info < (3, 7),
+                     "Older versions load the tables on import.")
+    def test_not_loaded_on_import(self):
+        # A fresh interpreter, since this one may have loaded them already.
+        code = (
+            "import sys\n"
+            "import colormath.color_conversions, colormath.density\n"
+            "print(sorted(name for name in sys.modules\n"
+            "             if name.endswith('_tables') and\n"
+            "             name != 'colormath._lazy_tables'))\n")
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(output.strip(), b'[]')
+
+    def test_tables(self):
+        self.assertIs(spectral_constants.REF_ILLUM_TABLE,
+                      _spectral_tables.REF_ILLUM_TABLE)
+        numpy.testing.assert_array_equal(
+            spectral_constants.STDOBSERV_Y10, _spectral_tables.STDOBSERV_Y10)
+        self.assertIs(density_standards.ISO_VISUAL, _density_tables.ISO_VISUAL)
+        self.assertEqual(density_standards.VISUAL_DENSITY_THRESH, 0.08)
+        self.assertIn('ANSI_STATUS_T_RED', dir(density_standards))
+
+    def test_stacked_tables(self):
+        self.assertEqual(spectral_constants.STDOBSERV.shape, (2, 3, 50))
+        numpy.testing.assert_array_equal(
+            spectral_constants.STDOBSERV_TABLE['10'][2],
+            spectral_constants.STDOBSERV_Z10)
+        for name, illum in zip(spectral_constants.REF_ILLUM_NAMES,
+                               spectral_constants.REF_ILLUM):
+            numpy.testing.assert_array_equal(
+                spectral_constants.REF_ILLUM_TABLE[name], illum)
+        self.assertEqual(density_standards.DENSITY_FILTERS.shape, (15, 50))
+        for name, row in zip(density_standards.DENSITY_FILTER_NAMES,
+                             density_standards.DENSITY_FILTERS):
+            numpy.testing.assert_array_equal(
+                getattr(density_standards, name), row)
+
+    def test_read_only(self):
+        self.assertRaises(
+            ValueError, spectral_constants.STDOBSERV_X2.__setitem__, 0, 1.0)
+        self.assertRaises(
+            ValueError, density_standards.ISO_VISUAL.__setitem__, 0, 1.0)
+
+    def test_missing_attribute(self):
+        self.assertRaises(
+            AttributeError, getattr, spectral_constants, 'STDOBSERV_W2')
+        self.assertFalse(hasattr(density_standards, 'TYPE3'))
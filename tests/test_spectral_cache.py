@@ -0,0 +1,97 @@
+"""
+Tests for the persistent spectral conversion cache.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from colormath.color_conversions import convert_color
+from colormath.color_frozen import FrozenColor, FrozenLabColor, freeze
+from colormath.color_objects import SpectralColor, LabColor, XYZColor
+from colormath.spectral_cache import SpectralCache, get_cache_key
+
+
+class SpectralCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'spectral.db')
+        self.cache = SpectralCache(self.filename)
+        self.color = SpectralColor.from_array(
+            numpy.linspace(0.05, 0.6, 50), illuminant='d65')
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_hit_matches_conversion(self):
+        expected = convert_color(self.color, LabColor)
+        first = self.cache.convert(self.color, LabColor)
+        second = self.cache.convert(self.color, LabColor)
+        for color in (first, second):
+            self.assertEqual(type(color), LabColor)
+            self.assertEqual(color.get_value_tuple(), expected.get_value_tuple())
+            self.assertEqual(color.illuminant, 'd65')
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['entries'], 1)
+
+    def test_content_addressed(self):
+        key = get_cache_key(self.color, LabColor)
+        same = SpectralColor(*self.color.get_value_tuple(), illuminant='D65')
+        self.assertEqual(get_cache_key(same, LabColor), key)
+        self.assertNotEqual(get_cache_key(self.color, XYZColor), key)
+        self.assertNotEqual(
+            get_cache_key(self.color, LabColor, illuminant_override=numpy.ones(50)),
+            key)
+        same.spec_500nm += 1e-9
+        self.assertNotEqual(get_cache_key(same, LabColor), key)
+
+    def test_shared_between_instances(self):
+        self.cache.convert(self.color, LabColor)
+        self.cache.close()
+        with SpectralCache(self.filename) as other:
+            other.convert(self.color, LabColor)
+            self.assertEqual(other.get_stats()['hits'], 1)
+        self.cache = SpectralCache(self.filename)
+
+    def test_eviction(self):
+        self.cache.max_entries = 2
+        colors = [SpectralColor.from_array(numpy.full(50, value))
+                  for value in (0.1, 0.2, 0.3)]
+        for color in colors:
+            self.cache.convert(color, XYZColor)
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['entries'], stats['evictions']), (2, 1))
+        # The oldest entry is gone.
+        self.cache.convert(colors[0], XYZColor)
+        self.assertEqual(self.cache.get_stats()['misses'], 4)
+
+        # Room for one of the two similarly sized entries.
+        self.cache.max_bytes = int(stats['bytes'] * 0.6)
+        self.cache.convert(colors[1], XYZColor)
+        self.assertEqual(self.cache.get_stats()['entries'], 1)
+
+    def test_frozen(self):
+        frozen = freeze(self.color)
+        for _ in range(2):
+            self.assertIsInstance(
+                self.cache.convert(frozen, LabColor), FrozenColor)
+            self.assertIsInstance(
+                self.cache.convert(self.color, FrozenLabColor), FrozenLabColor)
+            self.assertNotIsInstance(
+                self.cache.convert(self.color, LabColor), FrozenColor)
+        # All six conversions share one entry.
+        self.assertEqual(self.cache.get_stats()['hits'], 5)
+
+    def test_clear(self):
+        self.cache.convert(self.color, LabColor)
+        self.cache.clear()
+        self.assertEqual(self.cache.get_stats()['entries'], 0)
+
+    def test_non_spectral(self):
+        self.assertRaises(ValueError, self.cache.convert,
+                          LabColor(50.0, 0.0, 0.0), XYZColor)